@@ -0,0 +1,123 @@
+import os
+import sys
+
+from CrossSectionHelper import MCSampleValuesHelper, UHH2DATASETS_PATH, parse_das_name, periods
+
+
+ARROW_PATH = os.path.join(UHH2DATASETS_PATH, "sample_values.arrow")
+PARQUET_PATH = os.path.join(UHH2DATASETS_PATH, "sample_values.parquet")
+
+# (column, key, info) of the resolved values. Values equal to the default of the key (i.e. not set) are stored as null.
+VALUE_COLUMNS = [
+    ("cross_section",          "CrossSection",   ""),
+    ("cross_section_source",   "CrossSection",   "Source"),
+    ("nevents",                "NEvents",        ""),
+    ("nevents_raw",            "NEventsRaw",     ""),
+    ("sum_of_weights",         "SumOfWeights",   ""),
+    ("branching_ratio",        "BranchingRatio", ""),
+    ("branching_ratio_source", "BranchingRatio", "Source"),
+    ("kfactor",                "kFactor",        ""),
+    ("kfactor_source",         "kFactor",        "Source"),
+    ("correction",             "Correction",     ""),
+    ("correction_source",      "Correction",     "Source"),
+    ("xml",                    "XMLname",        ""),
+    ("das_name",               "XMLname",        "Source"),
+]
+
+
+def build_table(helper=None, years=None):
+    """Return the resolved database as Arrow table with one row per sample and year the sample exists in (i.e. has an NEvents or XML value)
+
+    Besides the VALUE_COLUMNS (resolved like get_value, null where not set) the table has the columns sample, origin ("database" or the signal
+    dictionary), year, energy, das_alternatives (the expanded DAS names) and lumi (NEvents/(CrossSection*BranchingRatio), null if undefined).
+    The string columns sample, origin, year and energy are dictionary encoded.
+
+    Args:
+        helper (:obj:`MCSampleValuesHelper`): The helper whose database is exported. A default MCSampleValuesHelper if None.
+        years (:obj:`list` of :obj:`str`): The years to export. All registered years if None.
+    """
+    import pyarrow as pa
+    helper = MCSampleValuesHelper() if helper is None else helper
+    years = periods.years() if years is None else years
+    origins = helper.get_sample_origins()
+    columns = {name: [] for name in ["sample", "origin", "year", "energy"]+[column for column, _, _ in VALUE_COLUMNS]+["das_alternatives", "lumi"]}
+    for sample in helper.get_samples():
+        for year in years:
+            energy = periods.get(year)["energy"]
+            values = {}
+            for column, key, info in VALUE_COLUMNS:
+                value = helper.get_value(sample, energy, year, key, False, info)
+                values[column] = None if value == helper._key_field_map[key][1] or value == "" else value
+            if values["nevents"] is None and values["xml"] is None:
+                continue
+            for column in ["sample", "origin", "year", "energy"]:
+                columns[column].append({"sample": sample, "origin": origins[sample], "year": year, "energy": energy}[column])
+            for column, value in values.items():
+                columns[column].append(value)
+            columns["das_alternatives"].append(list(parse_das_name(values["das_name"]).alternatives) if values["das_name"] is not None else None)
+            defined = values["cross_section"] is not None and values["nevents"] is not None
+            columns["lumi"].append(abs(values["nevents"])/(values["cross_section"]*(values["branching_ratio"] or 1.0)) if defined else None)
+
+    types = {column: pa.float64() for column in columns}
+    types.update({column: pa.string() for column in ["sample", "origin", "year", "energy"]})
+    types.update({column: pa.string() for column, key, info in VALUE_COLUMNS if info == "Source" or key == "XMLname"})
+    types["das_alternatives"] = pa.list_(pa.string())
+    arrays = {column: pa.array(values, type=types[column]) for column, values in columns.items()}
+    for column in ["sample", "origin", "year", "energy"]:
+        arrays[column] = arrays[column].dictionary_encode()
+    return pa.table(arrays)
+
+
+def export_arrow(arrow_path=ARROW_PATH, parquet_path=PARQUET_PATH, helper=None, years=None):
+    """Write the resolved database (see build_table) as uncompressed Arrow IPC file, which can be memory-mapped, and as Parquet file
+
+    Either path can be None to skip that format. Returns the number of rows.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    table = build_table(helper, years)
+    if arrow_path is not None:
+        with pa.OSFile(arrow_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    if parquet_path is not None:
+        pq.write_table(table, parquet_path)
+    return table.num_rows
+
+
+def load_arrow(arrow_path=ARROW_PATH):
+    """Return the table of an Arrow IPC export. The file is memory-mapped, so the buffers are not copied and only read when accessed."""
+    import pyarrow as pa
+    return pa.ipc.open_file(pa.memory_map(arrow_path, "r")).read_all()
+
+
+def load_parquet(parquet_path=PARQUET_PATH, columns=None):
+    """Return the table of a Parquet export, optionally only the given columns"""
+    import pyarrow.parquet as pq
+    return pq.read_table(parquet_path, columns=columns, memory_map=True)
+
+
+if(__name__ == "__main__"):
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Export the resolved CrossSectionHelper database to Arrow IPC and Parquet.")
+
+    parser.add_argument("--arrow", default=ARROW_PATH, help="the Arrow IPC file.")
+    parser.add_argument("--parquet", default=PARQUET_PATH, help="the Parquet file.")
+    parser.add_argument("--signal", nargs="+", default=[], help="signal dictionaries from xsec_signal_dicts to export as well.")
+    parser.add_argument("--years", nargs="+", default=None, help="the years to export (all registered years by default).")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    try:
+        helper = MCSampleValuesHelper()
+        for signal in args.signal:
+            helper.add_signal(signal)
+        print("Exported " + str(export_arrow(args.arrow, args.parquet, helper, args.years)) + " rows to " + args.arrow + " and " + args.parquet)
+        start = time.perf_counter()
+        table = load_arrow(args.arrow)
+        print("Loaded " + str(table.num_rows) + " rows in %.1f ms" % ((time.perf_counter()-start)*1e3))
+    except (ImportError, KeyError, ValueError) as error:
+        if args.throw: raise
+        print(error, file=sys.stderr)
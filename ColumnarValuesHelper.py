@@ -0,0 +1,359 @@
+import json
+import os
+
+from CrossSectionHelper import MCSampleValuesHelper, periods
+
+
+class ColumnarMCSampleValuesHelper(MCSampleValuesHelper):
+    """MCSampleValuesHelper backed by dense NumPy arrays
+
+    Each numeric key (CrossSection, NEvents, BranchingRatio, kFactor, Correction, NEventsRaw, SumOfWeights) is stored as a 2D float64 array indexed by [sample_id, period_id],
+    together with a boolean presence mask telling whether the value was set in the database (rather than being the default).
+    Sample ids are assigned in sorted order of the sample names (or the order given by sample_names), so they are stable for a given database
+    and can be used to tag events with a compact integer instead of a string. Periods are the years of the prototype, followed by the combined
+    periods (e.g. "UL16") consisting of them. The columns of the combined periods are computed from the member columns like get_value does,
+    their lumis are the sums of the member lumis.
+    Values are resolved like get_value does, i.e. a value stored for the energy takes precedence over the one of the year.
+
+    The usual get_* methods are served from the arrays; all other requests are forwarded to MCSampleValuesHelper.
+
+    Args:
+        energy (`str`): The simulated energy the arrays are built for
+        sample_names (:obj:`list` of :obj:`str` or `str`): Fix the order (i.e. the ids) of the samples. New samples are appended. Either a list
+            or a JSON file written by save_sample_ids, whose periods have to match the ones of this helper.
+        extra_dicts, import_signal, event_counts: See MCSampleValuesHelper
+
+    Example:
+        from ColumnarValuesHelper import ColumnarMCSampleValuesHelper
+        helper = ColumnarMCSampleValuesHelper()
+        ids = helper.get_sample_ids(["TTToSemiLeptonic","TTTo2L2Nu"])
+        helper.get_array("CrossSection")[ids, helper.get_period_id("UL18")]
+        helper.get_event_weights(event_sample_ids, year="UL18", target_lumi=59830.)
+        helper.get_lumi_variations(year="UL18", kFactor=True)["CrossSectionUp"]
+        helper.save_sample_ids("sample_ids.json")  # later: ColumnarMCSampleValuesHelper(sample_names="sample_ids.json")
+    """
+
+    numeric_keys = ["CrossSection", "NEvents", "BranchingRatio", "kFactor", "Correction", "NEventsRaw", "SumOfWeights"]
+
+    # Bits of the flags returned by get_normalization
+    FLAG_NEGATIVE_WEIGHTS = 1
+    FLAG_NEGATIVE_LUMI = 2
+    FLAG_NEVT_MISMATCH = 4
+    FLAG_FALLBACK = 8
+
+    def __init__(self, extra_dicts=None, import_signal=None, energy="13TeV", sample_names=None, event_counts=False):
+        super().__init__(extra_dicts, import_signal, event_counts)
+        self.energy = energy
+        self.periods = periods.years(default=True)
+        self.combined_periods = [period for period in periods.combined() if all(member in self.periods for member in periods.members(period))]
+        self.periods += self.combined_periods
+        self.period_ids = {period: i for i, period in enumerate(self.periods)}
+        if isinstance(sample_names, str):
+            table = self.load_sample_ids(sample_names)
+            if table["periods"] != self.periods:
+                raise ValueError("ERROR ColumnarMCSampleValuesHelper::The sample ids in \"" + sample_names + "\" were saved for the periods " + str(table["periods"]) + ", not " + str(self.periods))
+            sample_names = table["sample_names"]
+        self.sample_names = [] if sample_names is None else list(sample_names)
+        self.sample_ids = {name: i for i, name in enumerate(self.sample_names)}
+        if len(self.sample_ids) != len(self.sample_names):
+            raise ValueError("ERROR ColumnarMCSampleValuesHelper::Duplicate sample names in " + str(sorted({name for name in self.sample_names if self.sample_names.count(name) > 1})))
+        for name in self.get_samples():
+            self.intern(name)
+        self._init_kwargs.update(energy=energy, sample_names=list(self.sample_names))
+        self._build_arrays()
+
+    def invalidate_caches(self):
+        """Drop the cached results and rebuild the arrays (if already built) after the database was changed"""
+        super().invalidate_caches()
+        if hasattr(self, "_arrays"):
+            for name in self.get_samples():
+                self.intern(name)
+            self._init_kwargs["sample_names"] = list(self.sample_names)
+            self._build_arrays()
+
+    def intern(self, name):
+        """Return the id of a sample name, assigning the next free id to names not seen before"""
+        if not name in self.sample_ids:
+            self.sample_ids[name] = len(self.sample_names)
+            self.sample_names.append(name)
+        return self.sample_ids[name]
+
+    def save_sample_ids(self, filename):
+        """Write the sample ids (the names in id order) and the periods they are valid for as JSON, to be loaded with sample_names=filename"""
+        with open(filename+".tmp", "w") as outfile:
+            json.dump({"energy": self.energy, "periods": self.periods, "sample_names": self.sample_names}, outfile, indent=1)
+        os.replace(filename+".tmp", filename)
+
+    @staticmethod
+    def load_sample_ids(filename):
+        """Return the table {"energy": ..., "periods": [...], "sample_names": [...]} written by save_sample_ids"""
+        with open(filename) as infile:
+            table = json.load(infile)
+        if not isinstance(table, dict) or not isinstance(table.get("periods"), list) or not isinstance(table.get("sample_names"), list) \
+                or not all(isinstance(name, str) for name in table["sample_names"]):
+            raise ValueError("ERROR ColumnarMCSampleValuesHelper::\"" + str(filename) + "\" is not a sample id table written by save_sample_ids")
+        return table
+
+    def _build_arrays(self):
+        import numpy as np
+        shape = (len(self.sample_names), len(self.periods))
+        self._arrays = {}
+        self._masks = {}
+        self._conflicts = {}
+        known = set(self.get_samples())
+        for key in self.numeric_keys:
+            # Missing values without numeric default (i.e. None) are stored as NaN
+            default = self._key_field_map[key][1]
+            values = np.full(shape, np.nan if default is None else default, dtype=np.float64)
+            for sample_id, name in enumerate(self.sample_names):
+                if not name in known:
+                    continue
+                for period_id, period in enumerate(self.periods[:len(self.periods)-len(self.combined_periods)]):
+                    value = MCSampleValuesHelper.get_value(self, name, self.energy, period, key)
+                    if value is not None:
+                        values[sample_id, period_id] = value
+            self._conflicts[key] = self._fill_combined(key, values)
+            self._arrays[key] = values
+            self._masks[key] = ~np.isnan(values) if default is None else values != default
+        self._variation_arrays = {}
+        self._weight_tables = {}
+
+    def _fill_combined(self, key, values):
+        """Fill the columns of the combined periods from their members: sums for event counts (missing if missing for any member),
+        the common value for all other keys (missing if the members differ)
+
+        Returns:
+            The [sample_id, period_id] boolean array of the combined values missing because the members differ
+        """
+        import numpy as np
+        default = self._key_field_map[key][1]
+        missing = np.nan if default is None else default
+        conflicts = np.zeros(values.shape, dtype=bool)
+        for period in self.combined_periods:
+            members = values[:, [self.period_ids[member] for member in periods.members(period)]]
+            if key in self._additive_keys:
+                absent = np.isnan(members) if default is None else members == default
+                values[:, self.period_ids[period]] = np.where(absent.any(axis=1), missing, members.sum(axis=1))
+            else:
+                equal = ((members == members[:, :1]) | (np.isnan(members) & np.isnan(members[:, :1]))).all(axis=1)
+                values[:, self.period_ids[period]] = np.where(equal, members[:, 0], missing)
+                conflicts[:, self.period_ids[period]] = ~equal
+        return conflicts
+
+    def _sum_combined_lumis(self, lumi):
+        """Replace the lumis of the combined periods in a [sample, period] array by the sums of the member lumis"""
+        for period in self.combined_periods:
+            lumi[:, self.period_ids[period]] = lumi[:, [self.period_ids[member] for member in periods.members(period)]].sum(axis=1)
+        return lumi
+
+    def get_sample_id(self, name):
+        if not name in self.sample_ids:
+            raise KeyError("ERROR ColumnarMCSampleValuesHelper::Unknown process \"" + str(name) + "\"")
+        return self.sample_ids[name]
+
+    def get_sample_ids(self, names):
+        """Return the ids of a list of sample names as integer array"""
+        import numpy as np
+        return np.array([self.get_sample_id(name) for name in names], dtype=np.int64)
+
+    def get_period_id(self, year):
+        if not year in self.period_ids:
+            raise KeyError("ERROR ColumnarMCSampleValuesHelper::Unknown period \"" + str(year) + "\", use one of " + str(self.periods))
+        return self.period_ids[year]
+
+    def get_array(self, key):
+        """Return the [sample_id, period_id] array of a numeric key"""
+        return self._arrays[key]
+
+    def get_mask(self, key):
+        """Return the [sample_id, period_id] boolean array telling where a value is stored for the key"""
+        return self._masks[key]
+
+    def get_variation_array(self, key, direction):
+        """Return the [sample_id, period_id] array of the values varied in direction ("Up" or "Down"), equal to the nominal values where no variation is stored
+
+        The arrays are built on first use and cached next to the nominal ones.
+        """
+        if not direction in ["Up", "Down"]:
+            raise ValueError("ERROR ColumnarMCSampleValuesHelper::Unknown variation \"" + str(direction) + "\", use \"Up\" or \"Down\"")
+        if not (key, direction) in self._variation_arrays:
+            default = self._key_field_map[key][1]
+            values = self._arrays[key].copy()
+            known = set(self.get_samples())
+            for sample_id, name in enumerate(self.sample_names):
+                if not name in known:
+                    continue
+                for period_id, period in enumerate(self.periods[:len(self.periods)-len(self.combined_periods)]):
+                    value = MCSampleValuesHelper.get_value(self, name, self.energy, period, key, info=direction)
+                    if value != default:
+                        values[sample_id, period_id] = value
+            self._fill_combined(key, values)
+            self._variation_arrays[(key, direction)] = values
+        return self._variation_arrays[(key, direction)]
+
+    def get_lumi_variations(self, names=None, year=None, kFactor=False, Corrections=False, sources=("CrossSection", "kFactor")):
+        """Return the nominal lumis and the lumis with each source varied up and down, for many samples in one vectorised pass
+
+        Args:
+            names (:obj:`list` of :obj:`str`): The samples (all samples, in the order of their ids, if None)
+            year (`str`): Only return this period (all periods as second axis if None)
+            kFactor (`bool`): Apply the kFactors
+            Corrections (`bool`): Apply the corrections
+            sources (:obj:`tuple` of :obj:`str`): The keys whose variations are propagated. A kFactor (Correction) variation requires kFactor (Corrections).
+
+        Returns:
+            :obj:`dict` with the arrays "nominal", "<source>Up" and "<source>Down" (NaN where the lumi is undefined)
+        """
+        import numpy as np
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        factors = ["CrossSection", "BranchingRatio"]+(["kFactor"] if kFactor else [])+(["Correction"] if Corrections else [])
+        rows = slice(None) if names is None else self.get_sample_ids(names)
+        columns = slice(None) if year is None else self.get_period_id(year)
+        valid = (self._masks["CrossSection"] & self._masks["NEvents"])[rows]
+        nevt = np.abs(self._arrays["NEvents"][rows])
+        nominal = {key: self._arrays[key][rows] for key in factors}
+
+        def lumi(values):
+            xsec = np.prod([values[key] for key in factors], axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return self._sum_combined_lumis(np.where(valid, nevt/xsec, np.nan))[:, columns]
+
+        results = {"nominal": lumi(nominal)}
+        for source in sources:
+            if not source in factors:
+                raise ValueError("ERROR ColumnarMCSampleValuesHelper::Cannot vary \"" + str(source) + "\", it is not one of the applied factors " + str(factors))
+            for direction in ["Up", "Down"]:
+                results[source+direction] = lumi(dict(nominal, **{source: self.get_variation_array(source, direction)[rows]}))
+        return results
+
+    def get_normalization(self, names=None, year=None, method="auto", kFactor=False, Corrections=False, rtol=1e-3):
+        """Return the lumis computed from the chosen event count, and flags telling which samples need attention, for many samples at once
+
+        The methods are
+            "nevents": abs(NEvents) as used by get_lumi
+            "raw": the raw number of entries (NEventsRaw), for samples whose events are not weighted
+            "weights": the signed sum of generator weights (SumOfWeights), for samples whose events are weighted by their generator weight
+            "auto": SumOfWeights where known, otherwise NEvents (flagged with FLAG_FALLBACK)
+        The flags are bitwise combinations of
+            FLAG_NEGATIVE_WEIGHTS: the sum of weights is below the raw number of entries, as caused by negative weights (of magnitude one)
+            FLAG_NEGATIVE_LUMI: the lumi is negative (e.g. a negative cross section normalised with abs(NEvents))
+            FLAG_NEVT_MISMATCH: NEvents of the database differs from the used count by more than rtol (never set for "nevents")
+            FLAG_FALLBACK: the count of the requested method is missing and NEvents was used instead
+        The event counts are only known after loading them (event_counts=True or load_event_counts).
+
+        Args:
+            names (:obj:`list` of :obj:`str`): The samples (all samples, in the order of their ids, if None)
+            year (`str`): Only return this period (all periods as second axis if None)
+            method (`str`): The event count to normalise to, see above
+            kFactor (`bool`): Apply the kFactors
+            Corrections (`bool`): Apply the corrections
+            rtol (`float`): Relative tolerance of the comparison to NEvents
+
+        Returns:
+            :obj:`tuple` of the lumi array (NaN where undefined) and the integer flag array
+        """
+        import numpy as np
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        if not method in ["auto", "nevents", "raw", "weights"]:
+            raise ValueError("ERROR ColumnarMCSampleValuesHelper::Unknown normalisation method \"" + str(method) + "\", use \"auto\", \"nevents\", \"raw\" or \"weights\"")
+        rows = slice(None) if names is None else self.get_sample_ids(names)
+        columns = slice(None) if year is None else self.get_period_id(year)
+        arrays = {key: self._arrays[key][rows] for key in self.numeric_keys}
+        masks = {key: self._masks[key][rows] for key in self.numeric_keys}
+        nevt = np.abs(arrays["NEvents"])
+        if method == "nevents":
+            count, known, fallback = nevt, masks["NEvents"], np.zeros_like(masks["NEvents"])
+        else:
+            key = "NEventsRaw" if method == "raw" else "SumOfWeights"
+            fallback = ~masks[key] & masks["NEvents"] if method == "auto" else np.zeros_like(masks[key])
+            count = np.where(fallback, nevt, arrays[key])
+            known = masks[key] | fallback
+
+        xsec = arrays["CrossSection"]*arrays["BranchingRatio"]
+        if kFactor: xsec = xsec*arrays["kFactor"]
+        if Corrections: xsec = xsec*arrays["Correction"]
+        valid = masks["CrossSection"] & known
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lumi = self._sum_combined_lumis(np.where(valid, count/xsec, np.nan))
+            mismatch = masks["NEvents"] & known & ~fallback & ~np.isclose(arrays["NEvents"], count, rtol=rtol, atol=0.0)
+        if method == "nevents":
+            # The count is the stored NEvents itself (as absolute value), so there is nothing to compare
+            mismatch[...] = False
+
+        flags = np.zeros(np.shape(lumi), dtype=np.int64)
+        flags[masks["SumOfWeights"] & masks["NEventsRaw"] & (arrays["SumOfWeights"] < arrays["NEventsRaw"]*(1.0-rtol))] |= self.FLAG_NEGATIVE_WEIGHTS
+        flags[valid & (lumi < 0)] |= self.FLAG_NEGATIVE_LUMI
+        flags[mismatch] |= self.FLAG_NEVT_MISMATCH
+        flags[fallback] |= self.FLAG_FALLBACK
+        return lumi[:, columns], flags[:, columns]
+
+    def get_lumi_array(self, kFactor=False, Corrections=False):
+        """Return the [sample_id, period_id] array of lumis (NaN where the cross section or number of events are missing)"""
+        import numpy as np
+        xsec = self._arrays["CrossSection"]*self._arrays["BranchingRatio"]
+        if kFactor: xsec = xsec*self._arrays["kFactor"]
+        if Corrections: xsec = xsec*self._arrays["Correction"]
+        valid = self._masks["CrossSection"] & self._masks["NEvents"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._sum_combined_lumis(np.where(valid, np.abs(self._arrays["NEvents"])/xsec, np.nan))
+
+    def get_weight_table(self, kFactor=False, Corrections=False):
+        """Return the cached [sample_id, period_id] array of inverse lumis, i.e. the event weights for a target lumi of 1"""
+        import numpy as np
+        if not (kFactor, Corrections) in self._weight_tables:
+            with np.errstate(divide="ignore"):
+                self._weight_tables[(kFactor, Corrections)] = 1.0/self.get_lumi_array(kFactor, Corrections)
+        return self._weight_tables[(kFactor, Corrections)]
+
+    def get_event_weights(self, sample_ids, period_ids=None, year=None, target_lumi=1.0, kFactor=False, Corrections=False, fill_value=None):
+        """Return the normalisation weight target_lumi/lumi of each event as a single vectorised gather
+
+        Args:
+            sample_ids (array-like of `int`): The sample id of each event
+            period_ids (array-like of `int`): The period id of each event. Either this or year has to be given.
+            year (`str`): The period of all events
+            target_lumi (`float`): The luminosity to normalise to, in the inverse unit of the cross sections
+            kFactor (`bool`): Apply the kFactors
+            Corrections (`bool`): Apply the corrections
+            fill_value (`float`): Weight of events from samples without lumi (e.g. data). NaN if None.
+        """
+        import numpy as np
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        table = self.get_weight_table(kFactor, Corrections)
+        sample_ids = self._check_ids(sample_ids, table.shape[0], "sample")
+        if period_ids is not None:
+            weights = table[sample_ids, self._check_ids(period_ids, table.shape[1], "period")]
+        elif year is not None:
+            weights = table[sample_ids, self.get_period_id(year)]
+        else:
+            raise ValueError("ERROR ColumnarMCSampleValuesHelper::Either period_ids or year has to be given")
+        weights = weights*target_lumi
+        if fill_value is not None:
+            weights[np.isnan(weights)] = fill_value
+        return weights
+
+    @staticmethod
+    def _check_ids(ids, size, kind):
+        """Return ids as integer array, raising a ValueError for ids outside [0, size) (which NumPy would wrap around or fail on)"""
+        import numpy as np
+        ids = np.asarray(ids)
+        if ids.size == 0:
+            return ids.astype(np.intp)
+        if (not np.issubdtype(ids.dtype, np.integer) or ids.min() < 0 or ids.max() >= size):
+            raise ValueError("ERROR ColumnarMCSampleValuesHelper::Invalid " + kind + " ids, expected integers in [0, " + str(size) + ")")
+        return ids
+
+    def get_value(self, name, energy, year, key, strict=False, info=""):
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        if info == "" and energy == self.energy and key in self._arrays and name in self.sample_ids and year in self.period_ids:
+            sample_id, period_id = self.sample_ids[name], self.period_ids[year]
+            if self._masks[key][sample_id, period_id]:
+                return self._arrays[key][sample_id, period_id].item()
+            # Values of combined periods differing between the members raise in the base helper
+            if not strict and not self._conflicts[key][sample_id, period_id]:
+                return self._key_field_map[key][1]
+        return super().get_value(name, energy, year, key, strict, info)
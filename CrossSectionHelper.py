@@ -1,68 +1,99 @@
+import atexit
+import fnmatch
+import functools
+import hashlib
 import importlib.util
-from collections import namedtuple,Mapping
+from collections import ChainMap, namedtuple
+import json
+import numbers
 import os
+import pickle
 import sys
+import time
+
+UHH2DATASETS_PATH = os.path.dirname(os.path.abspath(__file__))
+if not UHH2DATASETS_PATH in sys.path:
+    sys.path.append(UHH2DATASETS_PATH)
+from MCSampleValuesPrototype import namedtuple_with_defaults, record_items, periods, MCSampleValuesHelperPrototype, SignalGrid
 
 
 CMSSW_BASE = os.environ.get("CMSSW_BASE")
 
 
-def namedtuple_with_defaults(typename, field_names, default_values=()):
-    T = namedtuple(typename, field_names)
-    T.__new__.__defaults__ = (None,) * len(T._fields)
-    if isinstance(default_values, Mapping):
-        prototype = T(**default_values)
-    else:
-        prototype = T(*default_values)
-    T.__new__.__defaults__ = tuple(prototype)
-    return T
+DASName = namedtuple("DASName", ["name", "primary_dataset", "campaign", "processing", "tier", "alternatives"])
 
 
-class MCSampleValuesHelperPrototype():
-    """
-    Prototype class for MCSampleValuesHelper
+def expand_braces(pattern):
+    """Expand shell-like brace alternatives, e.g. "Run2016B-{ver1,ver2}_HIPM" -> ["Run2016B-ver1_HIPM", "Run2016B-ver2_HIPM"]
+
+    Nested and multiple brace groups are supported. A string without braces is returned as a single element list.
     """
+    start = pattern.find("{")
+    if start < 0:
+        return [pattern]
+    depth = 0
+    options = []
+    last = start+1
+    for pos in range(start, len(pattern)):
+        char = pattern[pos]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                options.append(pattern[last:pos])
+                break
+        elif char == "," and depth == 1:
+            options.append(pattern[last:pos])
+            last = pos+1
+    else:
+        raise ValueError("ERROR expand_braces::Unbalanced braces in \"" + str(pattern) + "\"")
+    prefix, suffix = pattern[:start], pattern[pos+1:]
+    expanded = []
+    for option in options:
+        expanded += expand_braces(prefix+option+suffix)
+    return expanded
 
-    __years = ["UL16preVFP","UL16postVFP","UL17","UL18"]
-    __energies = ["13TeV"]
-    __xs_field_names = []
-    __nevt_field_names = []
-    __br_field_names = []
-    __kfactor_field_names = []
-    __corr_field_names = []
-    __xml_field_names = []
-    _key_field_map = {
-        "CrossSection"   : ("XSec",-1.0),
-        "NEvents"        : ("NEVT",-1.0),
-        "BranchingRatio" : ("BRat",1.0),
-        "kFactor"        : ("kFac",1.0),
-        "Correction"     : ("Corr",1.0),
-        "XMLname"        : ("Xml",""),
-    }
-    for __val in __years+__energies:
-        for mode in ["", "Source"]:
-            __xs_field_names.append("XSec"+mode+"_"+__val)
-            __nevt_field_names.append("NEVT"+mode+"_"+__val)
-            __br_field_names.append("BRat"+mode+"_"+__val)
-            __kfactor_field_names.append("kFac"+mode+"_"+__val)
-            __corr_field_names.append("Corr"+mode+"_"+__val)
-            __xml_field_names.append("Xml"+mode+"_"+__val)
-    XSValues      = namedtuple_with_defaults("XSValues",      __xs_field_names,       [_key_field_map["CrossSection"][1],""]*len(__years+__energies))
-    NEventsValues = namedtuple_with_defaults("NEventsValues", __nevt_field_names,     [_key_field_map["NEvents"][1],""]*len(__years+__energies))
-    BRValues      = namedtuple_with_defaults("BRValues",      __br_field_names,       [_key_field_map["BranchingRatio"][1],""]*len(__years+__energies))
-    kFactorValues = namedtuple_with_defaults("kFactorValues", __kfactor_field_names,  [_key_field_map["kFactor"][1],""]*len(__years+__energies))
-    CorrValues    = namedtuple_with_defaults("CorrValues",    __corr_field_names,     [_key_field_map["Correction"][1],""]*len(__years+__energies))
-    XMLValues     = namedtuple_with_defaults("XMLValues",     __xml_field_names,      [_key_field_map["XMLname"][1],""]*len(__years+__energies))
+
+@functools.lru_cache(maxsize=None)
+def parse_das_name(das_name):
+    """Split a DAS dataset name into its components
+
+    The name is expected as "/<primary dataset>/<campaign>-<processing string>/<tier>", possibly using brace syntax for alternatives.
+    Fields which differ between the alternatives are returned in brace syntax, all expanded names are listed in `alternatives`.
+    Results are cached, so repeated calls for the same name are cheap.
+
+    Args:
+        das_name (`str`): The DAS dataset name as stored in the XmlSource fields
+    """
+    alternatives = []
+    components = []
+    for alternative in expand_braces(das_name.strip()):
+        parts = [p for p in alternative.split("/") if p != ""]
+        if len(parts) != 3:
+            raise ValueError("ERROR parse_das_name::Invalid DAS dataset name \"" + str(das_name) + "\"")
+        primary_dataset, processed, tier = parts
+        campaign, _, processing = processed.partition("-")
+        alternatives.append("/"+"/".join(parts))
+        components.append((primary_dataset, campaign, processing, tier))
+
+    def merge(values):
+        unique = list(dict.fromkeys(values))
+        return unique[0] if len(unique) == 1 else "{"+",".join(unique)+"}"
+
+    primary_dataset, campaign, processing, tier = (merge(values) for values in zip(*components))
+    name = alternatives[0] if len(alternatives) == 1 else "/"+das_name.strip().lstrip("/")
+    return DASName(name, primary_dataset, campaign, processing, tier, tuple(alternatives))
 
 
 class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
     """Stores the cross sections and k-factors associated to a given physics process.
 
-    The lists of years and energies used to identify a given cross section are also stored within this class.
+    The years and energies used to identify a given cross section are registered in periods (see MCSampleValuesPrototype.PeriodRegistry).
     Given a process name, and year the appropriate cross section will be returned.
 
     Args:
-        extra_dicts (:obj:`dict` of :obj:`dict` of :obj:`namedtuple_with_defaults`): Extra cross sections and k-factors to add to the __values_dict.
+        extra_dicts (:obj:`dict` of :obj:`dict` of :obj:`SparseValues` or :obj:`namedtuple_with_defaults`): Extra cross sections and k-factors to add to the __values_dict.
 
     Example:
         from CrossSectionHelper import *
@@ -72,8 +103,10 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         helper.get_nevt("TTbarTo2L2Nu","13TeV","2018")
         helper.get_br("TTbarTo2L2Nu","13TeV","2018")
         helper.get_xml("TTbar","13TeV","2016")
+        helper.get_samples_from_das("/SingleMuon/Run2018A-UL2018_MiniAODv2_GT36-v1/MINIAOD")
     """
 
+    _store_version = 0
     __values_dict = {
 
         "SingleMuon_RunA": {
@@ -88,6 +121,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "SingleMuon_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=2789243+158145722,
+                NEVTParts_UL16preVFP=(2789243, 158145722),
                 NEVT_UL17=136300266,
                 NEVT_UL18=119918017,
             ),
@@ -169,6 +203,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "SingleElectron_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=1422819+246433497,
+                NEVTParts_UL16preVFP=(1422819, 246433497),
                 NEVT_UL17=60537490,
             ),
             "XMLname" : MCSampleValuesHelperPrototype.XMLValues(
@@ -244,6 +279,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "SinglePhoton_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=13119462+56878553,
+                NEVTParts_UL16preVFP=(13119462, 56878553),
                 NEVT_UL17=15950935,
             ),
             "XMLname" : MCSampleValuesHelperPrototype.XMLValues(
@@ -364,6 +400,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "MuonEG_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=225271+32727796,
+                NEVTParts_UL16preVFP=(225271, 32727796),
                 NEVT_UL17=4453465,
                 NEVT_UL18=16204062,
             ),
@@ -453,6 +490,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "DoubleMuon_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=4199947+82535526,
+                NEVTParts_UL16preVFP=(4199947, 82535526),
                 NEVT_UL17=14501767,
                 NEVT_UL18=35057758,
             ),
@@ -534,6 +572,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "DoubleEG_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=5686987+143073268,
+                NEVTParts_UL16preVFP=(5686987, 143073268),
                 NEVT_UL17=58088760
             ),
             "XMLname" : MCSampleValuesHelperPrototype.XMLValues(
@@ -618,6 +657,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "JetHT_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=9726665+133752091,
+                NEVTParts_UL16preVFP=(9726665, 133752091),
                 NEVT_UL17=63043590,
                 NEVT_UL18=78253065,
             ),
@@ -708,6 +748,7 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         "MET_RunB": {
             "NEvents" : MCSampleValuesHelperPrototype.NEventsValues(
                 NEVT_UL16preVFP=583427+35987712,
+                NEVTParts_UL16preVFP=(583427, 35987712),
                 NEVT_UL17=51623474,
                 NEVT_UL18=29713483,
             ),
@@ -7348,24 +7389,135 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
         },
     }
 
-    def __init__(self, extra_dicts=None, import_signal=None):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses defined while the instrumentation is enabled get their overrides instrumented as well
+        if instrumentation.enabled and issubclass(cls, instrumentation._cls):
+            instrumentation.instrument_class(cls)
+
+    def __init__(self, extra_dicts=None, import_signal=None, event_counts=False):
+
+        self._init_kwargs = {"extra_dicts": extra_dicts, "import_signal": import_signal, "event_counts": event_counts}
+        self._lumi_cache = {}
+        self._lumi_cache_stats = {"hits": 0, "misses": 0}
+        self._imported_signals = []
+        # Changes made after construction (update_values, add_signal, load_event_counts), replayed when unpickling
+        self._replay = None
+        self.invalidate_caches()
 
         if extra_dicts is not None:
-            if type(extra_dicts) == dict:
-                self.__values_dict.update(extra_dicts)
-            elif type(extra_dicts) == list:
-                for ed in extra_dicts:
-                    self.__values_dict.update(ed)
+            self.update_values(extra_dicts)
 
         if import_signal is not None:
-            imported_dict = self._import_signal(import_signal)
-            self.__values_dict = {**self.__values_dict, **imported_dict}
+            self.add_signal(import_signal)
+
+        if event_counts:
+            self.load_event_counts()
+        self._replay = []
+
+    def _record(self, method, *args):
+        if getattr(self, "_replay", None) is not None:
+            self._replay.append((method, args))
+
+    def update_values(self, extra_dicts):
+        """Add or replace entries of the database (shared by all helpers) and invalidate the caches of all helpers
+
+        Args:
+            extra_dicts (:obj:`dict` or :obj:`list` of :obj:`dict`): Extra cross sections and k-factors to add to the __values_dict.
+        """
+        self._record("update_values", extra_dicts)
+        self._update_values(extra_dicts)
+
+    def _update_values(self, extra_dicts):
+        if type(extra_dicts) == dict:
+            MCSampleValuesHelper.__values_dict.update(extra_dicts)
+        elif type(extra_dicts) == list:
+            for ed in extra_dicts:
+                MCSampleValuesHelper.__values_dict.update(ed)
+        MCSampleValuesHelper._store_version += 1
+        self.invalidate_caches()
+
+    def add_signal(self, signal_name):
+        """Import a signal dictionary from xsec_signal_dicts (taking precedence over the database) and invalidate the caches of this helper"""
+        self._chain_signal(signal_name, self._import_signal(signal_name))
+
+    async def aadd_signal(self, signal_name, executor=None):
+        """Like add_signal, but importing the signal dictionary in an executor (the default thread pool if None) without blocking the event loop"""
+        import asyncio
+        imported_dict = await asyncio.get_running_loop().run_in_executor(executor, self._import_signal, signal_name)
+        self._chain_signal(signal_name, imported_dict)
+
+    def _chain_signal(self, signal_name, imported_dict):
+        self._record("add_signal", signal_name)
+        self._imported_signals.append(signal_name)
+        # ChainMap keeps lazily materialized signal dictionaries (e.g. SignalGrid) lazy
+        self.__values_dict = ChainMap(imported_dict, self.__values_dict)
+        self.invalidate_caches()
+
+    def load_event_counts(self, base_path=UHH2DATASETS_PATH):
+        """Store the raw number of entries (NEventsRaw) and the signed sum of weights (SumOfWeights) of the database samples
+
+        The counts are read from the NumberEntries trailers of the XMLs of each sample and year. Missing XMLs or trailers are skipped,
+        values already present in the database are kept.
+        """
+        from DatasetXMLHelper import read_number_entries
+        self._record("load_event_counts", base_path)
+        xml_prefix = self._key_field_map["XMLname"][0]+"_"
+        keys = {"fast": "NEventsRaw", "weights": "SumOfWeights"}
+        updates = {}
+        for name, values in MCSampleValuesHelper.__values_dict.items():
+            if not "XMLname" in values:
+                continue
+            counts = {key: {} for key in keys.values()}
+            for field, xmlpath in record_items(values["XMLname"]):
+                if not field.startswith(xml_prefix) or xmlpath == "" or not os.path.isfile(os.path.join(base_path, xmlpath)):
+                    continue
+                period = field[len(xml_prefix):]
+                for method, count in read_number_entries(xmlpath, base_path).items():
+                    counts[keys[method]][self._key_field_map[keys[method]][0]+"_"+period] = count
+            entry = dict(values)
+            for key, fields in counts.items():
+                if len(fields) == 0:
+                    continue
+                if key in values:
+                    fields.update(record_items(values[key]))
+                entry[key] = self._key_values_map[key](**fields)
+            if len(entry) > len(values) or any(entry[key] is not values[key] for key in values):
+                updates[name] = entry
+        self._update_values(updates)
+
+    def invalidate_caches(self):
+        """Drop all cached results. Called automatically whenever values are added via update_values or add_signal."""
+        self._lumi_cache.clear()
+        self._combined_cache = {}
+        self._das_index = None
+        self._xml_index = None
+        self._content_hash = None
+        self._snapshot_token = None
+        self._cache_version = MCSampleValuesHelper._store_version
+
+    def lumi_cache_info(self):
+        """Return the hits, misses and current size of the get_lumi cache"""
+        return dict(self._lumi_cache_stats, size=len(self._lumi_cache))
+
+    def __reduce__(self):
+        """Pickle only the constructor arguments and the later changes (update_values, add_signal, load_event_counts)
+
+        Unpickling rebuilds the helper by replaying them, in worker processes at most once per process for the same state.
+        """
+        if getattr(self, "_snapshot_token", None) is None:
+            self._snapshot_token = hashlib.sha1(pickle.dumps((type(self), self._init_kwargs, self._replay))).hexdigest()
+        _pickled_tokens[self._snapshot_token] = os.getpid()
+        return (_restore_helper, (self._snapshot_token, type(self), self._init_kwargs, self._replay))
 
     def _import_signal(self, signal_name):
-        spec = importlib.util.spec_from_file_location(
-            "MCSignalValuesHelper",
-            f"{CMSSW_BASE}/src/UHH2/common/UHH2-datasets/xsec_signal_dicts/{signal_name}.py"
-        )
+        signal_path = os.path.join(UHH2DATASETS_PATH, "xsec_signal_dicts", signal_name+".py")
+        if not os.path.isfile(signal_path):
+            signal_path = f"{CMSSW_BASE}/src/UHH2/common/UHH2-datasets/xsec_signal_dicts/{signal_name}.py"
+        # Signal dictionaries only depend on the prototype. Make sure they get the already loaded one,
+        # such that the (large) background database is never executed a second time.
+        sys.modules.setdefault("MCSampleValuesPrototype", sys.modules[MCSampleValuesHelperPrototype.__module__])
+        spec = importlib.util.spec_from_file_location("MCSignalValuesHelper", signal_path)
         module = importlib.util.module_from_spec(spec)
         sys.modules["MCSignalHelper"] = module
         spec.loader.exec_module(module)
@@ -7385,7 +7537,10 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
             key (`str`): The type of information being requested. The Options can be found in the _key_field_map.
             strict (`bool`): Whether or not to perform strict checking of the dictionary
 
+        For combined periods (e.g. "UL16", see MCSampleValuesPrototype.periods) the values of the member periods are aggregated, see _get_combined_value.
         """
+        if year in periods.combined_names:
+            return self._get_combined_value(name, energy, year, key, strict, info)
         fields = [self._key_field_map[key][0]+info+"_"+energy,self._key_field_map[key][0]+info+"_"+year]
         if not name in self.__values_dict:
             raise KeyError("ERROR MCSampleValuesHelper::Unknown process \"" + str(name) + "\"")
@@ -7402,42 +7557,458 @@ class MCSampleValuesHelper(MCSampleValuesHelperPrototype):
             else:
                 self._key_field_map[key][1]
 
-        if self.__values_dict[name][key].__getattribute__(fields[0]) != self._key_field_map[key][1]:
-            return self.__values_dict[name][key].__getattribute__(fields[0])
+        if getattr(self.__values_dict[name][key], fields[0]) != self._key_field_map[key][1]:
+            return getattr(self.__values_dict[name][key], fields[0])
         else:
-            return self.__values_dict[name][key].__getattribute__(fields[1])
+            return getattr(self.__values_dict[name][key], fields[1])
+
+    def _get_combined_value(self, name, energy, year, key, strict, info):
+        """Return the value of a combined period (see MCSampleValuesHelperPrototype._get_combined_value), cached until the database changes"""
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        cache_key = (name, energy, year, key, strict, info)
+        if not cache_key in self._combined_cache:
+            self._combined_cache[cache_key] = super()._get_combined_value(name, energy, year, key, strict, info)
+        return self._combined_cache[cache_key]
+
+    def get_nevt_components(self, name, energy, year):
+        """Return the parts (e.g. extensions or versions) the number of events of a sample consists of as list of (DAS name, number of events) tuples
+
+        The DAS names are the alternatives of the XmlSource in brace syntax, in the order of the NEVTParts values. They are None if they can not
+        be matched to the parts. Samples without parts are returned as a single part. For a combined period the parts of the member periods are
+        concatenated (a single part if missing for any member).
+        """
+        nevt = self.get_nevt(name, energy, year)
+        if periods.members(year) is not None:
+            if nevt == self._key_field_map["NEvents"][1]:
+                return [(None, nevt)]
+            return [component for member in periods.members(year) for component in self.get_nevt_components(name, energy, member)]
+        parts = self.get_value(name, energy, year, "NEvents", False, "Parts")
+        if parts == self._key_field_map["NEvents"][1]:
+            parts = (nevt,)
+        elif abs(sum(parts)-nevt) > 1e-9*abs(nevt):
+            raise ValueError("ERROR MCSampleValuesHelper::The parts " + str(parts) + " of process \"" + str(name) + "\" do not add up to the number of events " + str(nevt))
+        das_name = self.get_xml(name, energy, year, "Source")
+        alternatives = parse_das_name(das_name).alternatives if das_name != "" else ()
+        if len(alternatives) != len(parts):
+            alternatives = (None,)*len(parts)
+        return list(zip(alternatives, parts))
+
+    def get_lumi_components(self, name, energy, year, components=None, kFactor=False, Corrections=False):
+        """Return the lumi of a subset of the parts of a MC sample, e.g. when running on a single extension only
 
-    def get_xs(self, name, energy, year, info=""):
-        return self.get_value(name, energy, year, "CrossSection", True, info)
+        Args:
+            components (:obj:`list`): The parts to use, given by their index or DAS name (see get_nevt_components). All parts are used if None.
+            name, energy, year, kFactor, Corrections: See get_lumi
+        """
+        parts = self.get_nevt_components(name, energy, year)
+        if components is None:
+            components = range(len(parts))
+        das_names = [das_name for das_name, _ in parts]
+        nevt = 0.0
+        for component in components:
+            if not isinstance(component, numbers.Integral):
+                if not component in das_names:
+                    raise KeyError("ERROR MCSampleValuesHelper::The process \"" + str(name) + "\" has no part \"" + str(component) + "\", use one of " + str(das_names))
+                component = das_names.index(component)
+            nevt += parts[component][1]
+        xsec = self.get_xs(name, energy, year)
+        xsec *= self.get_br(name, energy, year)
+        if kFactor: xsec *= self.get_kfactor(name, energy, year)
+        if Corrections: xsec *= self.get_corr(name, energy, year)
+        return abs(nevt)/xsec
 
-    def get_nevt(self, name, energy, year, info=""):
-        return self.get_value(name, energy, year, "NEvents", True, info)
+    def get_component_ntuples(self, name, energy, year, base_path=UHH2DATASETS_PATH):
+        """Return a dictionary mapping the DAS names of the parts of a sample to the ntuples of its XML belonging to them
 
-    def get_br(self, name, energy, year, info=""):
-        return self.get_value(name, energy, year, "BranchingRatio", False, info)
+        Ntuples are assigned by the processed dataset name (e.g. "Run2016B-ver1_HIPM_UL2016_MiniAODv2-v2") contained in their path.
+        If the sample consists of a single part, all ntuples are returned for it.
+        """
+        from DatasetXMLHelper import iter_ntuple_paths
+        das_names = [das_name for das_name, _ in self.get_nevt_components(name, energy, year)]
+        ntuples = {das_name: [] for das_name in das_names}
+        xmlpath = self.get_xml(name, energy, year)
+        if xmlpath == "":
+            return ntuples
+        for path in iter_ntuple_paths(xmlpath, base_path):
+            if len(das_names) == 1:
+                ntuples[das_names[0]].append(path)
+                continue
+            for das_name in das_names:
+                if das_name is not None and das_name.split("/")[2] in path:
+                    ntuples[das_name].append(path)
+                    break
+        return ntuples
 
-    def get_kfactor(self, name, energy, year, info=""):
-        return self.get_value(name, energy, year, "kFactor", False, info)
+    def get_lumi(self, name, energy, year, kFactor=False, Corrections=False):
+        """Return the lumi of a MC sample (see MCSampleValuesHelperPrototype.get_lumi)
 
-    def get_corr(self, name, energy, year, info=""):
-        return self.get_value(name, energy, year, "Correction", False, info)
+        Results are cached per (name, energy, year, kFactor, Corrections). The cache is dropped whenever the database is changed.
+        """
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        key = (name, energy, year, kFactor, Corrections)
+        if key in self._lumi_cache:
+            self._lumi_cache_stats["hits"] += 1
+            return self._lumi_cache[key]
+        self._lumi_cache_stats["misses"] += 1
+        lumi = super().get_lumi(name, energy, year, kFactor, Corrections)
+        self._lumi_cache[key] = lumi
+        return lumi
+
+    async def aget_lumi_many(self, queries, kFactor=False, Corrections=False, executor=None, max_concurrency=4, chunk_size=256, return_exceptions=False):
+        """Return the lumis of many (name, energy, year) queries, computed in an executor without blocking the event loop
+
+        The queries are split into chunks of chunk_size, which are evaluated in the executor (the default thread pool if None) with at most
+        max_concurrency chunks in flight. Cancelling the awaiting task cancels all chunks which did not start yet.
 
-    def get_xml(self, name, energy, year, info=""):
-        return self.get_value(name, energy, year, "XMLname", False, info)
+        Args:
+            queries (:obj:`list` of :obj:`tuple`): The (name, energy, year) of each lumi
+            kFactor, Corrections: See get_lumi
+            return_exceptions (`bool`): Return the KeyError/ValueError of failing queries (e.g. unknown samples) in place of their lumi instead of raising
+
+        Example:
+            lumis = await helper.aget_lumi_many([("TTToSemiLeptonic", "13TeV", "UL18"), ("TTTo2L2Nu", "13TeV", "UL18")])
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        queries = list(queries)
+
+        def run_chunk(chunk):
+            lumis = []
+            for name, energy, year in chunk:
+                try:
+                    lumis.append(self.get_lumi(name, energy, year, kFactor, Corrections))
+                except (KeyError, ValueError) as error:
+                    if not return_exceptions: raise
+                    lumis.append(error)
+            return lumis
+
+        async def submit(chunk):
+            async with semaphore:
+                return await loop.run_in_executor(executor, run_chunk, chunk)
+
+        chunks = await asyncio.gather(*(submit(queries[i:i+chunk_size]) for i in range(0, len(queries), chunk_size)))
+        return [lumi for chunk in chunks for lumi in chunk]
+
+    def get_period_fractions(self, name, energy, year, kFactor=False, Corrections=False):
+        """Return the fraction of the effective lumi of a combined period (e.g. "UL16") contributed by each member period as dictionary
+
+        This is the fraction of the combined sample's events each period contributes with, when all events are weighted with the combined lumi.
+        """
+        members = periods.members(year)
+        if members is None:
+            raise KeyError("ERROR MCSampleValuesHelper::\"" + str(year) + "\" is not a combined period, use one of " + str(periods.combined()))
+        lumi = self.get_lumi(name, energy, year, kFactor, Corrections)
+        return {member: self.get_lumi(name, energy, member, kFactor, Corrections)/lumi for member in members}
+
+    def at(self, rev):
+        """Return a helper serving the database as of a git revision, e.g. helper.at("HEAD~10").get_lumi(...). See DatabaseSnapshots."""
+        from DatabaseSnapshots import SnapshotHelper
+        return SnapshotHelper(rev)
+
+    def content_hash(self):
+        """Return a SHA-1 hex digest of the values of all samples (including imported signals), e.g. to detect changes or as HTTP ETag
+
+        The digest only depends on the content, not on how the database was loaded. It is computed on first use and cached afterwards.
+        """
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        if self._content_hash is None:
+            digest = hashlib.sha1()
+            values_dict = self.__values_dict
+            for name in sorted(values_dict):
+                values = values_dict[name]
+                digest.update(repr((name, sorted((key, sorted(record_items(record))) for key, record in values.items()))).encode())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def get_sample_origins(self):
+        """Return a dictionary mapping each sample name to the imported signal dictionary providing it, or "database" for all other samples"""
+        values_dict = self.__values_dict
+        origins = dict.fromkeys(values_dict, "database")
+        if isinstance(values_dict, ChainMap):
+            # add_signal puts the latest signal in front of the chain, which takes precedence
+            for signal_name, signal_dict in zip(self._imported_signals, reversed(values_dict.maps[:-1])):
+                for name in signal_dict:
+                    origins[name] = signal_name
+        return origins
+
+    def get_samples(self, pattern=None):
+        """Return the sorted list of sample names, optionally only those matching the shell-style pattern (e.g. "TTTo*")"""
+        samples = sorted(self.__values_dict)
+        if pattern is not None:
+            samples = fnmatch.filter(samples, pattern)
+        return samples
+
+    def get_das_index(self):
+        """Return a dictionary mapping DAS dataset names to a list of (sample, year) tuples
+
+        Both the names as stored in the XmlSource fields (including brace syntax) and all of their expanded alternatives are used as keys.
+        The index is built on first use and cached afterwards.
+        """
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        if self._das_index is None:
+            prefix = self._key_field_map["XMLname"][0]+"Source_"
+            das_index = {}
+            for name, values in self.__values_dict.items():
+                if not "XMLname" in values:
+                    continue
+                for field, das_name in zip(values["XMLname"]._fields, values["XMLname"]):
+                    if not field.startswith(prefix) or das_name.strip() == "":
+                        continue
+                    parsed = parse_das_name(das_name)
+                    entry = (name, field[len(prefix):])
+                    for key in dict.fromkeys((das_name.strip(), parsed.name)+parsed.alternatives):
+                        das_index.setdefault(key, []).append(entry)
+            self._das_index = das_index
+        return self._das_index
+
+    def get_samples_from_das(self, das_name):
+        """Return the list of (sample, year) tuples using the given DAS dataset name. An empty list is returned for unknown or malformed names."""
+        das_index = self.get_das_index()
+        if das_name in das_index:
+            return das_index[das_name]
+        try:
+            return das_index.get(parse_das_name(das_name).name, [])
+        except ValueError:
+            return []
+
+    def get_xml_index(self):
+        """Return a dictionary mapping XML paths (relative to UHH2-datasets) to a list of (sample, year) tuples. Built on first use and cached afterwards."""
+        if self._cache_version != MCSampleValuesHelper._store_version:
+            self.invalidate_caches()
+        if self._xml_index is None:
+            prefix = self._key_field_map["XMLname"][0]+"_"
+            xml_index = {}
+            for name, values in self.__values_dict.items():
+                if not "XMLname" in values:
+                    continue
+                for field, xmlpath in zip(values["XMLname"]._fields, values["XMLname"]):
+                    if field.startswith(prefix) and xmlpath != "":
+                        xml_index.setdefault(os.path.normpath(xmlpath), []).append((name, field[len(prefix):]))
+            self._xml_index = xml_index
+        return self._xml_index
+
+    def get_samples_from_xml(self, xmlpath):
+        """Return the list of (sample, year) tuples using the given XML path. An empty list is returned for unknown XMLs."""
+        return self.get_xml_index().get(os.path.normpath(xmlpath), [])
+
+async def validate_xml_paths(xmlpaths=None, helper=None, base_path=UHH2DATASETS_PATH, executor=None, max_concurrency=32):
+    """Return the sorted XML paths (relative to base_path) which do not exist, checked in an executor without blocking the event loop
+
+    At most max_concurrency checks are in flight, which hides the latency of slow (e.g. network) file systems.
+    Cancelling the awaiting task cancels all checks which did not start yet.
+
+    Args:
+        xmlpaths (:obj:`list` of :obj:`str`): The XML paths to check. All XML paths of the helper are checked if None.
+        helper (:obj:`MCSampleValuesHelper`): The helper providing the XML paths. A default MCSampleValuesHelper if None.
+        base_path (`str`): The UHH2-datasets directory
+        executor (:obj:`concurrent.futures.Executor`): The executor (the default thread pool if None)
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    if xmlpaths is None:
+        xmlpaths = (MCSampleValuesHelper() if helper is None else helper).get_xml_index()
+
+    async def exists(xmlpath):
+        async with semaphore:
+            return await loop.run_in_executor(executor, os.path.isfile, os.path.join(base_path, xmlpath))
+
+    xmlpaths = list(dict.fromkeys(xmlpaths))
+    found = await asyncio.gather(*(exists(xmlpath) for xmlpath in xmlpaths))
+    return sorted(xmlpath for xmlpath, isfile in zip(xmlpaths, found) if not isfile)
+
+
+_restored_helpers = {}
+# Process which pickled a helper state, per token
+_pickled_tokens = {}
+
+
+def _restore_helper(token, cls, kwargs, replay=()):
+    """Rebuild a pickled helper by constructing it and replaying its changes
+
+    Helpers are cached per token in processes other than the one which pickled them, so workers receiving the same helper with every task only
+    construct it once. In the pickling process (pickle.loads, copy.copy, copy.deepcopy) a new helper is returned, which can be changed
+    independently of the original.
+    """
+    if _pickled_tokens.get(token) == os.getpid():
+        return _build_helper(cls, kwargs, replay)
+    if not token in _restored_helpers:
+        _restored_helpers[token] = _build_helper(cls, kwargs, replay)
+        _restored_helpers[token]._snapshot_token = token
+    return _restored_helpers[token]
+
+
+def _build_helper(cls, kwargs, replay):
+    helper = cls(**kwargs)
+    for method, args in replay:
+        getattr(helper, method)(*args)
+    return helper
+
+
+class HelperInstrumentation():
+    """Opt-in counters and timers for MCSampleValuesHelper
+
+    When enabled, the timed methods of MCSampleValuesHelper and the overrides of its subclasses (including subclasses defined later) are
+    replaced by wrappers recording the number of calls and the time spent. Only the outermost call is recorded, i.e. a subclass override
+    calling the base method counts once. get_value additionally counts the queries per (name, key, year), get_lumi the hits and misses of
+    the lumi cache (also for cached calls) and the lazily built indices record cache hits and misses.
+    When disabled the original methods are restored, so there is no overhead at all.
+
+    Example:
+        from CrossSectionHelper import *
+        enable_instrumentation("xsec_stats.json")  # or export UHH2_XSEC_INSTRUMENTATION=xsec_stats.json
+        helper = MCSampleValuesHelper()
+        helper.get_lumi("TTbarTo2L2Nu","13TeV","UL18")
+        instrumentation.summary()
+    """
+
+    _timed_methods = ["__init__", "_import_signal", "get_value", "get_lumi"]
+    _cached_methods = {"get_das_index": "_das_index", "get_xml_index": "_xml_index"}
+
+    def __init__(self):
+        self.enabled = False
+        self._originals = {}
+        self.reset()
+
+    def reset(self):
+        self.queries = {}
+        self.timings = {}
+        self.cache_stats = {}
+
+    def record_time(self, method, elapsed):
+        timing = self.timings.setdefault(method, {"calls": 0, "total": 0.0, "max": 0.0})
+        timing["calls"] += 1
+        timing["total"] += elapsed
+        timing["max"] = max(timing["max"], elapsed)
+
+    def record_cache(self, cache, hit):
+        stats = self.cache_stats.setdefault(cache, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+    def _wrap_timed(self, method_name, method):
+        def wrapper(helper, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(helper, *args, **kwargs)
+            finally:
+                self.record_time(method_name, time.perf_counter()-start)
+        return wrapper
+
+    def _wrap_get_value(self, method):
+        timed = self._wrap_timed("get_value", method)
+        def wrapper(helper, name, energy, year, key, *args, **kwargs):
+            query = (name, key, year)
+            self.queries[query] = self.queries.get(query, 0)+1
+            return timed(helper, name, energy, year, key, *args, **kwargs)
+        return wrapper
+
+    def _wrap_get_lumi(self, method):
+        timed = self._wrap_timed("get_lumi", method)
+        def wrapper(helper, *args, **kwargs):
+            hits = helper.lumi_cache_info()["hits"]
+            try:
+                return timed(helper, *args, **kwargs)
+            finally:
+                self.record_cache("get_lumi", helper.lumi_cache_info()["hits"] > hits)
+        return wrapper
+
+    def _wrap_cached(self, cache, attribute, method):
+        def wrapper(helper, *args, **kwargs):
+            self.record_cache(cache, getattr(helper, attribute, None) is not None)
+            return method(helper, *args, **kwargs)
+        return wrapper
+
+    def _wrap(self, method_name, method):
+        if method_name == "get_value":
+            recorded = self._wrap_get_value(method)
+        elif method_name == "get_lumi":
+            recorded = self._wrap_get_lumi(method)
+        elif method_name in self._cached_methods:
+            recorded = self._wrap_cached(method_name, self._cached_methods[method_name], method)
+        else:
+            recorded = self._wrap_timed(method_name, method)
+        def wrapper(helper, *args, **kwargs):
+            # Calls of an overridden method from its override (super()) are part of the outer call
+            if getattr(type(helper), method_name) is not wrapper:
+                return method(helper, *args, **kwargs)
+            return recorded(helper, *args, **kwargs)
+        return functools.wraps(method)(wrapper)
+
+    def instrument_class(self, cls, inherited=False):
+        """Wrap the instrumented methods defined by cls (with inherited, also the ones it inherits)"""
+        for method_name in self._timed_methods+list(self._cached_methods):
+            if (cls, method_name) in self._originals or not (inherited or method_name in cls.__dict__):
+                continue
+            self._originals[(cls, method_name)] = cls.__dict__.get(method_name)
+            setattr(cls, method_name, self._wrap(method_name, getattr(cls, method_name)))
+
+    def _subclasses(self, cls):
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from self._subclasses(subclass)
+
+    def enable(self, cls=None):
+        if self.enabled:
+            return
+        self._cls = MCSampleValuesHelper if cls is None else cls
+        self.instrument_class(self._cls, inherited=True)
+        for subclass in self._subclasses(self._cls):
+            self.instrument_class(subclass)
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        for (cls, method_name), method in self._originals.items():
+            if method is None:
+                delattr(cls, method_name)
+            else:
+                setattr(cls, method_name, method)
+        self._originals = {}
+        self.enabled = False
+
+    def summary(self):
+        """Return the collected statistics as a JSON serialisable dictionary"""
+        return {
+            "queries": [{"name": name, "key": key, "year": year, "count": count} for (name, key, year), count in sorted(self.queries.items(), key=lambda item: -item[1])],
+            "timings": {method: dict(timing, mean=timing["total"]/timing["calls"]) for method, timing in self.timings.items()},
+            "cache": self.cache_stats,
+        }
+
+    def dump(self, filename):
+        with open(filename, "w") as outfile:
+            json.dump(self.summary(), outfile, indent=2)
+
+
+instrumentation = HelperInstrumentation()
+
+
+def enable_instrumentation(dump_file=None):
+    """Enable the instrumentation of MCSampleValuesHelper. If dump_file is given, the statistics are written there as JSON at process exit."""
+    instrumentation.enable()
+    if dump_file is not None:
+        atexit.register(instrumentation.dump, dump_file)
+
+
+def disable_instrumentation():
+    instrumentation.disable()
+
+
+if os.environ.get("UHH2_XSEC_INSTRUMENTATION"):
+    enable_instrumentation(os.environ["UHH2_XSEC_INSTRUMENTATION"])
 
-    def get_lumi(self, name, energy, year, kFactor=False, Corrections=False):
-        xsec = self.get_xs(name, energy, year)
-        xsec *= self.get_br(name, energy, year)
-        if kFactor: xsec *= self.get_kfactor(name, energy, year)
-        if Corrections: xsec *= self.get_corr(name, energy, year)
-        return abs(self.get_nevt(name, energy, year))/xsec
 
 def print_database(raise_errors=False):
     helper = MCSampleValuesHelper()
     samples = list(MCSampleValuesHelper.__dict__["_MCSampleValuesHelper__values_dict"].keys())
     samples.sort()
-    energies = MCSampleValuesHelperPrototype.__dict__["_MCSampleValuesHelperPrototype__energies"]
-    years = MCSampleValuesHelperPrototype.__dict__["_MCSampleValuesHelperPrototype__years"]
+    energies = periods.energies(default=True)
+    years = periods.years(default=True)
     import re
     run_pattern = re.compile("(?P<run>(Run)+[ABCDEFGH]{1})")
 
@@ -7480,14 +8051,41 @@ def print_database(raise_errors=False):
     return 0
 
 
+def check_imports(raise_errors=False):
+    """Import every signal dictionary of xsec_signal_dicts and check that the background database is executed only once
+
+    Signal dictionaries must only depend on MCSampleValuesPrototype. Returns the number of executions of CrossSectionHelper.py (expected: 1).
+    """
+    signals = sorted(filename[:-len(".py")] for filename in os.listdir(os.path.join(UHH2DATASETS_PATH, "xsec_signal_dicts")) if filename.endswith(".py"))
+    for signal in signals:
+        MCSampleValuesHelper(import_signal=signal)
+    executions = sum(1 for module in list(sys.modules.values()) if os.path.basename(str(getattr(module, "__file__", ""))) == "CrossSectionHelper.py")
+    print("Imported " + str(len(signals)) + " signal dictionaries, CrossSectionHelper.py executed " + str(executions) + " time(s)")
+    if executions != 1:
+        print("Error: A signal dictionary re-executes the background database, import the record types from MCSampleValuesPrototype")
+        if raise_errors: raise ValueError("Importing a signal dictionary re-executes the background database")
+    return executions
+
+
 if(__name__ == "__main__"):
     import argparse
     parser = argparse.ArgumentParser(description="CrossSectionHelper Database: find and calculate crucial information for your Analysis!")
 
     parser.add_argument("--print", action="store_true", help="print number of events and calculated luminosity of all samples in database (This is primarily to test the integrety of the database).")
     parser.add_argument("--throw", action="store_true", help="raise erros if they occur. Should be used together with --print option.")
+    parser.add_argument("--check-imports", action="store_true", help="import all signal dictionaries and check that the database is executed only once.")
+    parser.add_argument("--das", nargs="+", default=[], help="print the sample name(s) and year(s) using the given DAS dataset name(s).")
 
     args = parser.parse_args()
 
     if(args.print):
         print_database(args.throw)
+
+    if(args.check_imports):
+        check_imports(args.throw)
+
+    if(len(args.das) > 0):
+        helper = MCSampleValuesHelper()
+        for das_name in args.das:
+            samples = helper.get_samples_from_das(das_name)
+            print(das_name+" -> "+(", ".join(sample+" ("+year+")" for sample, year in samples) if len(samples) > 0 else "not found"))
@@ -0,0 +1,242 @@
+import ast
+from collections.abc import Mapping
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+from CrossSectionHelper import MCSampleValuesHelper, MCSampleValuesHelperPrototype, UHH2DATASETS_PATH
+
+
+SNAPSHOT_PATH = os.path.join(UHH2DATASETS_PATH, ".snapshots")
+DATABASE_FILE = "CrossSectionHelper.py"
+
+
+def _evaluate(node):
+    """Evaluate the constant expressions used in the database (numbers, strings, tuples, sums like 2789243+158145722)"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Tuple):
+        return tuple(_evaluate(element) for element in node.elts)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _evaluate(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div)):
+        left, right = _evaluate(node.left), _evaluate(node.right)
+        if isinstance(node.op, ast.Add): return left+right
+        if isinstance(node.op, ast.Sub): return left-right
+        if isinstance(node.op, ast.Mult): return left*right
+        return left/right
+    raise ValueError("ERROR DatabaseSnapshots::Unsupported expression in line " + str(getattr(node, "lineno", "?")) + ": " + ast.dump(node))
+
+
+def parse_database(source):
+    """Return the database of a version of CrossSectionHelper.py as {sample: {key: {field: value}}} without executing it
+
+    Only the fields which are set in the value records are returned. The source is parsed, so old versions (e.g. with imports not available
+    anymore) can be read as well.
+    """
+    for node in ast.walk(ast.parse(source)):
+        if not (isinstance(node, ast.ClassDef) and node.name == "MCSampleValuesHelper"):
+            continue
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__values_dict" for t in statement.targets):
+                database = {}
+                for name, sample in zip(statement.value.keys, statement.value.values):
+                    database[_evaluate(name)] = {_evaluate(key): {keyword.arg: _evaluate(keyword.value) for keyword in record.keywords}
+                                                 for key, record in zip(sample.keys, sample.values)}
+                return database
+    raise ValueError("ERROR DatabaseSnapshots::No MCSampleValuesHelper.__values_dict found")
+
+
+def _record_hash(record):
+    return hashlib.sha1(json.dumps(record, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", "-C", repo]+list(args), check=True, capture_output=True, text=True).stdout
+
+
+class SnapshotStore():
+    """Compact store of the database as of past git revisions
+
+    Each sample entry ({key: {field: value}}) is stored once in a pool of records addressed by its content hash, so entries which did not change
+    between versions are shared. A version is a manifest mapping the sample names to record hashes, stored per commit of CrossSectionHelper.py.
+    Revisions which did not change the database resolve to the last commit that did. Versions are built from git on first use and the
+    manifests, the pool and the resulting records are loaded lazily.
+
+    Args:
+        path (`str`): The directory of the store
+        repo (`str`): The git repository of UHH2-datasets
+
+    Example:
+        store = SnapshotStore()
+        store.build()  # all commits changing the database
+        store.helper("v1.0").get_lumi("TTToSemiLeptonic", "13TeV", "UL18")
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH, repo=UHH2DATASETS_PATH):
+        self.path = path
+        self.repo = repo
+        self._pool = None
+        self._records = {}
+        self._manifests = {}
+        self._commits = {}
+
+    def resolve(self, rev):
+        """Return the hash of the last commit changing the database at or before rev"""
+        if not rev in self._commits:
+            commit = _git(self.repo, "log", "-1", "--format=%H", rev, "--", DATABASE_FILE).strip()
+            if commit == "":
+                raise KeyError("ERROR SnapshotStore::No version of " + DATABASE_FILE + " at \"" + str(rev) + "\"")
+            self._commits[rev] = commit
+        return self._commits[rev]
+
+    def commits(self, revision_range="HEAD"):
+        """Return the commits changing the database in revision_range, oldest first"""
+        return _git(self.repo, "log", "--reverse", "--format=%H", revision_range, "--", DATABASE_FILE).split()
+
+    def _manifest_path(self, commit):
+        return os.path.join(self.path, "versions", commit+".json")
+
+    def _load_pool(self):
+        if self._pool is None:
+            pool_path = os.path.join(self.path, "records.json")
+            self._pool = {}
+            if os.path.isfile(pool_path):
+                with open(pool_path) as pool_file:
+                    self._pool = json.load(pool_file)
+        return self._pool
+
+    def _save_pool(self):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, "records.json")+".tmp", "w") as pool_file:
+            json.dump(self._pool, pool_file, separators=(",", ":"), sort_keys=True)
+        os.replace(os.path.join(self.path, "records.json")+".tmp", os.path.join(self.path, "records.json"))
+
+    def has(self, commit):
+        return os.path.isfile(self._manifest_path(commit))
+
+    def build(self, revs=None, verbose=False):
+        """Store the versions of the given revisions (all commits changing the database if None) which are not stored yet
+
+        Returns:
+            :obj:`list` of the commits which were added
+        """
+        commits = self.commits() if revs is None else list(dict.fromkeys(self.resolve(rev) for rev in revs))
+        pool = self._load_pool()
+        added = []
+        for commit in commits:
+            if self.has(commit):
+                continue
+            manifest = {}
+            for name, sample in parse_database(_git(self.repo, "show", commit+":"+DATABASE_FILE)).items():
+                record_hash = _record_hash(sample)
+                pool.setdefault(record_hash, sample)
+                manifest[name] = record_hash
+            os.makedirs(os.path.dirname(self._manifest_path(commit)), exist_ok=True)
+            with open(self._manifest_path(commit), "w") as manifest_file:
+                json.dump(manifest, manifest_file, separators=(",", ":"), sort_keys=True)
+            added.append(commit)
+            if verbose:
+                print(commit[:10]+": "+str(len(manifest))+" samples, "+str(len(pool))+" distinct records")
+        if len(added) > 0:
+            self._save_pool()
+        return added
+
+    def manifest(self, rev):
+        """Return the {sample: record hash} manifest of a revision, building the version if needed"""
+        commit = self.resolve(rev)
+        if not commit in self._manifests:
+            if not self.has(commit):
+                self.build([commit])
+            with open(self._manifest_path(commit)) as manifest_file:
+                self._manifests[commit] = json.load(manifest_file)
+        return self._manifests[commit]
+
+    def record(self, record_hash):
+        """Return the entry of a record hash as {key: value record}, shared between all versions containing it
+
+        Fields of periods which are not registered (anymore) are dropped.
+        """
+        if not record_hash in self._records:
+            entry = {}
+            for key, fields in self._load_pool()[record_hash].items():
+                values_type = MCSampleValuesHelperPrototype._key_values_map[key]
+                entry[key] = values_type(**{field: tuple(value) if isinstance(value, list) else value
+                                            for field, value in fields.items() if field in values_type._field_set})
+            self._records[record_hash] = entry
+        return self._records[record_hash]
+
+    def values(self, rev):
+        return SnapshotValues(self, rev)
+
+    def helper(self, rev):
+        _stores.setdefault((self.path, self.repo), self)
+        return SnapshotHelper(rev, self.path, self.repo)
+
+
+class SnapshotValues(Mapping):
+    """Read-only view of the database of a revision, loading the manifest on first access and the records on lookup"""
+
+    def __init__(self, store, rev):
+        self.store = store
+        self.rev = rev
+
+    def __getitem__(self, name):
+        return self.store.record(self.store.manifest(self.rev)[name])
+
+    def __contains__(self, name):
+        return name in self.store.manifest(self.rev)
+
+    def __iter__(self):
+        return iter(self.store.manifest(self.rev))
+
+    def __len__(self):
+        return len(self.store.manifest(self.rev))
+
+
+_stores = {}
+
+
+class SnapshotHelper(MCSampleValuesHelper):
+    """MCSampleValuesHelper serving the database as of a past git revision, e.g. MCSampleValuesHelper().at("HEAD~10")
+
+    Helpers of the same store directory share the loaded records. Changes to the current database (update_values) do not affect them.
+    """
+
+    def __init__(self, rev, path=SNAPSHOT_PATH, repo=UHH2DATASETS_PATH):
+        super().__init__()
+        if not (path, repo) in _stores:
+            _stores[(path, repo)] = SnapshotStore(path, repo)
+        self.store = _stores[(path, repo)]
+        self.rev = rev
+        self._MCSampleValuesHelper__values_dict = self.store.values(rev)
+        self._init_kwargs = {"rev": rev, "path": path, "repo": repo}
+        self.invalidate_caches()
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Build and query snapshots of the CrossSectionHelper database from git history.")
+
+    parser.add_argument("--build", nargs="*", default=None, help="store the versions of the given revisions (all commits changing the database if none are given).")
+    parser.add_argument("--path", default=SNAPSHOT_PATH, help="directory of the snapshot store.")
+    parser.add_argument("--lumi", nargs=3, metavar=("SAMPLE", "YEAR", "REV"), action="append", default=[], help="print the lumi of a sample as of a revision.")
+    parser.add_argument("--energy", default="13TeV", help="energy used by --lumi.")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.path)
+    if args.build is not None:
+        added = store.build(args.build if len(args.build) > 0 else None, verbose=True)
+        print("Added "+str(len(added))+" version(s) to "+args.path)
+
+    for sample, year, rev in args.lumi:
+        try:
+            print(sample+" ("+year+") @ "+rev+": "+str(store.helper(rev).get_lumi(sample, args.energy, year)))
+        except (KeyError, ValueError) as error:
+            if args.throw: raise
+            print(sample+" ("+year+") @ "+rev+": "+str(error), file=sys.stderr)
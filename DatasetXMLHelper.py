@@ -0,0 +1,286 @@
+from array import array
+import bisect
+import hashlib
+import json
+import math
+import os
+import re
+import struct
+import sys
+
+
+UHH2DATASETS_PATH = os.path.dirname(os.path.abspath(__file__))
+CAMPAIGN_PATTERN = re.compile("^(RunII|Run3)_[0-9]+X_v[0-9]+$")
+NTUPLE_PATTERN = re.compile(r'^\s*<In\s+FileName="(?P<path>[^"]+)"')
+NUMBER_ENTRIES_PATTERN = re.compile(r'NumberEntries="(?P<value>[^"]+)"\s+Method=(?P<method>fast|weights)\b')
+COUNT_SEPARATOR_PATTERN = re.compile(r"(?<![eE])\+")
+NTUPLE_INDEX_PATH = os.path.join(UHH2DATASETS_PATH, "ntuple_index.bin")
+
+
+def iter_xml_files(base_path=UHH2DATASETS_PATH, campaigns=None):
+    """Yield the paths of all dataset XMLs relative to base_path, sorted within each directory
+
+    Args:
+        base_path (`str`): The UHH2-datasets directory
+        campaigns (:obj:`list` of :obj:`str`): Only walk these campaign directories (e.g. "RunII_106X_v2"). All campaigns are used if None.
+    """
+    if campaigns is None:
+        campaigns = sorted(d for d in os.listdir(base_path) if CAMPAIGN_PATTERN.match(d) and os.path.isdir(os.path.join(base_path, d)))
+    for campaign in campaigns:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(base_path, campaign)):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(".xml"):
+                    yield os.path.relpath(os.path.join(dirpath, filename), base_path)
+
+
+def iter_ntuple_paths(xmlpath, base_path=UHH2DATASETS_PATH):
+    """Yield the ntuple file names of all active (i.e. not commented out) <In FileName=.../> entries of a dataset XML"""
+    with open(os.path.join(base_path, xmlpath)) as xmlfile:
+        for line in xmlfile:
+            match = NTUPLE_PATTERN.match(line)
+            if match is not None:
+                yield match.group("path")
+
+
+def read_number_entries(xmlpath, base_path=UHH2DATASETS_PATH):
+    """Return the counts of the <!-- < NumberEntries="..." Method=... /> --> trailers of a dataset XML as dictionary
+
+    The raw number of entries is stored as "fast", the (signed) sum of generator weights as "weights". Methods without trailer are missing.
+    If a method is given more than once, the last value is used. Counts written as sums (e.g. "2789243+158145722") are added up.
+    """
+    counts = {}
+    with open(os.path.join(base_path, xmlpath)) as xmlfile:
+        for line in xmlfile:
+            if not "NumberEntries" in line:
+                continue
+            for match in NUMBER_ENTRIES_PATTERN.finditer(line):
+                counts[match.group("method")] = sum(float(part) for part in COUNT_SEPARATOR_PATTERN.split(match.group("value")))
+    return counts
+
+
+def normalize_ntuple_path(path):
+    """Return the part of a ntuple path used for comparisons
+
+    Repeated slashes are collapsed and everything in front of "/store/" is removed, such that PFNs and LFNs of the same file are identical.
+    """
+    path = re.sub("/+", "/", path.strip())
+    pos = path.find("/store/")
+    return path[pos:] if pos >= 0 else path
+
+
+def hash_ntuple_path(path):
+    """Return a 64 bit hash of the normalized ntuple path"""
+    return struct.unpack("<Q", hashlib.blake2b(normalize_ntuple_path(path).encode(), digest_size=8).digest())[0]
+
+
+class NtupleIndex():
+    """Reverse index from ntuple file paths to the dataset XMLs listing them (and from there to the sample and year).
+
+    The index is stored in a compact binary file: a short JSON header with the list of XMLs,
+    followed by the sorted 64 bit path hashes and the XML ids of each entry.
+    Lookups are binary searches in the hash array and do not need to parse any XML.
+
+    Example:
+        from DatasetXMLHelper import NtupleIndex
+        NtupleIndex.build().save()
+        index = NtupleIndex.load()
+        index.lookup("/store/group/uhh/uhh2ntuples/RunII_106X_v2/UL18/.../Ntuple_123.root")
+        index.lookup_samples("/store/group/uhh/uhh2ntuples/RunII_106X_v2/UL18/.../Ntuple_123.root")
+    """
+
+    _magic = b"NTPLIDX1"
+
+    def __init__(self, xmlpaths, hashes, xml_ids, base_path=UHH2DATASETS_PATH):
+        self.xmlpaths = xmlpaths
+        self.hashes = hashes
+        self.xml_ids = xml_ids
+        self.base_path = base_path
+        self._helper = None
+
+    def __len__(self):
+        return len(self.hashes)
+
+    @classmethod
+    def build(cls, base_path=UHH2DATASETS_PATH, campaigns=None):
+        """Scan all dataset XMLs once and build the index"""
+        xmlpaths = []
+        entries = []
+        for xml_id, xmlpath in enumerate(iter_xml_files(base_path, campaigns)):
+            xmlpaths.append(xmlpath)
+            entries += [(hash_ntuple_path(path), xml_id) for path in iter_ntuple_paths(xmlpath, base_path)]
+        entries.sort()
+        hashes = array("Q", (h for h, _ in entries))
+        xml_ids = array("I", (i for _, i in entries))
+        return cls(xmlpaths, hashes, xml_ids, base_path)
+
+    def save(self, filename=NTUPLE_INDEX_PATH):
+        header = json.dumps({"xmlpaths": self.xmlpaths}).encode()
+        hashes, xml_ids = array("Q", self.hashes), array("I", self.xml_ids)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+            xml_ids.byteswap()
+        with open(filename, "wb") as outfile:
+            outfile.write(self._magic)
+            outfile.write(struct.pack("<QQ", len(header), len(hashes)))
+            outfile.write(header)
+            hashes.tofile(outfile)
+            xml_ids.tofile(outfile)
+
+    @classmethod
+    def load(cls, filename=NTUPLE_INDEX_PATH, base_path=UHH2DATASETS_PATH):
+        with open(filename, "rb") as infile:
+            if infile.read(len(cls._magic)) != cls._magic:
+                raise ValueError("ERROR NtupleIndex::\"" + str(filename) + "\" is not a ntuple index file")
+            header_length, n_entries = struct.unpack("<QQ", infile.read(16))
+            xmlpaths = json.loads(infile.read(header_length).decode())["xmlpaths"]
+            hashes, xml_ids = array("Q"), array("I")
+            hashes.fromfile(infile, n_entries)
+            xml_ids.fromfile(infile, n_entries)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+            xml_ids.byteswap()
+        return cls(xmlpaths, hashes, xml_ids, base_path)
+
+    def lookup(self, path, verify=False):
+        """Return the list of dataset XMLs containing the given ntuple path
+
+        Args:
+            path (`str`): The ntuple path, either as PFN (/pnfs/...) or LFN (/store/...)
+            verify (`bool`): Re-read the candidate XMLs to exclude (very unlikely) hash collisions
+        """
+        path_hash = hash_ntuple_path(path)
+        pos = bisect.bisect_left(self.hashes, path_hash)
+        xmlpaths = []
+        while pos < len(self.hashes) and self.hashes[pos] == path_hash:
+            xmlpaths.append(self.xmlpaths[self.xml_ids[pos]])
+            pos += 1
+        if verify:
+            normalized = normalize_ntuple_path(path)
+            xmlpaths = [x for x in xmlpaths if any(normalize_ntuple_path(p) == normalized for p in iter_ntuple_paths(x, self.base_path))]
+        return xmlpaths
+
+    def lookup_samples(self, path, verify=False, helper=None):
+        """Return a dictionary mapping each dataset XML containing the given ntuple path to its list of (sample, year) tuples"""
+        if helper is None:
+            if self._helper is None:
+                from CrossSectionHelper import MCSampleValuesHelper
+                self._helper = MCSampleValuesHelper()
+            helper = self._helper
+        return {xmlpath: helper.get_samples_from_xml(xmlpath) for xmlpath in self.lookup(path, verify)}
+
+
+class BloomFilter():
+    """Minimal Bloom filter on top of a bytearray, using double hashing of a 128 bit digest
+
+    Args:
+        n_items (`int`): Expected number of items
+        fp_rate (`float`): Targeted false positive rate at n_items
+    """
+
+    def __init__(self, n_items, fp_rate=0.01):
+        self.n_bits = max(8, int(-n_items*math.log(fp_rate)/math.log(2)**2))
+        self.n_hashes = max(1, int(round(self.n_bits/n_items*math.log(2))))
+        self.bits = bytearray((self.n_bits+7)//8)
+
+    def add(self, key):
+        """Add key (`bytes`) to the filter and return whether it was (possibly) present before"""
+        h1, h2 = struct.unpack("<QQ", hashlib.blake2b(key, digest_size=16).digest())
+        present = True
+        for i in range(self.n_hashes):
+            pos = (h1+i*h2) % self.n_bits
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                present = False
+                self.bits[pos >> 3] |= mask
+        return present
+
+
+def find_duplicate_ntuples(base_path=UHH2DATASETS_PATH, campaigns=None, expected_entries=2500000, fp_rate=0.01):
+    """Find ntuple paths listed in more than one dataset XML
+
+    All XMLs are streamed twice: the first pass inserts every normalized path into a Bloom filter and collects the hashes of
+    paths which were possibly seen before, the second pass confirms those candidates exactly.
+    Memory is thus bounded by the filter size plus the (small) number of candidates, independent of the number of XMLs.
+
+    Returns:
+        :obj:`dict` mapping each duplicated normalized path to the sorted list of XMLs listing it
+    """
+    bloom = BloomFilter(expected_entries, fp_rate)
+    candidates = set()
+    for xmlpath in iter_xml_files(base_path, campaigns):
+        for path in iter_ntuple_paths(xmlpath, base_path):
+            key = normalize_ntuple_path(path).encode()
+            if bloom.add(key):
+                candidates.add(hashlib.blake2b(key, digest_size=8).digest())
+    del bloom
+
+    occurrences = {}
+    for xmlpath in iter_xml_files(base_path, campaigns):
+        for path in iter_ntuple_paths(xmlpath, base_path):
+            key = normalize_ntuple_path(path)
+            if hashlib.blake2b(key.encode(), digest_size=8).digest() in candidates:
+                occurrences.setdefault(key, set()).add(xmlpath)
+    return {path: sorted(xmlpaths) for path, xmlpaths in occurrences.items() if len(xmlpaths) > 1}
+
+
+def summarize_duplicates(duplicates):
+    """Count duplicated ntuple paths per pair of XMLs and per pair of campaigns
+
+    Returns:
+        (:obj:`dict`, :obj:`dict`): The counts keyed by (xml, xml) and by (campaign, campaign)
+    """
+    per_xml_pair = {}
+    per_campaign = {}
+    for xmlpaths in duplicates.values():
+        campaign_pairs = set()
+        for i, xml_a in enumerate(xmlpaths):
+            for xml_b in xmlpaths[i+1:]:
+                per_xml_pair[(xml_a, xml_b)] = per_xml_pair.get((xml_a, xml_b), 0)+1
+                campaign_pairs.add(tuple(sorted((xml_a.split(os.sep)[0], xml_b.split(os.sep)[0]))))
+        for campaign_pair in campaign_pairs:
+            per_campaign[campaign_pair] = per_campaign.get(campaign_pair, 0)+1
+    return per_xml_pair, per_campaign
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Tools operating on the ntuple lists stored in the dataset XMLs.")
+
+    parser.add_argument("--build-index", action="store_true", help="scan all dataset XMLs and (re)build the ntuple reverse index.")
+    parser.add_argument("--index", default=NTUPLE_INDEX_PATH, help="path of the ntuple reverse index file.")
+    parser.add_argument("--lookup", nargs="+", default=[], help="print the dataset XML(s), sample(s) and year(s) containing the given ntuple path(s).")
+    parser.add_argument("--verify", action="store_true", help="confirm lookup results by re-reading the candidate XMLs.")
+    parser.add_argument("--duplicates", action="store_true", help="report ntuple paths listed in more than one dataset XML, per XML pair and per campaign.")
+    parser.add_argument("--campaigns", nargs="+", default=None, help="restrict the scan for duplicates to these campaign directories.")
+    parser.add_argument("--throw", action="store_true", help="raise an error if duplicates are found. Should be used together with --duplicates option.")
+
+    args = parser.parse_args()
+
+    if(args.build_index):
+        index = NtupleIndex.build()
+        index.save(args.index)
+        print("Indexed %d ntuples in %d XMLs into %s" % (len(index), len(index.xmlpaths), args.index))
+
+    if(len(args.lookup) > 0):
+        index = NtupleIndex.load(args.index)
+        for path in args.lookup:
+            results = index.lookup_samples(path, args.verify)
+            if len(results) == 0:
+                print(path+" -> not found")
+            for xmlpath, samples in results.items():
+                print(path+" -> "+xmlpath+" -> "+(", ".join(sample+" ("+year+")" for sample, year in samples) if len(samples) > 0 else "no sample"))
+
+    if(args.duplicates):
+        duplicates = find_duplicate_ntuples(campaigns=args.campaigns)
+        per_xml_pair, per_campaign = summarize_duplicates(duplicates)
+        print("Found %d ntuple path(s) listed in more than one XML" % len(duplicates))
+        print("")
+        print("Overlaps per campaign:")
+        for (campaign_a, campaign_b), count in sorted(per_campaign.items(), key=lambda item: -item[1]):
+            print("  %8d  %s" % (count, campaign_a if campaign_a == campaign_b else campaign_a+" <-> "+campaign_b))
+        print("")
+        print("Overlaps per XML pair:")
+        for (xml_a, xml_b), count in sorted(per_xml_pair.items(), key=lambda item: -item[1]):
+            print("  %8d  %s <-> %s" % (count, xml_a, xml_b))
+        if args.throw and len(duplicates) > 0: raise ValueError("Ntuple path(s) are listed in more than one XML")
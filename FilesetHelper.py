@@ -0,0 +1,187 @@
+import json
+import math
+import os
+import sys
+
+from CrossSectionHelper import MCSampleValuesHelper, UHH2DATASETS_PATH, periods
+from DatasetXMLHelper import iter_ntuple_paths, normalize_ntuple_path, read_number_entries
+
+
+TREE_NAME = "AnalysisTree"
+STEP_SIZE = 100000
+
+
+def rewrite_path(path, prefix=None):
+    """Return the ntuple path with everything in front of /store/ replaced by prefix, or unchanged if None
+
+    E.g. the prefix "root://xrootd-cms.infn.it/" gives "root://xrootd-cms.infn.it//store/...".
+    """
+    return path if prefix is None else prefix + normalize_ntuple_path(path)
+
+
+def make_steps(num_entries, step_size=STEP_SIZE):
+    """Return [start, stop) event ranges covering num_entries in chunks of equal size of at most step_size"""
+    if num_entries <= 0:
+        return []
+    n_steps = math.ceil(num_entries/step_size)
+    size = math.ceil(num_entries/n_steps)
+    return [[start, min(start+size, num_entries)] for start in range(0, num_entries, size)]
+
+
+def uproot_entries(tree=TREE_NAME, timeout=30):
+    """Return a function reading the number of entries of tree in a ntuple with uproot, to be used as entries of iter_fileset"""
+    import uproot
+
+    def num_entries(path):
+        with uproot.open(path, timeout=timeout) as ntuple:
+            return ntuple[tree].num_entries
+    return num_entries
+
+
+def _estimate_entries(xmlpath, paths, base_path):
+    """Split the NumberEntries (Method=fast) trailer of a dataset XML evenly among its files, None if there is no trailer"""
+    total = read_number_entries(xmlpath, base_path).get("fast")
+    if total is None or len(paths) == 0:
+        return None
+    per_file, remainder = divmod(int(total), len(paths))
+    return [per_file+1 if i < remainder else per_file for i in range(len(paths))]
+
+
+def is_mc(helper, name, energy, year, xmlpath):
+    """Return whether a sample is simulation: its XML is not below the data directory of the campaign, or without such directory it has a cross section"""
+    parts = xmlpath.split("/")
+    if len(parts) > 2:
+        return parts[1] != "data"
+    return helper.get_value(name, energy, year, "CrossSection") != helper._key_field_map["CrossSection"][1]
+
+
+def _metadata(helper, name, energy, year, xmlpath):
+    value = lambda key, info="": helper.get_value(name, energy, year, key, False, info)
+    defined = all(value(key) != helper._key_field_map[key][1] for key in ["CrossSection", "NEvents"])
+    return {
+        "sample": name,
+        "year": year,
+        "energy": energy,
+        "isMC": is_mc(helper, name, energy, year, xmlpath),
+        "xs": value("CrossSection")*value("BranchingRatio") if defined else None,
+        "kFactor": value("kFactor"),
+        "nevt": value("NEvents") if value("NEvents") != helper._key_field_map["NEvents"][1] else None,
+        "lumi": helper.get_lumi(name, energy, year) if defined else None,
+        "xml": xmlpath,
+        "das_name": value("XMLname", "Source") or None,
+    }
+
+
+def iter_fileset(samples, year, helper=None, prefix=None, tree=TREE_NAME, entries=None, step_size=STEP_SIZE, dataset="{sample}_{year}",
+                 base_path=UHH2DATASETS_PATH, skipped=None):
+    """Yield (dataset, {"files": ..., "metadata": ...}) pairs of a coffea fileset for the samples in a period, one dataset at a time
+
+    The files are the active ntuples of the dataset XML of each sample, the metadata contains the sample, year, energy, isMC (False for XMLs
+    below the data directory), xs (including the branching ratio), kFactor, nevt, lumi, XML path and DAS name (None where not set). A combined period (e.g. "UL16") yields the datasets of
+    each member period.
+    Without entries the files map each path to the tree name. With entries they are given in the preprocessed form
+    {path: {"object_path": tree, "steps": [[start, stop], ...], "num_entries": n}}.
+
+    Args:
+        samples (:obj:`list` of :obj:`str` or `str`): The samples, or a shell-style pattern (e.g. "TTTo*")
+        year (`str`): The period
+        helper (:obj:`MCSampleValuesHelper`): The helper providing the values. A default MCSampleValuesHelper if None.
+        prefix (`str`): Replace everything in front of /store/ of the paths by this prefix (e.g. an xrootd redirector)
+        tree (`str`): The tree name
+        entries: Number of entries of the files, used to compute the steps. Either a dictionary or function mapping the (not rewritten) path
+            to the number of entries (see uproot_entries), or "estimate" to split the NumberEntries trailer of the XML evenly among the files.
+            As the XMLs have no counts per file, estimated files keep "steps" and "num_entries" None (coffea still has to preprocess them)
+            and carry the estimate as "estimated_entries", and the metadata of their dataset has "entries_estimated". Files of XMLs without
+            trailer get no steps either.
+        step_size (`int`): Maximum number of entries per step
+        dataset (`str`): Template of the dataset names, formatted with sample and year
+        base_path (`str`): The UHH2-datasets directory
+        skipped (:obj:`list`): If given, (sample, year, reason) tuples of the samples without (existing) XML are appended
+
+    Example:
+        fileset = dict(iter_fileset("TTTo*", "UL18", prefix="root://xrootd-cms.infn.it/", entries="estimate"))
+    """
+    helper = MCSampleValuesHelper() if helper is None else helper
+    if isinstance(samples, str):
+        samples = helper.get_samples(samples)
+    for member in (periods.members(year) or [year]):
+        energy = periods.get(member)["energy"]
+        for name in samples:
+            xmlpath = helper.get_value(name, energy, member, "XMLname")
+            if xmlpath == "" or not os.path.isfile(os.path.join(base_path, xmlpath)):
+                if skipped is not None:
+                    skipped.append((name, member, "no XML" if xmlpath == "" else "missing XML " + xmlpath))
+                continue
+            paths = list(iter_ntuple_paths(xmlpath, base_path))
+            metadata = _metadata(helper, name, energy, member, xmlpath)
+            if entries is None:
+                files = {rewrite_path(path, prefix): tree for path in paths}
+            else:
+                if entries == "estimate":
+                    counts = _estimate_entries(xmlpath, paths, base_path)
+                    if counts is not None:
+                        metadata["entries_estimated"] = True
+                else:
+                    counts = [entries[path] if isinstance(entries, dict) else entries(path) for path in paths]
+                if counts is None:
+                    files = {rewrite_path(path, prefix): {"object_path": tree, "steps": None, "num_entries": None} for path in paths}
+                elif entries == "estimate":
+                    files = {rewrite_path(path, prefix): {"object_path": tree, "steps": None, "num_entries": None, "estimated_entries": count}
+                             for path, count in zip(paths, counts)}
+                else:
+                    files = {rewrite_path(path, prefix): {"object_path": tree, "steps": make_steps(count, step_size), "num_entries": count}
+                             for path, count in zip(paths, counts)}
+            yield dataset.format(sample=name, year=member), {"files": files, "metadata": metadata}
+
+
+def write_fileset(outfile, samples, year, **kwargs):
+    """Stream the fileset of iter_fileset as JSON object into a file object, one dataset at a time, and return the number of datasets and files
+
+    Further arguments are passed to iter_fileset.
+    """
+    n_datasets, n_files = 0, 0
+    outfile.write("{")
+    for name, entry in iter_fileset(samples, year, **kwargs):
+        outfile.write(("," if n_datasets > 0 else "") + "\n" + json.dumps(name) + ": " + json.dumps(entry))
+        n_datasets += 1
+        n_files += len(entry["files"])
+    outfile.write("\n}\n")
+    return n_datasets, n_files
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Write a coffea fileset (JSON) of samples and their dataset XMLs.")
+
+    parser.add_argument("year", help="the period, e.g. UL18 or UL16.")
+    parser.add_argument("samples", nargs="+", help="sample names or shell-style patterns, e.g. TTTo*.")
+    parser.add_argument("--output", default=None, help="JSON file to write the fileset to (stdout if not given).")
+    parser.add_argument("--prefix", default=None, help="replace everything in front of /store/ by this prefix, e.g. root://xrootd-cms.infn.it/.")
+    parser.add_argument("--tree", default=TREE_NAME, help="the tree name.")
+    parser.add_argument("--chunks", choices=["estimate", "uproot"], default=None, help="compute the steps by reading the files with uproot, or only attach estimated entries per file.")
+    parser.add_argument("--step-size", type=int, default=STEP_SIZE, help="maximum number of entries per step.")
+    parser.add_argument("--signal", nargs="+", default=[], help="signal dictionaries from xsec_signal_dicts to use as well.")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    try:
+        helper = MCSampleValuesHelper()
+        for signal in args.signal:
+            helper.add_signal(signal)
+        samples = list(dict.fromkeys(name for pattern in args.samples for name in helper.get_samples(pattern)))
+        entries = uproot_entries(args.tree) if args.chunks == "uproot" else args.chunks
+        skipped = []
+        outfile = sys.stdout if args.output is None else open(args.output, "w")
+        try:
+            n_datasets, n_files = write_fileset(outfile, samples, args.year, helper=helper, prefix=args.prefix, tree=args.tree, entries=entries,
+                                                step_size=args.step_size, skipped=skipped)
+        finally:
+            if outfile is not sys.stdout:
+                outfile.close()
+        for name, year, reason in skipped:
+            print("Skipped " + name + " (" + year + "): " + reason, file=sys.stderr)
+        print("Wrote " + str(n_datasets) + " datasets with " + str(n_files) + " files", file=sys.stderr)
+    except (ImportError, KeyError, ValueError, OSError) as error:
+        if args.throw: raise
+        print(error, file=sys.stderr)
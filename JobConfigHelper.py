@@ -0,0 +1,134 @@
+import math
+import os
+import sys
+
+from CrossSectionHelper import MCSampleValuesHelper, CMSSW_BASE, UHH2DATASETS_PATH, periods
+
+
+# Location of the dataset XMLs referenced by the entities, as seen by the SFrame jobs
+XML_BASE = f"{CMSSW_BASE}/src/UHH2/common/UHH2-datasets" if CMSSW_BASE is not None else UHH2DATASETS_PATH
+
+ENTITY_TEMPLATE = '<!ENTITY {entity} SYSTEM "{path}">'
+INPUT_DATA_TEMPLATE = ('<InputData Lumi="{lumi}" NEventsMax="{nevents_max}" Type="{type}" Version="{version}" Cacheable="{cacheable}">'
+                       ' &{entity}; <InputTree Name="AnalysisTree"/> <OutputTree Name="AnalysisTree"/> </InputData>')
+
+
+def _lumis(helper, samples, year, kFactor, Corrections):
+    """Return the lumis of the samples in year (None where undefined), in one gather if a columnar helper has arrays for year"""
+    if hasattr(helper, "get_lumi_array") and year in helper.period_ids:
+        lumis = helper.get_lumi_array(kFactor, Corrections)[helper.get_sample_ids(samples), helper.get_period_id(year)]
+        return [None if math.isnan(lumi) else lumi for lumi in lumis.tolist()]
+    energy = periods.get(year)["energy"]
+    defined = lambda name: all(helper.get_value(name, energy, year, key) != helper._key_field_map[key][1] for key in ["CrossSection", "NEvents"])
+    return [helper.get_lumi(name, energy, year, kFactor, Corrections) if defined(name) else None for name in samples]
+
+
+def iter_input_data(samples, year, helper=None, kFactor=False, Corrections=False, xml_base=XML_BASE, version="{sample}_{year}",
+                    data_type="MC", nevents_max=-1, cacheable=False, skipped=None):
+    """Yield (entity declaration, InputData block) pairs of SFrame job configurations for the samples in a period
+
+    The lumis of all samples are computed in one pass (a single array gather for a ColumnarMCSampleValuesHelper), the blocks are then
+    formatted one by one. The entity of a block is named like its Version and refers to the dataset XML of the sample.
+    A combined period (e.g. "UL16") yields the blocks of each member period. Samples without lumi (e.g. data) are skipped for data_type "MC",
+    for other types (e.g. "DATA") their blocks are written with Lumi="0".
+
+    Args:
+        samples (:obj:`list` of :obj:`str` or `str`): The samples, or a shell-style pattern (e.g. "TTTo*")
+        year (`str`): The period
+        helper (:obj:`MCSampleValuesHelper`): The helper providing the values. A ColumnarMCSampleValuesHelper if None (an MCSampleValuesHelper without NumPy).
+        kFactor, Corrections (`bool`): Apply the kFactors and corrections to the lumi
+        xml_base (`str`): The directory the XML paths of the entities are relative to
+        version (`str`): Template of the Version (and entity) name, formatted with sample and year
+        data_type, nevents_max, cacheable: The Type, NEventsMax and Cacheable attributes
+        skipped (:obj:`list`): If given, (sample, year, reason) tuples of the samples without XML or lumi are appended
+
+    Example:
+        for entity, block in iter_input_data("TTTo*", "UL18"):
+            print(block)
+    """
+    if helper is None:
+        helper = _default_helper()
+    if isinstance(samples, str):
+        samples = helper.get_samples(samples)
+    for member in (periods.members(year) or [year]):
+        energy = periods.get(member)["energy"]
+        for name, lumi in zip(samples, _lumis(helper, samples, member, kFactor, Corrections)):
+            xmlpath = helper.get_value(name, energy, member, "XMLname")
+            if xmlpath == "" or (lumi is None and data_type == "MC"):
+                if skipped is not None:
+                    skipped.append((name, member, "no XML" if xmlpath == "" else "no lumi"))
+                continue
+            entity = version.format(sample=name, year=member)
+            yield (ENTITY_TEMPLATE.format(entity=entity, path=os.path.join(xml_base, xmlpath)),
+                   INPUT_DATA_TEMPLATE.format(lumi="0" if lumi is None else repr(lumi), nevents_max=nevents_max, type=data_type, version=entity, entity=entity, cacheable=cacheable))
+
+
+def write_input_data(outfile, samples, year, entities_file=None, **kwargs):
+    """Stream the InputData blocks of iter_input_data into a file object and return the number of blocks
+
+    The entity declarations (to be placed in the DOCTYPE of the job configuration) are written to entities_file, or at the top of
+    outfile if None. Further arguments are passed to iter_input_data.
+    """
+    blocks = []
+    for entity, block in iter_input_data(samples, year, **kwargs):
+        (outfile if entities_file is None else entities_file).write(entity+"\n")
+        if entities_file is None:
+            # The blocks follow all entities, so keep them until the end
+            blocks.append(block)
+        else:
+            outfile.write(block+"\n")
+            blocks.append(None)
+    if entities_file is None:
+        outfile.write("\n")
+        outfile.writelines(block+"\n" for block in blocks)
+    return len(blocks)
+
+
+def _default_helper():
+    try:
+        from ColumnarValuesHelper import ColumnarMCSampleValuesHelper
+        return ColumnarMCSampleValuesHelper()
+    except ImportError:
+        return MCSampleValuesHelper()
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Write the SFrame InputData blocks (and XML entities) of samples with precomputed lumis.")
+
+    parser.add_argument("year", help="the period, e.g. UL18 or UL16.")
+    parser.add_argument("samples", nargs="+", help="sample names or shell-style patterns, e.g. TTTo*.")
+    parser.add_argument("--output", default=None, help="file to write the blocks to (stdout if not given).")
+    parser.add_argument("--entities", default=None, help="file to write the entity declarations to (together with the blocks if not given).")
+    parser.add_argument("--signal", nargs="+", default=[], help="signal dictionaries from xsec_signal_dicts to use as well.")
+    parser.add_argument("--xml-base", default=XML_BASE, help="directory the XML paths of the entities are relative to.")
+    parser.add_argument("--version", default="{sample}_{year}", help="template of the Version names.")
+    parser.add_argument("--kFactor", action="store_true", help="apply the kFactors to the lumi.")
+    parser.add_argument("--corrections", action="store_true", help="apply the corrections to the lumi.")
+    parser.add_argument("--type", default="MC", help="the Type of the blocks, e.g. DATA (written with Lumi=\"0\").")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    try:
+        helper = _default_helper()
+        for signal in args.signal:
+            helper.add_signal(signal)
+        samples = list(dict.fromkeys(name for pattern in args.samples for name in helper.get_samples(pattern)))
+        skipped = []
+        kwargs = dict(helper=helper, kFactor=args.kFactor, Corrections=args.corrections, xml_base=args.xml_base, version=args.version,
+                      data_type=args.type, skipped=skipped)
+        outfile = sys.stdout if args.output is None else open(args.output, "w")
+        entities_file = None if args.entities is None else open(args.entities, "w")
+        try:
+            n_blocks = write_input_data(outfile, samples, args.year, entities_file, **kwargs)
+        finally:
+            for f in [outfile, entities_file]:
+                if f is not None and f is not sys.stdout:
+                    f.close()
+        for name, year, reason in skipped:
+            print("Skipped " + name + " (" + year + "): " + reason, file=sys.stderr)
+        print("Wrote " + str(n_blocks) + " InputData blocks", file=sys.stderr)
+    except (KeyError, ValueError) as error:
+        if args.throw: raise
+        print(error, file=sys.stderr)
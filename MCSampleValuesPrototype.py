@@ -0,0 +1,389 @@
+from collections import namedtuple
+from collections.abc import Mapping
+
+
+def namedtuple_with_defaults(typename, field_names, default_values=()):
+    """Compatibility wrapper creating a namedtuple record type with defaults, as used for the records before SparseValues
+
+    Such records can still be passed to the helpers (e.g. via extra_dicts), their fields are read with record_items.
+    New records should use the types of MCSampleValuesHelperPrototype (XSValues, NEventsValues, ...).
+    """
+    T = namedtuple(typename, field_names)
+    T.__new__.__defaults__ = (None,) * len(T._fields)
+    if isinstance(default_values, Mapping):
+        prototype = T(**default_values)
+    else:
+        prototype = T(*default_values)
+    T.__new__.__defaults__ = tuple(prototype)
+    return T
+
+
+class PeriodRegistry():
+    """Registry of the periods (years/campaigns) and energies values can be stored for
+
+    Every registered period allows the fields "<prefix>_<period>", "<prefix>Source_<period>", "<prefix>Up_<period>" and "<prefix>Down_<period>" in all value records.
+    Records only store the fields which are set, so registering further periods does not cost memory for existing samples.
+    Combined periods (e.g. "UL16") are aggregations over their member periods. They have no fields of their own, their values are computed
+    by the helper from the members. Periods registered with default=True are the ones iterated by default, e.g. by print_database
+    and the columnar helper.
+
+    Example:
+        periods.register("2024", kind="year", energy="13p6TeV", campaigns=["Run3_140X_v1"])
+        periods.register("UL1718", kind="combined", members=["UL17", "UL18"])
+    """
+
+    def __init__(self, entries=()):
+        self._periods = {}
+        self._listeners = []
+        # Names of the combined periods, checked by every get_value call
+        self.combined_names = frozenset()
+        for entry in entries:
+            self.register(**entry)
+
+    def register(self, name, kind="year", energy=None, campaigns=(), members=(), default=False):
+        if not kind in ["year", "energy", "combined"]:
+            raise ValueError("ERROR PeriodRegistry::Unknown kind \"" + str(kind) + "\", use \"year\", \"energy\" or \"combined\"")
+        if kind == "combined" and (len(members) == 0 or any(self._periods.get(member, {}).get("kind") != "year" for member in members)):
+            raise ValueError("ERROR PeriodRegistry::The members " + str(list(members)) + " of the combined period \"" + str(name) + "\" have to be registered years")
+        self._periods[name] = {"kind": kind, "energy": energy, "campaigns": tuple(campaigns), "members": tuple(members), "default": default}
+        self.combined_names = frozenset(self.combined())
+        for listener in self._listeners:
+            listener(self)
+
+    def subscribe(self, listener):
+        """Call listener(registry) now and whenever a period is registered"""
+        self._listeners.append(listener)
+        listener(self)
+
+    def __contains__(self, name):
+        return name in self._periods
+
+    def __iter__(self):
+        return iter(self._periods)
+
+    def get(self, name):
+        return self._periods[name]
+
+    def years(self, default=False):
+        """Return the registered years, only the default ones if default is True"""
+        return [name for name, period in self._periods.items() if period["kind"] == "year" and (period["default"] or not default)]
+
+    def energies(self, default=False):
+        """Return the registered energies, only the default ones if default is True"""
+        return [name for name, period in self._periods.items() if period["kind"] == "energy" and (period["default"] or not default)]
+
+    def combined(self):
+        return [name for name, period in self._periods.items() if period["kind"] == "combined"]
+
+    def members(self, name):
+        """Return the member periods of a combined period, or None if name is not a combined period"""
+        period = self._periods.get(name)
+        return period["members"] if period is not None and period["kind"] == "combined" else None
+
+
+periods = PeriodRegistry([
+    {"name": "UL16preVFP",  "energy": "13TeV",   "campaigns": ["RunII_106X_v1", "RunII_106X_v2"], "default": True},
+    {"name": "UL16postVFP", "energy": "13TeV",   "campaigns": ["RunII_106X_v1", "RunII_106X_v2"], "default": True},
+    {"name": "UL17",        "energy": "13TeV",   "campaigns": ["RunII_106X_v1", "RunII_106X_v2"], "default": True},
+    {"name": "UL18",        "energy": "13TeV",   "campaigns": ["RunII_106X_v1", "RunII_106X_v2"], "default": True},
+    {"name": "2016v2",      "energy": "13TeV",   "campaigns": ["RunII_102X_v1", "RunII_102X_v2"]},
+    {"name": "2016v3",      "energy": "13TeV",   "campaigns": ["RunII_102X_v1", "RunII_102X_v2"]},
+    {"name": "2017",        "energy": "13TeV",   "campaigns": ["RunII_102X_v1", "RunII_102X_v2"]},
+    {"name": "2018",        "energy": "13TeV",   "campaigns": ["RunII_102X_v1", "RunII_102X_v2"]},
+    {"name": "2022",        "energy": "13p6TeV", "campaigns": ["Run3_124X_v1", "Run3_126X_v1"]},
+    {"name": "13TeV",       "kind": "energy", "default": True},
+    {"name": "13p6TeV",     "kind": "energy"},
+    {"name": "UL16",        "kind": "combined", "members": ["UL16preVFP", "UL16postVFP"]},
+    {"name": "RunII",       "kind": "combined", "members": ["UL16preVFP", "UL16postVFP", "UL17", "UL18"]},
+])
+
+
+class SparseValues():
+    """Base class of the value records: behaves like the former namedtuples, but only stores the fields which are set
+
+    The defaults of all fields of the registered periods are class attributes ("" for the Source fields), so unset fields cost no memory
+    and are resolved by the normal attribute lookup. Fields of unregistered periods raise like unknown namedtuple fields do.
+    Besides the nominal value and its source, the optional "<prefix>Up_<period>" and "<prefix>Down_<period>" fields hold the values
+    varied up and down by their uncertainty (absolute values, not shifts), e.g. XSValues(XSec_13TeV=831.76, XSecUp_13TeV=877.6, XSecDown_13TeV=801.7).
+    They can be retrieved with get_value(..., info="Up").
+    Like the former namedtuples, records can also be constructed from positional values, in the order (value, source) per default year
+    followed by the default energies, e.g. XSValues(*[-1.0, ""]*4 + [831.76, "NNLO"]).
+    """
+
+    _prefix = ""
+    _default = None
+    _modes = ()
+    _fields = ()
+    _positional_fields = ()
+
+    def __init__(self, *args, **values):
+        if len(args) > len(self._positional_fields):
+            raise TypeError(type(self).__name__ + " takes at most " + str(len(self._positional_fields)) + " positional arguments (" + str(len(args)) + " given)")
+        for field, value in zip(self._positional_fields, args):
+            if field in values:
+                raise TypeError(type(self).__name__ + " got multiple values for argument '" + field + "'")
+            # Positional values equal to the default are not stored, like unset keyword fields
+            if value != getattr(type(self), field):
+                values[field] = value
+        for field in values:
+            if not field in self._field_set:
+                raise TypeError(type(self).__name__ + " got an unexpected keyword argument '" + str(field) + "'")
+        self.__dict__.update(values)
+
+    @classmethod
+    def _update_fields(cls, registry):
+        cls._fields = tuple(cls._prefix+mode+"_"+period for period in registry.years()+registry.energies() for mode in ("", "Source", "Up", "Down")+cls._modes)
+        cls._field_set = frozenset(cls._fields)
+        # The field order of the former namedtuples
+        cls._positional_fields = tuple(cls._prefix+mode+"_"+period for period in registry.years(default=True)+registry.energies(default=True) for mode in ("", "Source"))
+        for field in cls._fields:
+            setattr(cls, field, "" if field.startswith(cls._prefix+"Source_") else cls._default)
+
+    def __setattr__(self, field, value):
+        raise AttributeError("can't set attribute")
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        return type(self) == type(other) and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash((type(self), tuple(self)))
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + ", ".join(field+"="+repr(value) for field, value in self.__dict__.items()) + ")"
+
+    def __reduce__(self):
+        return (_rebuild_values, (type(self).__name__, self.__dict__))
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+    def _items(self):
+        """Return the (field, value) pairs which are set"""
+        return self.__dict__.items()
+
+    def _replace(self, **values):
+        return type(self)(**{**self.__dict__, **values})
+
+
+def record_items(record):
+    """Return the (field, value) pairs set in a value record
+
+    Besides SparseValues this supports namedtuple records (e.g. of namedtuple_with_defaults), whose fields equal to their defaults count as unset.
+    """
+    if isinstance(record, SparseValues):
+        return record._items()
+    defaults = type(record).__new__.__defaults__ or ()
+    defaults = dict(zip(record._fields[len(record._fields)-len(defaults):], defaults))
+    return [(field, value) for field, value in record._asdict().items() if not (field in defaults and value == defaults[field])]
+
+
+def sparse_values_type(typename, prefix, default, registry=periods, modes=()):
+    """Create a SparseValues record type for fields "<prefix>_<period>" with the given default, following the periods of the registry
+
+    Additional field kinds "<prefix><mode>_<period>" (with the same default) can be allowed with modes.
+    """
+    cls = type(typename, (SparseValues,), {"_prefix": prefix, "_default": default, "_modes": tuple(modes), "__module__": __name__})
+    registry.subscribe(cls._update_fields)
+    return cls
+
+
+def _rebuild_values(typename, values):
+    return globals()[typename](**values)
+
+
+class MCSampleValuesHelperPrototype():
+    """
+    Prototype class for MCSampleValuesHelper
+    """
+
+    _key_field_map = {
+        "CrossSection"   : ("XSec",-1.0),
+        "NEvents"        : ("NEVT",-1.0),
+        "BranchingRatio" : ("BRat",1.0),
+        "kFactor"        : ("kFac",1.0),
+        "Correction"     : ("Corr",1.0),
+        "XMLname"        : ("Xml",""),
+        "NEventsRaw"     : ("NRaw",-1.0),
+        "SumOfWeights"   : ("SumW",None),
+    }
+    XSValues      = sparse_values_type("XSValues",      *_key_field_map["CrossSection"])
+    # Counts of samples consisting of several parts (extensions or versions) are given as sum, e.g. NEVT_UL16preVFP=2789243+158145722,
+    # with the parts kept as NEVTParts_UL16preVFP=(2789243, 158145722) in the order of the alternatives of the DAS name
+    NEventsValues = sparse_values_type("NEventsValues", *_key_field_map["NEvents"], modes=["Parts"])
+    BRValues      = sparse_values_type("BRValues",      *_key_field_map["BranchingRatio"])
+    kFactorValues = sparse_values_type("kFactorValues", *_key_field_map["kFactor"])
+    CorrValues    = sparse_values_type("CorrValues",    *_key_field_map["Correction"])
+    XMLValues     = sparse_values_type("XMLValues",     *_key_field_map["XMLname"])
+    # Raw number of entries (Method=fast) and signed sum of generator weights (Method=weights) from the trailers of the XMLs.
+    # The sum of weights can be negative (e.g. interference samples), hence None marks a missing value.
+    NEventsRawValues   = sparse_values_type("NEventsRawValues",   *_key_field_map["NEventsRaw"])
+    SumOfWeightsValues = sparse_values_type("SumOfWeightsValues", *_key_field_map["SumOfWeights"])
+
+    _key_values_map = {
+        "CrossSection"   : XSValues,
+        "NEvents"        : NEventsValues,
+        "BranchingRatio" : BRValues,
+        "kFactor"        : kFactorValues,
+        "Correction"     : CorrValues,
+        "XMLname"        : XMLValues,
+        "NEventsRaw"     : NEventsRawValues,
+        "SumOfWeights"   : SumOfWeightsValues,
+    }
+    # Keys whose values are summed for combined periods
+    _additive_keys = ["NEvents", "NEventsRaw", "SumOfWeights"]
+
+    # The lookups below only depend on get_value, which the helpers implement for their storage of the values
+
+    def _get_combined_value(self, name, energy, year, key, strict, info):
+        """Return the value of a combined period, aggregated from the values of its member periods
+
+        Event counts (NEvents, NEventsRaw, SumOfWeights and their variations) are summed over the member periods and are missing (i.e. the default)
+        if missing for any member. Their parts (e.g. NEVTParts) are concatenated in the order of the members, a member without parts contributing
+        its total. All other values have to agree between the members, otherwise a ValueError is raised.
+        """
+        members = periods.members(year)
+        values = [self.get_value(name, energy, member, key, strict, info) for member in members]
+        default = self._key_field_map[key][1]
+        if key in self._additive_keys and info in ["", "Up", "Down"]:
+            return default if any(v is None or v == default for v in values) else sum(values)
+        if key in self._additive_keys and info == "Parts":
+            totals = [self.get_value(name, energy, member, key, strict) for member in members]
+            if all(v == default for v in values) or any(total is None or total == default for total in totals):
+                return default
+            return tuple(part for v, total in zip(values, totals) for part in (v if v != default else (total,)))
+        if all(v == values[0] for v in values):
+            return values[0]
+        raise ValueError("ERROR MCSampleValuesHelper::The " + str(key) + " values of process \"" + str(name) + "\" differ between the periods of \"" + str(year) + "\": " + str(dict(zip(members, values))))
+
+    def get_xs(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "CrossSection", True, info)
+
+    def get_nevt(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "NEvents", True, info)
+
+    def get_br(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "BranchingRatio", False, info)
+
+    def get_kfactor(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "kFactor", False, info)
+
+    def get_corr(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "Correction", False, info)
+
+    def get_xml(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "XMLname", False, info)
+
+    def get_nevt_raw(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "NEventsRaw", False, info)
+
+    def get_sumw(self, name, energy, year, info=""):
+        return self.get_value(name, energy, year, "SumOfWeights", False, info)
+
+    def get_lumi(self, name, energy, year, kFactor=False, Corrections=False):
+        """Return the lumi of a MC sample, i.e. NEvents/(CrossSection*BranchingRatio[*kFactor][*Correction])
+
+        The lumi of a combined period (e.g. "UL16") is the sum of the lumis of its member periods.
+        """
+        if year in periods.combined_names and self.get_nevt(name, energy, year) != self._key_field_map["NEvents"][1]:
+            # The effective lumi of a combined period is the sum of the lumis of its members, which also holds if e.g. the cross sections differ
+            return sum(self.get_lumi(name, energy, member, kFactor, Corrections) for member in periods.members(year))
+        xsec = self.get_xs(name, energy, year)
+        xsec *= self.get_br(name, energy, year)
+        if kFactor: xsec *= self.get_kfactor(name, energy, year)
+        if Corrections: xsec *= self.get_corr(name, energy, year)
+        return abs(self.get_nevt(name, energy, year))/xsec
+
+
+# The record types are created inside the prototype class, but are also needed at module level for pickling
+XSValues      = MCSampleValuesHelperPrototype.XSValues
+NEventsValues = MCSampleValuesHelperPrototype.NEventsValues
+BRValues      = MCSampleValuesHelperPrototype.BRValues
+kFactorValues = MCSampleValuesHelperPrototype.kFactorValues
+CorrValues    = MCSampleValuesHelperPrototype.CorrValues
+XMLValues     = MCSampleValuesHelperPrototype.XMLValues
+NEventsRawValues   = MCSampleValuesHelperPrototype.NEventsRawValues
+SumOfWeightsValues = MCSampleValuesHelperPrototype.SumOfWeightsValues
+
+
+
+class SignalGrid(Mapping):
+    """Dictionary of signal samples defined on a grid of parameter points (e.g. masses), materialized on demand.
+
+    Instead of spelling out every entry, a grid is defined by a name template, the list of points, the values that differ per point,
+    and values or string templates common to all points. An entry is only built (and then cached) when its name is looked up,
+    while the names and points can be enumerated without building any entry.
+
+    Args:
+        name_template (`str`): Sample name with one "{parameter}" placeholder per parameter, e.g. "AToZHToLLTTbar_MA-{MA}_MH-{MH}"
+        parameters (:obj:`tuple` of :obj:`str`): The parameter names, in the order used for the points
+        points (:obj:`dict`): Maps each point (tuple of parameter values) to the tuple of its per-point values
+        point_fields (:obj:`dict` of :obj:`list`): Maps each key (e.g. "NEvents") to the fields filled by the per-point values, in order
+        common (:obj:`dict` of :obj:`dict`): Values identical for all points, e.g. {"CrossSection": {"XSec_13TeV": 1}}
+        templates (:obj:`dict` of :obj:`dict`): Like common, but the values are formatted with the parameters of the point
+        overrides (:obj:`dict`): Maps points to {key: {field: value}} dictionaries taking precedence over all of the above
+
+    Example:
+        grid = SignalGrid("X_M-{M}", ("M",), {(1000,): (50000,)}, {"NEvents": ["NEVT_UL18"]},
+                          common={"CrossSection": {"XSec_13TeV": 1}}, templates={"XMLname": {"Xml_UL18": "RunII_106X_v2/BSM/UL18/X_M-{M}.xml"}})
+        grid["X_M-1000"]["NEvents"].NEVT_UL18
+        grid.get_parameters("X_M-1000")
+    """
+
+    def __init__(self, name_template, parameters, points, point_fields, common=None, templates=None, overrides=None):
+        self.name_template = name_template
+        self.parameters = tuple(parameters)
+        self._points = points
+        self.point_fields = point_fields
+        self.common = {} if common is None else common
+        self.templates = {} if templates is None else templates
+        self.overrides = {} if overrides is None else overrides
+        self._names = {self.get_name(point): point for point in points}
+        self._entries = {}
+
+    def get_name(self, point):
+        return self.name_template.format(**dict(zip(self.parameters, point)))
+
+    def get_point(self, name):
+        return self._names[name]
+
+    def get_parameters(self, name):
+        """Return the parameters of a sample as dictionary, e.g. {"MA": 1000, "MH": 330}"""
+        return dict(zip(self.parameters, self._names[name]))
+
+    def points(self):
+        return list(self._points)
+
+    def _build(self, point):
+        fields = {}
+        for key, values in self.common.items():
+            fields.setdefault(key, {}).update(values)
+        parameters = dict(zip(self.parameters, point))
+        for key, values in self.templates.items():
+            fields.setdefault(key, {}).update({field: template.format(**parameters) for field, template in values.items()})
+        point_values = iter(self._points[point])
+        for key, names in self.point_fields.items():
+            fields.setdefault(key, {}).update(zip(names, point_values))
+        for key, values in self.overrides.get(point, {}).items():
+            fields.setdefault(key, {}).update(values)
+        key_values_map = MCSampleValuesHelperPrototype._key_values_map
+        return {key: key_values_map[key](**fields[key]) for key in key_values_map if key in fields}
+
+    def __getitem__(self, name):
+        if not name in self._entries:
+            self._entries[name] = self._build(self._names[name])
+        return self._entries[name]
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
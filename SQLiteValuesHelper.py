@@ -0,0 +1,210 @@
+from collections.abc import Mapping
+import fnmatch
+import functools
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from CrossSectionHelper import MCSampleValuesHelper, MCSampleValuesHelperPrototype, UHH2DATASETS_PATH, periods, record_items
+
+
+SQLITE_PATH = os.path.join(UHH2DATASETS_PATH, "sample_values.sqlite")
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE samples (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, origin TEXT NOT NULL);
+CREATE TABLE vals (
+    sample_id INTEGER NOT NULL REFERENCES samples(id),
+    key TEXT NOT NULL,
+    info TEXT NOT NULL,
+    period TEXT NOT NULL,
+    value,
+    PRIMARY KEY (sample_id, key, info, period)
+) WITHOUT ROWID;
+CREATE INDEX vals_by_key ON vals (key, info, period, sample_id);
+CREATE VIEW sample_values AS SELECT samples.name, samples.origin, vals.key, vals.info, vals.period, vals.value FROM vals JOIN samples ON samples.id = vals.sample_id;
+"""
+
+
+def _split_field(key, field):
+    """Split a record field (e.g. "XSecSource_13TeV") into the info ("Source") and the period ("13TeV")"""
+    info, _, period = field[len(MCSampleValuesHelperPrototype._key_field_map[key][0]):].partition("_")
+    return info, period
+
+
+def _encode(value):
+    return json.dumps(value) if isinstance(value, tuple) else value
+
+
+def _decode(info, value):
+    return tuple(json.loads(value)) if info == "Parts" and isinstance(value, str) else value
+
+
+def export_sqlite(filename=SQLITE_PATH, helper=None, signals=()):
+    """Write the database of a helper (and signal dictionaries) into an indexed SQLite database, replacing an existing file
+
+    Every field which is set in a value record is one row of the table vals (sample_id, key, info, period, value), with info being
+    "" for the value itself and e.g. "Source", "Up", "Down" or "Parts" (JSON encoded) otherwise. The view sample_values joins the sample names.
+    Signals imported into the helper (and the given signal dictionaries) are stored with their name as origin, all other samples as "database".
+
+    Args:
+        filename (`str`): The SQLite file
+        helper (:obj:`MCSampleValuesHelper`): The helper whose database is exported. A default MCSampleValuesHelper if None.
+        signals (:obj:`list` of :obj:`str`): Signal dictionaries from xsec_signal_dicts to export as well
+
+    Returns:
+        `int`: The number of exported samples
+    """
+    helper = MCSampleValuesHelper() if helper is None else helper
+    origins = helper.get_sample_origins()
+    values_dict = helper._MCSampleValuesHelper__values_dict
+    sources = [(signal, helper._import_signal(signal)) for signal in signals]
+    sources += [(origin, {name: values_dict[name] for name in origins if origins[name] == origin}) for origin in dict.fromkeys(origins.values())]
+
+    if os.path.exists(filename):
+        os.remove(filename)
+    connection = sqlite3.connect(filename)
+    try:
+        connection.executescript(SCHEMA)
+        connection.executemany("INSERT INTO meta VALUES (?, ?)", [("schema_version", str(SCHEMA_VERSION)), ("created", time.strftime("%Y-%m-%dT%H:%M:%S"))])
+        sample_ids = {}
+        for origin, source in sources:
+            for name in source:
+                if name in sample_ids:
+                    continue
+                sample_ids[name] = connection.execute("INSERT INTO samples (name, origin) VALUES (?, ?)", (name, origin)).lastrowid
+                connection.executemany("INSERT INTO vals VALUES (?, ?, ?, ?, ?)", [
+                    (sample_ids[name], key)+_split_field(key, field)+(_encode(value),)
+                    for key, record in source[name].items() for field, value in record_items(record)
+                ])
+        connection.commit()
+    finally:
+        connection.close()
+    return len(sample_ids)
+
+
+class SQLiteValues(Mapping):
+    """Read-only {sample: {key: value record}} view of an exported database, building the records of a sample on lookup"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __getitem__(self, name):
+        rows = self.connection.execute("SELECT vals.key, vals.info, vals.period, vals.value FROM vals JOIN samples ON samples.id = vals.sample_id WHERE samples.name = ?", (name,)).fetchall()
+        if len(rows) == 0 and self.connection.execute("SELECT 1 FROM samples WHERE name = ?", (name,)).fetchone() is None:
+            raise KeyError(name)
+        fields = {}
+        for key, info, period, value in rows:
+            fields.setdefault(key, {})[MCSampleValuesHelperPrototype._key_field_map[key][0]+info+"_"+period] = _decode(info, value)
+        return {key: MCSampleValuesHelperPrototype._key_values_map[key](**values) for key, values in fields.items()}
+
+    def __contains__(self, name):
+        return self.connection.execute("SELECT 1 FROM samples WHERE name = ?", (name,)).fetchone() is not None
+
+    def __iter__(self):
+        return (name for (name,) in self.connection.execute("SELECT name FROM samples ORDER BY name").fetchall())
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM samples").fetchone()[0]
+
+
+class SQLiteMCSampleValuesHelper(MCSampleValuesHelper):
+    """MCSampleValuesHelper serving the values from a SQLite database written by export_sqlite
+
+    get_value runs one indexed query with a constant statement (prepared once and reused from the statement cache of the connection) and
+    keeps the results in an in-process LRU cache. All other methods work on a lazy view of the database. The file is opened read-only.
+    Cross-sample questions can be answered with get_samples_missing or arbitrary SQL via query.
+
+    Args:
+        filename (`str`): The SQLite file
+        cache_size (`int`): Maximum number of cached get_value results
+
+    Example:
+        export_sqlite(signals=["AZHToLLTTBar"])
+        helper = SQLiteMCSampleValuesHelper()
+        helper.get_lumi("TTToSemiLeptonic", "13TeV", "UL18")
+        helper.get_samples_missing("kFactor", "UL17")
+    """
+
+    _value_statement = "SELECT vals.period, vals.value FROM vals WHERE vals.sample_id = ? AND vals.key = ? AND vals.info = ? AND vals.period IN (?, ?)"
+
+    def __init__(self, filename=SQLITE_PATH, cache_size=4096):
+        super().__init__()
+        if not os.path.isfile(filename):
+            raise ValueError("ERROR SQLiteMCSampleValuesHelper::No database \"" + str(filename) + "\", create it with export_sqlite")
+        self.connection = sqlite3.connect("file:" + filename + "?mode=ro", uri=True, check_same_thread=False)
+        schema_version = self.connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if schema_version is None or int(schema_version[0]) != SCHEMA_VERSION:
+            raise ValueError("ERROR SQLiteMCSampleValuesHelper::Database \"" + str(filename) + "\" has schema version " + str(schema_version) + ", expected " + str(SCHEMA_VERSION))
+        self._MCSampleValuesHelper__values_dict = SQLiteValues(self.connection)
+        self._init_kwargs = {"filename": filename, "cache_size": cache_size}
+        self._cached_value = functools.lru_cache(maxsize=cache_size)(self._query_value)
+        self.invalidate_caches()
+
+    def invalidate_caches(self):
+        super().invalidate_caches()
+        if hasattr(self, "_cached_value"):
+            self._cached_value.cache_clear()
+            self._sample_ids = dict(self.connection.execute("SELECT name, id FROM samples").fetchall())
+
+    def value_cache_info(self):
+        """Return the statistics of the get_value LRU cache"""
+        return self._cached_value.cache_info()
+
+    def query(self, sql, parameters=()):
+        """Run a read-only SQL query on the database and return all rows, e.g. query("SELECT name FROM sample_values WHERE key = 'CrossSection' AND value < 0")"""
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def get_samples_missing(self, key, year, energy="13TeV", pattern=None):
+        """Return the sorted samples without a value for key in year (neither for the year nor the energy), using the index on key and period"""
+        samples = [name for (name,) in self.connection.execute(
+            "SELECT name FROM samples WHERE NOT EXISTS (SELECT 1 FROM vals WHERE vals.key = ? AND vals.info = '' AND vals.period IN (?, ?) AND vals.sample_id = samples.id) ORDER BY name",
+            (key, energy, year)).fetchall()]
+        return samples if pattern is None else fnmatch.filter(samples, pattern)
+
+    def _query_value(self, name, energy, year, key, strict, info):
+        if not name in self._sample_ids:
+            raise KeyError("ERROR MCSampleValuesHelper::Unknown process \"" + str(name) + "\"")
+        sample_id = self._sample_ids[name]
+        values = dict(self.connection.execute(self._value_statement, (sample_id, key, info, energy, year)).fetchall())
+        default = self._key_field_map[key][1]
+        if len(values) == 0 and self.connection.execute("SELECT 1 FROM vals WHERE sample_id = ? AND key = ? LIMIT 1", (sample_id, key)).fetchone() is None:
+            if strict:
+                raise KeyError("ERROR MCSampleValuesHelper::The process \"" + str(name) + "\" does not contain a " + str(key) + " tuple")
+            return default
+        # Unset fields of a present record have the defaults of the record type, i.e. "" for the Source fields
+        field_default = "" if info == "Source" else default
+        value = _decode(info, values.get(energy, field_default))
+        return value if value != default else _decode(info, values.get(year, field_default))
+
+    def get_value(self, name, energy, year, key, strict=False, info=""):
+        if year in periods.combined_names:
+            return self._get_combined_value(name, energy, year, key, strict, info)
+        return self._cached_value(name, energy, year, key, strict, info)
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Export the CrossSectionHelper database to SQLite and query it.")
+
+    parser.add_argument("--export", action="store_true", help="write the database (and the --signal dictionaries) to the SQLite file.")
+    parser.add_argument("--output", default=SQLITE_PATH, help="the SQLite file.")
+    parser.add_argument("--signal", nargs="+", default=[], help="signal dictionaries from xsec_signal_dicts to export as well.")
+    parser.add_argument("--missing", nargs=2, metavar=("KEY", "YEAR"), help="print the samples without a value for KEY in YEAR.")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    if args.export:
+        print("Exported " + str(export_sqlite(args.output, signals=args.signal)) + " samples to " + args.output)
+
+    if args.missing is not None:
+        try:
+            for name in SQLiteMCSampleValuesHelper(args.output).get_samples_missing(*args.missing):
+                print(name)
+        except (KeyError, ValueError) as error:
+            if args.throw: raise
+            print(error, file=sys.stderr)
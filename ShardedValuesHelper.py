@@ -0,0 +1,245 @@
+from collections.abc import Mapping
+import fnmatch
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+
+# Only the prototype, such that lookups never execute the database in CrossSectionHelper.py
+from MCSampleValuesPrototype import MCSampleValuesHelperPrototype, periods, record_items
+
+
+UHH2DATASETS_PATH = os.path.dirname(os.path.abspath(__file__))
+SHARD_PATH = os.path.join(UHH2DATASETS_PATH, ".shards")
+DATABASE_FILE = os.path.join(UHH2DATASETS_PATH, "CrossSectionHelper.py")
+
+
+def _source_hash(filename=DATABASE_FILE):
+    with open(filename, "rb") as source:
+        return hashlib.sha1(source.read()).hexdigest()
+
+
+def sample_category(values):
+    """Return the category of a database entry, i.e. the directory of its XMLs below the campaign ("SM", "BSM" or "data"), "other" without XML"""
+    if "XMLname" in values:
+        for field, xmlpath in sorted(record_items(values["XMLname"])):
+            parts = xmlpath.split("/")
+            if field.startswith(MCSampleValuesHelperPrototype._key_field_map["XMLname"][0]+"_") and len(parts) > 2:
+                return parts[1]
+    return "other"
+
+
+def _split_records(values):
+    """Split the records of a database entry into {period: {key: record with the fields of that period}}"""
+    fields = {}
+    for key, record in values.items():
+        for field, value in record_items(record):
+            fields.setdefault(field.rpartition("_")[2], {}).setdefault(key, {})[field] = value
+    return {period: {key: MCSampleValuesHelperPrototype._key_values_map[key](**record_fields) for key, record_fields in keys.items()}
+            for period, keys in fields.items()}
+
+
+def build_shards(path=SHARD_PATH, helper=None):
+    """Write the database of a helper as one Python module per category and period (energies included) plus a manifest
+
+    A shard "<category>_<period>" (e.g. "SM_UL18") holds the fields of that period of all samples of the category. The manifest maps each
+    sample to its category, keys and the periods it has fields for, and records the hash of CrossSectionHelper.py the shards were built from.
+    Shards of a previous build which are not produced anymore are removed. Building (unlike reading) the shards executes CrossSectionHelper.py.
+
+    Returns:
+        `dict`: The number of samples per shard
+    """
+    if helper is None:
+        from CrossSectionHelper import MCSampleValuesHelper
+        helper = MCSampleValuesHelper()
+    values_dict = helper._MCSampleValuesHelper__values_dict
+    manifest = {"source_hash": _source_hash(), "samples": {}, "shards": {}}
+    shards = {}
+    for name in values_dict:
+        values = values_dict[name]
+        category = sample_category(values)
+        split = _split_records(values)
+        manifest["samples"][name] = {"category": category, "keys": list(values), "periods": sorted(split)}
+        for period, records in split.items():
+            shards.setdefault(category+"_"+period, []).append((name, records))
+
+    os.makedirs(path, exist_ok=True)
+    for shard, entries in shards.items():
+        with open(os.path.join(path, shard+".py.tmp"), "w") as shard_file:
+            shard_file.write("# Generated by ShardedValuesHelper.build_shards from CrossSectionHelper.py, do not edit\n")
+            shard_file.write("from MCSampleValuesPrototype import " + ", ".join(sorted({type(record).__name__ for _, records in entries for record in records.values()})) + "\n\n")
+            shard_file.write("values = {\n")
+            for name, records in entries:
+                shard_file.write("    " + repr(name) + " : {\n")
+                shard_file.writelines("        " + repr(key) + " : " + repr(record) + ",\n" for key, record in records.items())
+                shard_file.write("    },\n")
+            shard_file.write("}\n")
+        os.replace(os.path.join(path, shard+".py.tmp"), os.path.join(path, shard+".py"))
+        manifest["shards"][shard] = len(entries)
+    for filename in os.listdir(path):
+        if filename.endswith(".py") and not filename[:-len(".py")] in shards:
+            os.remove(os.path.join(path, filename))
+    with open(os.path.join(path, "manifest.json.tmp"), "w") as manifest_file:
+        json.dump(manifest, manifest_file, separators=(",", ":"))
+    os.replace(os.path.join(path, "manifest.json.tmp"), os.path.join(path, "manifest.json"))
+    return manifest["shards"]
+
+
+class ShardStore():
+    """The shards written by build_shards, importing each shard module on first access
+
+    Args:
+        path (`str`): The directory of the shards
+    """
+
+    def __init__(self, path=SHARD_PATH):
+        self.path = path
+        manifest_path = os.path.join(path, "manifest.json")
+        if not os.path.isfile(manifest_path):
+            raise ValueError("ERROR ShardStore::No shards in \"" + str(path) + "\", create them with build_shards")
+        with open(manifest_path) as manifest_file:
+            self.manifest = json.load(manifest_file)
+        self.samples = self.manifest["samples"]
+        self._shards = {}
+
+    def is_current(self):
+        """Return whether the shards were built from the current CrossSectionHelper.py"""
+        return self.manifest["source_hash"] == _source_hash()
+
+    def shard(self, category, period):
+        """Return the {sample: {key: value record}} dictionary of a shard, importing it on first use. Unknown shards are empty."""
+        shard = category+"_"+period
+        if not shard in self._shards:
+            if not shard in self.manifest["shards"]:
+                return {}
+            spec = importlib.util.spec_from_file_location("MCSampleValuesShard_"+shard, os.path.join(self.path, shard+".py"))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._shards[shard] = module.values
+        return self._shards[shard]
+
+    def loaded_shards(self):
+        """Return the names of the shards imported so far"""
+        return list(self._shards)
+
+    def record(self, name, key, period):
+        """Return the record of key with the fields of period of a sample, None if the sample has no such fields"""
+        return self.shard(self.samples[name]["category"], period).get(name, {}).get(key)
+
+    def values(self):
+        return ShardedValues(self)
+
+
+class ShardedValues(Mapping):
+    """Read-only {sample: {key: value record}} view of the shards, merging the shards of a sample on lookup (which imports all of them)"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, name):
+        sample = self.store.samples[name]
+        fields = {key: {} for key in sample["keys"]}
+        for period in sample["periods"]:
+            for key, record in self.store.shard(sample["category"], period)[name].items():
+                fields[key].update(record_items(record))
+        return {key: MCSampleValuesHelperPrototype._key_values_map[key](**values) for key, values in fields.items()}
+
+    def __contains__(self, name):
+        return name in self.store.samples
+
+    def __iter__(self):
+        return iter(self.store.samples)
+
+    def __len__(self):
+        return len(self.store.samples)
+
+
+_stores = {}
+
+
+class ShardedMCSampleValuesHelper(MCSampleValuesHelperPrototype):
+    """Helper serving the database from the shards written by build_shards, without executing CrossSectionHelper.py
+
+    get_value only imports the shards of the category of the sample and the requested energy and year, so e.g. a job only looking up UL18 SM
+    backgrounds never executes the shards of other periods, of data or of BSM samples, nor the full database. The lookups (get_xs, get_nevt,
+    get_lumi, combined periods, ...) are the ones of the prototype shared with MCSampleValuesHelper. Methods working on the whole database
+    (signals, DAS and XML indices, ...) are only provided by MCSampleValuesHelper. Helpers of the same shard directory share the imported shards.
+
+    Args:
+        path (`str`): The directory of the shards
+        check (`bool`): Raise a ValueError if the shards were built from another version of CrossSectionHelper.py
+
+    Example:
+        build_shards()
+        helper = ShardedMCSampleValuesHelper()
+        helper.get_lumi("TTToSemiLeptonic", "13TeV", "UL18")
+        helper.store.loaded_shards()  # ["SM_13TeV", "SM_UL18"]
+    """
+
+    def __init__(self, path=SHARD_PATH, check=True):
+        if not path in _stores:
+            _stores[path] = ShardStore(path)
+        self.store = _stores[path]
+        self.check = check
+        if check and not self.store.is_current():
+            raise ValueError("ERROR ShardedMCSampleValuesHelper::The shards in \"" + str(path) + "\" were built from another version of CrossSectionHelper.py, rebuild them with build_shards")
+
+    def __reduce__(self):
+        return (type(self), (self.store.path, self.check))
+
+    def get_value(self, name, energy, year, key, strict=False, info=""):
+        if year in periods.combined_names:
+            return self._get_combined_value(name, energy, year, key, strict, info)
+        if not name in self.store.samples:
+            raise KeyError("ERROR MCSampleValuesHelper::Unknown process \"" + str(name) + "\"")
+        if not key in self.store.samples[name]["keys"]:
+            if strict:
+                raise KeyError("ERROR MCSampleValuesHelper::The process \"" + str(name) + "\" does not contain a " + str(key) + " tuple")
+            return self._key_field_map[key][1]
+        # The fields of a period are only stored in its shard, unset fields resolve to the defaults of the record type
+        empty = self._key_values_map[key]()
+        field = self._key_field_map[key][0]+info+"_"
+        value = getattr(self.store.record(name, key, energy) or empty, field+energy)
+        if value != self._key_field_map[key][1]:
+            return value
+        return getattr(self.store.record(name, key, year) or empty, field+year)
+
+    def get_samples(self, pattern=None):
+        """Return the sorted list of sample names, optionally only those matching the shell-style pattern (e.g. "TTTo*")"""
+        samples = sorted(self.store.samples)
+        if pattern is not None:
+            samples = fnmatch.filter(samples, pattern)
+        return samples
+
+
+if(__name__ == "__main__"):
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Split the CrossSectionHelper database into lazily imported shards per category and period.")
+
+    parser.add_argument("--build", action="store_true", help="(re)build the shards from the current database.")
+    parser.add_argument("--path", default=SHARD_PATH, help="directory of the shards.")
+    parser.add_argument("--lumi", nargs=2, metavar=("SAMPLE", "YEAR"), action="append", default=[], help="print the lumi of a sample and the shards imported for it.")
+    parser.add_argument("--energy", default="13TeV", help="energy used by --lumi.")
+    parser.add_argument("--check-imports", action="store_true", help="check that the --lumi lookups did not execute CrossSectionHelper.py.")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    try:
+        if args.build:
+            shards = build_shards(args.path)
+            print("Wrote " + str(len(shards)) + " shards with " + str(sum(shards.values())) + " entries to " + args.path)
+        if len(args.lumi) > 0:
+            helper = ShardedMCSampleValuesHelper(args.path)
+        for sample, year in args.lumi:
+            start = time.perf_counter()
+            lumi = helper.get_lumi(sample, args.energy, year)
+            print(sample + " (" + year + "): " + str(lumi) + " in %.1f ms, imported shards: " % ((time.perf_counter()-start)*1e3) + ", ".join(helper.store.loaded_shards()))
+        if args.check_imports and "CrossSectionHelper" in sys.modules:
+            print("Error: The lookups executed CrossSectionHelper.py" + (" (imported by --build)" if args.build else ""), file=sys.stderr)
+            if args.throw: raise ValueError("ERROR ShardedMCSampleValuesHelper::CrossSectionHelper was imported by sharded lookups")
+    except (KeyError, ValueError) as error:
+        if args.throw: raise
+        print(error, file=sys.stderr)
@@ -0,0 +1,123 @@
+import re
+
+
+MASS_PARAMETER_PATTERN = re.compile(r"(?:^|_)(?P<parameter>M[A-Za-z]*)-?(?P<value>[0-9]+(?:p[0-9]+)?)(?=_|$)")
+
+
+def parse_mass_parameters(name):
+    """Return the mass parameters encoded in a signal sample name
+
+    Example:
+        parse_mass_parameters("AToZHToLLTTbar_MA-1000_MH-330") -> {"MA": 1000.0, "MH": 330.0}
+        parse_mass_parameters("ZprimeDMToTTbarResoIncl_MZp2500_Mchi1000_A1") -> {"MZp": 2500.0, "Mchi": 1000.0}
+    """
+    return {m.group("parameter"): float(m.group("value").replace("p", ".")) for m in MASS_PARAMETER_PATTERN.finditer(name)}
+
+
+class SignalMassGrid():
+    """Cross sections, number of events and lumis of a family of signal samples arranged on a grid of mass parameters
+
+    The samples are placed on the rectilinear grid spanned by the distinct values of each parameter; grid nodes without a sample are NaN.
+    The NumPy grids are built once per quantity and year and cached. Interpolation is multilinear (optionally in the logarithm of the value)
+    and evaluates arrays of query points in one call. Points outside the grid, or in cells with a missing corner, yield NaN.
+
+    Args:
+        helper (:obj:`MCSampleValuesHelper`): Helper providing the values, e.g. MCSampleValuesHelper(import_signal="AZHToLLTTBar")
+        pattern (`str`): Shell-style pattern selecting the samples, e.g. "AToZHToLLTTbar_MA-*_MH-*"
+        parameters (:obj:`tuple` of :obj:`str`): The mass parameters spanning the grid, in the order used for query points
+        energy (`str`): The simulated energy of the samples
+
+    Example:
+        grid = SignalMassGrid(MCSampleValuesHelper(import_signal="AZHToLLTTBar"), "AToZHToLLTTbar_MA-*_MH-*", ("MA", "MH"))
+        grid.interpolate("xs", "UL18", [[1000, 330], [1025, 340]])
+    """
+
+    quantities = ["xs", "nevt", "lumi"]
+
+    def __init__(self, helper, pattern, parameters, energy="13TeV"):
+        import numpy as np
+        self.helper = helper
+        self.parameters = tuple(parameters)
+        self.energy = energy
+        self.samples = []
+        coordinates = []
+        for sample in helper.get_samples(pattern):
+            masses = parse_mass_parameters(sample)
+            if all(p in masses for p in self.parameters):
+                self.samples.append(sample)
+                coordinates.append([masses[p] for p in self.parameters])
+        if len(self.samples) == 0:
+            raise KeyError("ERROR SignalMassGrid::No samples matching \"" + str(pattern) + "\" with parameters " + str(self.parameters))
+        self.coordinates = np.array(coordinates)
+        self.axes = tuple(np.unique(self.coordinates[:, i]) for i in range(len(self.parameters)))
+        self._indices = tuple(np.searchsorted(axis, self.coordinates[:, i]) for i, axis in enumerate(self.axes))
+        self._grids = {}
+
+    def _sample_value(self, sample, quantity, year):
+        if quantity == "xs":
+            value = self.helper.get_value(sample, self.energy, year, "CrossSection")
+        elif quantity == "nevt":
+            value = self.helper.get_value(sample, self.energy, year, "NEvents")
+        elif quantity == "lumi":
+            if self._sample_value(sample, "xs", year) <= 0 or self._sample_value(sample, "nevt", year) <= 0:
+                return float("nan")
+            value = self.helper.get_lumi(sample, self.energy, year)
+        else:
+            raise KeyError("ERROR SignalMassGrid::Unknown quantity \"" + str(quantity) + "\", use one of " + str(self.quantities))
+        return value if value > 0 else float("nan")
+
+    def get_values(self, quantity, year):
+        """Return the values of all samples (in the order of self.samples) as array"""
+        return self.get_grid(quantity, year)[tuple(self._indices)]
+
+    def get_grid(self, quantity, year):
+        """Return the dense grid (indexed like self.axes) of the given quantity and year"""
+        import numpy as np
+        if not (quantity, year) in self._grids:
+            grid = np.full(tuple(len(axis) for axis in self.axes), np.nan)
+            grid[tuple(self._indices)] = [self._sample_value(sample, quantity, year) for sample in self.samples]
+            self._grids[(quantity, year)] = grid
+        return self._grids[(quantity, year)]
+
+    def interpolate(self, quantity, year, points, log=False):
+        """Interpolate the quantity at arbitrary points
+
+        Args:
+            quantity (`str`): One of "xs", "nevt" or "lumi"
+            year (`str`): The production year of the samples
+            points (array-like): Query points of shape (n, len(parameters)) (or a single point)
+            log (`bool`): Interpolate the logarithm of the values (recommended for steeply falling cross sections)
+        """
+        import numpy as np
+        grid = self.get_grid(quantity, year)
+        if log:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                grid = np.log(grid)
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        lower, fraction, inside = [], [], np.ones(len(points), dtype=bool)
+        for i, axis in enumerate(self.axes):
+            x = points[:, i]
+            if len(axis) == 1:
+                lower.append(np.zeros(len(points), dtype=int))
+                fraction.append(np.zeros(len(points)))
+                inside &= (x == axis[0])
+                continue
+            index = np.clip(np.searchsorted(axis, x, side="right")-1, 0, len(axis)-2)
+            lower.append(index)
+            fraction.append((x-axis[index])/(axis[index+1]-axis[index]))
+            inside &= (x >= axis[0]) & (x <= axis[-1])
+
+        result = np.zeros(len(points))
+        for corner in range(2**len(self.axes)):
+            weight = np.ones(len(points))
+            index = []
+            for i in range(len(self.axes)):
+                upper = (corner >> i) & 1
+                index.append(np.minimum(lower[i]+upper, len(self.axes[i])-1))
+                weight = weight*(fraction[i] if upper else 1-fraction[i])
+            values = grid[tuple(index)]
+            # corners with zero weight must not propagate NaNs of missing neighbours
+            result += np.where(weight > 0, weight*np.nan_to_num(values, nan=0.0, neginf=0.0), 0.0)
+            result = np.where((weight > 0) & ~np.isfinite(values), np.nan, result)
+        result[~inside] = np.nan
+        return np.exp(result) if log else result
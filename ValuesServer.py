@@ -0,0 +1,197 @@
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from CrossSectionHelper import MCSampleValuesHelper, periods
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Endpoints /xs, /nevt, /lumi and /xml (and the methods of /bulk) with the helper method answering them
+METHODS = {
+    "xs":   "get_xs",
+    "nevt": "get_nevt",
+    "lumi": "get_lumi",
+    "xml":  "get_xml",
+}
+
+
+def _flag(value):
+    return str(value).lower() in ["1", "true", "yes"]
+
+
+def resolve_query(helper, method, query):
+    """Answer a single query {"name", "year", "energy" (default 13TeV), "info" or "kFactor"/"Corrections" for lumi} with a helper method
+
+    Raises:
+        KeyError: Unknown sample
+        ValueError: Unknown method or missing/invalid parameters
+    """
+    if not method in METHODS:
+        raise ValueError("ERROR ValuesServer::Unknown method \"" + str(method) + "\", known are " + ", ".join(METHODS))
+    if not "name" in query or not "year" in query:
+        raise ValueError("ERROR ValuesServer::Query without name and year " + json.dumps(query))
+    name, year, energy = query["name"], query["year"], query.get("energy", "13TeV")
+    if not year in periods.years()+periods.combined() or not energy in periods.energies():
+        raise ValueError("ERROR ValuesServer::Unknown year or energy \"" + str(year) + "\", \"" + str(energy) + "\"")
+    if method == "lumi":
+        return helper.get_lumi(name, energy, year, kFactor=_flag(query.get("kFactor", False)), Corrections=_flag(query.get("Corrections", False)))
+    return getattr(helper, METHODS[method])(name, energy, year, query.get("info", ""))
+
+
+def resolve_bulk(helper, queries, method=None):
+    """Answer a list of queries, each with a "method" (or the common method), as list of {"value": ...} or {"error": ...} in the same order
+
+    A failing query does not fail the others.
+    """
+    results = []
+    for query in queries:
+        try:
+            if not isinstance(query, dict):
+                raise ValueError("ERROR ValuesServer::Query is not a JSON object " + json.dumps(query))
+            results.append({"value": resolve_query(helper, query.get("method", method), query)})
+        except (KeyError, ValueError, TypeError, ZeroDivisionError) as error:
+            results.append({"error": str(error.args[0]) if len(error.args) > 0 else repr(error)})
+    return results
+
+
+class ValuesRequestHandler(BaseHTTPRequestHandler):
+    """JSON API of the helper of the server
+
+    GET endpoints (parameters as query string):
+        /xs, /nevt, /lumi, /xml     name, year, energy=13TeV, info="" (kFactor, Corrections for /lumi): {"value": ...}
+        /bulk/<method>              year, energy, name (repeated) or pattern: {"results": {name: {"value"|"error": ...}}}
+        /samples                    pattern (optional): {"samples": [...]}
+        /version                    {"content_hash": ...}
+    POST endpoint:
+        /bulk                       body {"queries": [{"method", "name", "year", ...}, ...]}: {"results": [{"value"|"error": ...}, ...]}
+
+    All responses carry the content hash of the database as ETag. GET requests with a matching If-None-Match are answered with
+    304 Not Modified without evaluating the query, so clients can cache responses until the database changes.
+    Unknown samples are answered with 404, invalid queries with 400, both with {"error": ...}.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which with Nagle's algorithm delays keep-alive responses by the delayed ACK
+    disable_nagle_algorithm = True
+    server_version = "UHH2ValuesServer/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _etag(self):
+        return "\"" + self.server.helper.content_hash() + "\""
+
+    def _send(self, status, payload=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("ETag", self._etag())
+        self.send_header("Cache-Control", "no-cache")
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, error):
+        message = str(error.args[0]) if len(error.args) > 0 else repr(error)
+        self._send(404 if isinstance(error, KeyError) else 400, {"error": message})
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = url.path.strip("/")
+        if not (endpoint in METHODS or endpoint.startswith("bulk/") or endpoint in ["samples", "version"]):
+            self._send(404, {"error": "ERROR ValuesServer::Unknown endpoint \"" + url.path + "\""})
+            return
+        if_none_match = [etag.strip() for etag in self.headers.get("If-None-Match", "").split(",")]
+        if self._etag() in if_none_match or "*" in if_none_match:
+            self._send(304)
+            return
+        query = parse_qs(url.query)
+        parameters = {key: values[-1] for key, values in query.items()}
+        helper = self.server.helper
+        try:
+            if endpoint in METHODS:
+                self._send(200, {"value": resolve_query(helper, endpoint, parameters)})
+            elif endpoint.startswith("bulk/"):
+                names = query.get("name", [])
+                parameters.pop("name", None)
+                if "pattern" in parameters:
+                    names += helper.get_samples(parameters.pop("pattern"))
+                results = resolve_bulk(helper, [dict(parameters, name=name) for name in names], endpoint[len("bulk/"):])
+                self._send(200, {"results": dict(zip(names, results))})
+            elif endpoint == "samples":
+                self._send(200, {"samples": helper.get_samples(parameters.get("pattern"))})
+            else:
+                self._send(200, {"content_hash": helper.content_hash()})
+        except (KeyError, ValueError, TypeError, ZeroDivisionError) as error:
+            self._send_error(error)
+
+    def do_POST(self):
+        if urlsplit(self.path).path.strip("/") != "bulk":
+            self._send(404, {"error": "ERROR ValuesServer::Unknown endpoint \"" + self.path + "\""})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if not isinstance(request, dict) or not isinstance(request.get("queries"), list):
+                raise ValueError("ERROR ValuesServer::Expected a JSON object {\"queries\": [...]}")
+            self._send(200, {"results": resolve_bulk(self.server.helper, request["queries"])})
+        except ValueError as error:
+            self._send_error(error)
+
+
+def make_server(helper=None, host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False):
+    """Return a (not yet started) threading HTTP server answering ValuesRequestHandler requests from an in-memory helper
+
+    The database is loaded once when the server is created. Start it with serve_forever(), e.g. in a thread, and stop it with shutdown().
+
+    Args:
+        helper (:obj:`MCSampleValuesHelper`): The helper to serve. A default MCSampleValuesHelper if None.
+        host (`str`): The address to bind to. Only the local host by default.
+        port (`int`): The port to bind to (0 picks a free port, see server.server_address)
+        verbose (`bool`): Log every request to stderr
+
+    Example:
+        server = make_server(MCSampleValuesHelper(import_signal="AZHToLLTTBar"))
+        server.serve_forever()
+        # curl "http://127.0.0.1:8765/lumi?name=TTToSemiLeptonic&year=UL18"
+    """
+    server = ThreadingHTTPServer((host, port), ValuesRequestHandler)
+    server.daemon_threads = True
+    server.helper = MCSampleValuesHelper() if helper is None else helper
+    server.verbose = verbose
+    # Compute the ETag before the first request
+    server.helper.content_hash()
+    return server
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve the CrossSectionHelper database as JSON over HTTP.")
+
+    parser.add_argument("--host", default=DEFAULT_HOST, help="the address to bind to.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="the port to bind to.")
+    parser.add_argument("--signal", nargs="+", default=[], help="signal dictionaries from xsec_signal_dicts to serve as well.")
+    parser.add_argument("--event-counts", action="store_true", help="load NEventsRaw and SumOfWeights from the XML trailers.")
+    parser.add_argument("--verbose", action="store_true", help="log every request.")
+    parser.add_argument("--throw", action="store_true", help="raise errors if they occur.")
+
+    args = parser.parse_args()
+
+    try:
+        helper = MCSampleValuesHelper(event_counts=args.event_counts)
+        for signal in args.signal:
+            helper.add_signal(signal)
+        server = make_server(helper, args.host, args.port, args.verbose)
+    except (KeyError, ValueError, OSError) as error:
+        if args.throw: raise
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    print("Serving " + str(len(helper.get_samples())) + " samples (content hash " + helper.content_hash()[:10] + ") on http://%s:%d" % server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,145 @@
+"""Load test of the ValuesServer HTTP API
+
+Starts the server in a separate process (or uses a running one via --url) and measures requests/second and latencies for
+concurrent clients with keep-alive connections:
+
+    python benchmarks/load_test_server.py --clients 8 --duration 5
+"""
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+
+UHH2DATASETS_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, UHH2DATASETS_PATH)
+
+
+def start_server(port, timeout=60):
+    """Start ValuesServer.py on the local host and return the process once it answers requests"""
+    process = subprocess.Popen([sys.executable, os.path.join(UHH2DATASETS_PATH, "ValuesServer.py"), "--port", str(port), "--throw"],
+                               stdout=subprocess.DEVNULL, cwd=UHH2DATASETS_PATH)
+    start = time.perf_counter()
+    while time.perf_counter()-start < timeout:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/version")
+            connection.getresponse().read()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise ValueError("ValuesServer.py exited with code " + str(process.returncode))
+            time.sleep(0.1)
+    process.kill()
+    raise ValueError("ValuesServer.py did not start within " + str(timeout) + " s")
+
+
+def make_requests(host, port, year, batch):
+    """Return the request mix as (scenario, method, path, body, conditional) tuples: single lookups, GET and POST bulk queries and revalidations"""
+    connection = http.client.HTTPConnection(host, port)
+    connection.request("GET", "/samples")
+    samples = json.loads(connection.getresponse().read())["samples"]
+    connection.close()
+    requests = {"single": [], "bulk_get": [], "bulk_post": [], "revalidate": []}
+    for i, sample in enumerate(samples):
+        method = ["xs", "nevt", "lumi", "xml"][i % 4]
+        path = "/" + method + "?" + urlencode({"name": sample, "year": year})
+        requests["single"].append(("GET", path, None, False))
+        requests["revalidate"].append(("GET", path, None, True))
+    for i in range(0, len(samples), batch):
+        names = samples[i:i+batch]
+        requests["bulk_get"].append(("GET", "/bulk/lumi?" + urlencode([("year", year)]+[("name", name) for name in names]), None, False))
+        queries = [{"method": "lumi", "name": name, "year": year} for name in names]
+        requests["bulk_post"].append(("POST", "/bulk", json.dumps({"queries": queries}), False))
+    return requests, len(samples)
+
+
+def run_clients(host, port, requests, clients, duration):
+    """Send the requests round-robin from clients threads for duration seconds and return the throughput and latency statistics"""
+    latencies = [[] for _ in range(clients)]
+    statuses = [{} for _ in range(clients)]
+    stop = threading.Event()
+
+    def client(index):
+        connection = http.client.HTTPConnection(host, port)
+        etag = None
+        i = index
+        while not stop.is_set():
+            method, path, body, conditional = requests[i % len(requests)]
+            headers = {"If-None-Match": etag} if conditional and etag is not None else {}
+            start = time.perf_counter()
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            latencies[index].append(time.perf_counter()-start)
+            etag = response.getheader("ETag")
+            statuses[index][response.status] = statuses[index].get(response.status, 0)+1
+            i += clients
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter()-start
+    all_latencies = sorted(latency for client_latencies in latencies for latency in client_latencies)
+    status_counts = {}
+    for client_statuses in statuses:
+        for status, count in client_statuses.items():
+            status_counts[str(status)] = status_counts.get(str(status), 0)+count
+    return {
+        "requests": len(all_latencies),
+        "requests_per_second": len(all_latencies)/elapsed,
+        "latency_median": statistics.median(all_latencies),
+        "latency_p99": all_latencies[int(0.99*(len(all_latencies)-1))],
+        "statuses": status_counts,
+    }
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Measure the requests/second of the ValuesServer HTTP API.")
+
+    parser.add_argument("--url", default=None, help="URL of a running server (a local server is started if not given).")
+    parser.add_argument("--port", type=int, default=8766, help="port of the started local server.")
+    parser.add_argument("--clients", type=int, default=8, help="number of concurrent clients.")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario.")
+    parser.add_argument("--year", default="UL18", help="year of the queries.")
+    parser.add_argument("--batch", type=int, default=50, help="samples per bulk request.")
+    parser.add_argument("--output", default=None, help="JSON file to write the results to.")
+
+    args = parser.parse_args()
+
+    process = None
+    if args.url is None:
+        process = start_server(args.port)
+        host, port = "127.0.0.1", args.port
+    else:
+        host, port = urlsplit(args.url).hostname, urlsplit(args.url).port or 80
+    try:
+        requests, n_samples = make_requests(host, port, args.year, args.batch)
+        results = {}
+        for scenario, scenario_requests in requests.items():
+            results[scenario] = run_clients(host, port, scenario_requests, args.clients, args.duration)
+            if scenario.startswith("bulk"):
+                results[scenario]["samples_per_second"] = results[scenario]["requests_per_second"]*n_samples/len(scenario_requests)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    for scenario, result in results.items():
+        print("{name: <12} {rps: >10.0f} req/s  median {median: >7.2f} ms  p99 {p99: >7.2f} ms  {statuses}".format(
+            name=scenario, rps=result["requests_per_second"], median=result["latency_median"]*1e3, p99=result["latency_p99"]*1e3, statuses=result["statuses"]))
+    if args.output is not None:
+        with open(args.output, "w") as outfile:
+            json.dump({"clients": args.clients, "duration": args.duration, "results": results}, outfile, indent=2)
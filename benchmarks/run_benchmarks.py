@@ -0,0 +1,239 @@
+"""Standalone benchmarks of the CrossSectionHelper hot paths
+
+Results are written as JSON, such that runs for different commits can be compared:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    (checkout other commit)
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+
+UHH2DATASETS_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, UHH2DATASETS_PATH)
+
+
+def measure(func, number=1, repeat=5):
+    """Call func number times per repetition and return timing statistics (in seconds per call)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter()-start)/number)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def bench_import(repeat):
+    """Import time of CrossSectionHelper, measured in a fresh interpreter per repetition"""
+    code = "import time; t=time.perf_counter(); import CrossSectionHelper; print(time.perf_counter()-t)"
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=UHH2DATASETS_PATH, env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+        timings.append(float(output.decode().split()[-1]))
+    return {"min": min(timings), "median": statistics.median(timings), "mean": statistics.mean(timings),
+            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0, "number": 1, "repeat": repeat}
+
+
+def count_database_executions(signal):
+    """Number of times CrossSectionHelper.py is executed when running it as __main__ and importing a signal dictionary (expected: 1)"""
+    code = "; ".join([
+        "import runpy, sys",
+        "sys.argv = ['CrossSectionHelper.py']",
+        "namespace = runpy.run_path('CrossSectionHelper.py', run_name='__main__')",
+        "namespace['MCSampleValuesHelper'](import_signal=%r)" % signal,
+        "print(1+sum(1 for m in list(sys.modules.values()) if str(getattr(m, '__file__', '')).endswith('CrossSectionHelper.py')))",
+    ])
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=UHH2DATASETS_PATH)
+    return int(output.decode().split()[-1])
+
+
+def _pool_task(helper, sample, year):
+    return helper.get_lumi(sample, "13TeV", year)
+
+
+def bench_process_pool(helper, queries, repeat, workers=2):
+    """Submission overhead of sending the helper with every task to a process pool (the pool is started once, outside the timing)"""
+    import concurrent.futures
+    import pickle
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        list(executor.map(_pool_task, [helper]*workers, *zip(*queries[:workers])))
+        result = measure(lambda: list(executor.map(_pool_task, [helper]*len(queries), *zip(*queries), chunksize=16)), number=1, repeat=repeat)
+    result["n_tasks"] = len(queries)
+    result["pickle_bytes"] = len(pickle.dumps(helper))
+    return result
+
+
+def bench_async(helper, queries, repeat, clients=8):
+    """Concurrent lumi lookups (clients requests of all queries) and XML validation, blocking on the event loop vs. through the asyncio API
+
+    Besides the timing, the largest delay of a 1 ms heartbeat task running on the same event loop is recorded as max_loop_stall.
+    """
+    import asyncio
+    from CrossSectionHelper import validate_xml_paths
+    lumi_queries = [(sample, "13TeV", year) for sample, year in queries]
+    xmlpaths = sorted(helper.get_xml_index())
+
+    async def blocking_lumis():
+        for _ in range(clients):
+            [helper.get_lumi(*query) for query in lumi_queries]
+
+    async def async_lumis():
+        await asyncio.gather(*(helper.aget_lumi_many(lumi_queries) for _ in range(clients)))
+
+    async def blocking_xmls():
+        [os.path.isfile(os.path.join(UHH2DATASETS_PATH, xmlpath)) for xmlpath in xmlpaths]
+
+    async def async_xmls():
+        await validate_xml_paths(xmlpaths)
+
+    async def with_heartbeat(workload, stalls):
+        delays = []
+        async def heartbeat():
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0.001)
+                delays.append(time.perf_counter()-start-0.001)
+        task = asyncio.ensure_future(heartbeat())
+        await asyncio.sleep(0)
+        await workload()
+        task.cancel()
+        stalls.append(max(delays, default=0.0))
+
+    results = {}
+    for name, workload in [("lumi_many_blocking", blocking_lumis), ("lumi_many_async", async_lumis), ("validate_xml_blocking", blocking_xmls), ("validate_xml_async", async_xmls)]:
+        stalls = []
+        results[name] = measure(lambda: asyncio.run(with_heartbeat(workload, stalls)), number=1, repeat=repeat)
+        results[name]["max_loop_stall"] = max(stalls)
+        results[name]["n_requests"] = clients*len(lumi_queries) if name.startswith("lumi") else len(xmlpaths)
+    return results
+
+
+def run_benchmarks(repeat=5, signal="AZHToLLTTBar", n_xmls=5):
+    from CrossSectionHelper import MCSampleValuesHelper, periods, print_database
+    from DatasetXMLHelper import iter_ntuple_paths, iter_xml_files
+
+    results = {}
+    results["import_module"] = bench_import(repeat)
+    results["construct_helper"] = measure(MCSampleValuesHelper, number=100, repeat=repeat)
+    try:
+        MCSampleValuesHelper(import_signal=signal)
+        results["construct_helper_signal"] = measure(lambda: MCSampleValuesHelper(import_signal=signal), number=5, repeat=repeat)
+        results["import_signal"] = measure(lambda: MCSampleValuesHelper()._import_signal(signal), number=5, repeat=repeat)
+        results["import_signal"]["database_executions"] = count_database_executions(signal)
+    except Exception as error:
+        results["construct_helper_signal"] = {"skipped": str(error)}
+
+    helper = MCSampleValuesHelper()
+    queries = []
+    for sample in sorted(helper._MCSampleValuesHelper__values_dict):
+        for year in periods.years(default=True):
+            if helper.get_value(sample, "13TeV", year, "NEvents") > 0 and helper.get_value(sample, "13TeV", year, "CrossSection") > 0:
+                queries.append((sample, year))
+    sample, year = queries[0]
+    # The cold lookups drop the caches of the helper before every call, such that they measure the same work as before get_lumi was
+    # memoized and stay comparable over the history. The warm ones repeat the same queries, i.e. measure cache hits.
+    invalidate = getattr(helper, "invalidate_caches", lambda: None)
+
+    def get_lumi_cold(sample, year):
+        invalidate()
+        return helper.get_lumi(sample, "13TeV", year)
+    results["get_lumi_single"] = measure(lambda: get_lumi_cold(sample, year), number=10000, repeat=repeat)
+    results["get_lumi_batch"] = measure(lambda: [get_lumi_cold(s, y) for s, y in queries], number=1, repeat=repeat)
+    results["get_lumi_batch"]["n_queries"] = len(queries)
+    [helper.get_lumi(s, "13TeV", y) for s, y in queries]
+    results["get_lumi_single_warm"] = measure(lambda: helper.get_lumi(sample, "13TeV", year), number=10000, repeat=repeat)
+    results["get_lumi_batch_warm"] = measure(lambda: [helper.get_lumi(s, "13TeV", y) for s, y in queries], number=1, repeat=repeat)
+    results["get_lumi_batch_warm"]["n_queries"] = len(queries)
+
+    results["process_pool_submit"] = bench_process_pool(helper, queries, repeat)
+    results.update(bench_async(helper, queries, repeat))
+
+    def print_quietly():
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_database()
+    results["print_database"] = measure(print_quietly, number=1, repeat=repeat)
+
+    largest = sorted(iter_xml_files(UHH2DATASETS_PATH), key=lambda x: -os.path.getsize(os.path.join(UHH2DATASETS_PATH, x)))[:n_xmls]
+    n_entries = sum(1 for x in largest for _ in iter_ntuple_paths(x))
+    results["xml_parse_largest"] = measure(lambda: [sum(1 for _ in iter_ntuple_paths(x)) for x in largest], number=1, repeat=repeat)
+    results["xml_parse_largest"]["n_xmls"] = len(largest)
+    results["xml_parse_largest"]["n_entries"] = n_entries
+    results["xml_parse_largest"]["entries_per_second"] = n_entries/results["xml_parse_largest"]["min"]
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=UHH2DATASETS_PATH, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+    }
+
+
+def compare(results, reference, threshold):
+    """Print the ratio of the minimal timings to the reference and return the names of benchmarks slower than threshold"""
+    regressions = []
+    print("{name: <26} {ref: >12} {new: >12} {ratio: >8}".format(name="benchmark", ref="reference", new="current", ratio="ratio"))
+    for name, result in results.items():
+        if not "min" in result or not "min" in reference.get(name, {}):
+            continue
+        ratio = result["min"]/reference[name]["min"]
+        flag = "  <-- slower" if ratio > threshold else ""
+        print("{name: <26} {ref: >12.4g} {new: >12.4g} {ratio: >8.2f}{flag}".format(name=name, ref=reference[name]["min"], new=result["min"], ratio=ratio, flag=flag))
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+if(__name__ == "__main__"):
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the CrossSectionHelper hot paths and store the results as JSON.")
+
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write the results to.")
+    parser.add_argument("--compare", default=None, help="JSON file of a previous run to compare against.")
+    parser.add_argument("--threshold", type=float, default=1.2, help="flag benchmarks slower than threshold times the reference.")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions per benchmark.")
+    parser.add_argument("--signal", default="AZHToLLTTBar", help="signal dictionary used for the import_signal benchmark.")
+    parser.add_argument("--throw", action="store_true", help="raise an error if a regression is found or the background database is executed more than once.")
+
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat, args.signal)
+    with open(args.output, "w") as outfile:
+        json.dump({"metadata": metadata(), "results": results}, outfile, indent=2)
+    for name, result in results.items():
+        print("{name: <26} {value}".format(name=name, value="%.4g s" % result["min"] if "min" in result else result))
+    executions = results.get("import_signal", {}).get("database_executions", 1)
+    if executions != 1:
+        print("")
+        print("Error: CrossSectionHelper.py was executed %d times while importing the signal dictionary" % executions)
+        if args.throw: raise ValueError("Importing a signal dictionary re-executes the background database")
+
+    if args.compare is not None:
+        print("")
+        with open(args.compare) as infile:
+            reference = json.load(infile)["results"]
+        regressions = compare(results, reference, args.threshold)
+        if args.throw and len(regressions) > 0: raise ValueError("Performance regression in: " + ", ".join(regressions))
@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    from ColumnarValuesHelper import ColumnarMCSampleValuesHelper
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class TestNormalization(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.helper = ColumnarMCSampleValuesHelper()
+
+    def test_negative_nevents_not_flagged(self):
+        """A negative NEvents (e.g. an interference sample) normalised with abs(NEvents) is no mismatch"""
+        name = "HpseudoToTTTo1L1Nu2J_m365_w36p5_int"
+        self.assertLess(self.helper.get_nevt(name, "13TeV", "UL18"), 0)
+        lumi, flags = self.helper.get_normalization([name], year="UL18", method="nevents")
+        self.assertEqual(flags[0] & self.helper.FLAG_NEVT_MISMATCH, 0)
+        self.assertEqual(flags[0] & self.helper.FLAG_NEGATIVE_LUMI, self.helper.FLAG_NEGATIVE_LUMI)
+        self.assertAlmostEqual(lumi[0], self.helper.get_lumi(name, "13TeV", "UL18"), delta=1e-9*abs(lumi[0]))
+
+    def test_nevents_never_mismatched(self):
+        _, flags = self.helper.get_normalization(year="UL18", method="nevents")
+        self.assertFalse(np.any(flags & self.helper.FLAG_NEVT_MISMATCH))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MCSampleValuesPrototype import MCSampleValuesHelperPrototype, namedtuple_with_defaults, record_items
+
+
+class TestRecords(unittest.TestCase):
+
+    def test_positional_construction(self):
+        """Positional values follow the field order of the former namedtuples: (value, source) per default year, then the default energies"""
+        XSValues = MCSampleValuesHelperPrototype.XSValues
+        self.assertEqual(XSValues(-1.0, "", 2.0, "NLO"), XSValues(XSec_UL16postVFP=2.0, XSecSource_UL16postVFP="NLO"))
+        self.assertEqual(XSValues(*[-1.0, ""]*4+[831.76]).XSec_13TeV, 831.76)
+        with self.assertRaises(TypeError):
+            XSValues(1.0, XSec_UL16preVFP=2.0)
+
+    def test_namedtuple_records(self):
+        """namedtuple records are read like SparseValues, with fields equal to their defaults being unset"""
+        XSValues = namedtuple_with_defaults("XSValues", ["XSec_13TeV", "XSecSource_13TeV"], [-1.0, ""])
+        self.assertEqual(list(record_items(XSValues(XSec_13TeV=831.76))), [("XSec_13TeV", 831.76)])
+        self.assertEqual(list(record_items(XSValues(XSec_13TeV=831.76))),
+                         list(record_items(MCSampleValuesHelperPrototype.XSValues(XSec_13TeV=831.76))))
+
+
+if __name__ == "__main__":
+    unittest.main()
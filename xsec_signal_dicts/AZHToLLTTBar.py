@@ -1,4852 +1,301 @@
+import os
 import sys
 
-sys.path.append("..")
-from CrossSectionHelper import MCSampleValuesHelperPrototype as P
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from MCSampleValuesPrototype import MCSampleValuesHelperPrototype as P, SignalGrid
 
 
 class MCSignalValuesHelper(P):
 
-    signal_values_dict = {
-
-        "AToZHToLLTTbar_MA-1000_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-850" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-850_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-850_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-850_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-850_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1000_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1000_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1000_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1000_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1000_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=0.0,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-850" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26072,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-850_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-850_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-850_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-850_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1050_MH-950" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1050_MH-950_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1050_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1050_MH-950_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1050_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1050_MH-950_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1050_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1050_MH-950_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1050_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26073,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22069,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-850" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-850_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-850_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-850_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-850_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1100_MH-950" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1100_MH-950_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1100_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1100_MH-950_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1100_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1100_MH-950_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1100_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1100_MH-950_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1100_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-1050" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-1050_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-1050_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-1050_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-1050_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-1050_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-1050_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-1050_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-1050_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22070,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-850" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-850_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-850_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-850_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-850_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1150_MH-950" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1150_MH-950_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1150_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1150_MH-950_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1150_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1150_MH-950_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1150_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1150_MH-950_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1150_MH-950_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22068,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22063,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22068,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-850" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-850_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-850_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-850_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-850_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1200_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1200_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1200_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1200_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1200_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1200_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1200_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1200_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1200_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22066,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26072,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1300_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26073,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1300_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1300_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1300_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1300_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1300_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1300_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1300_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1300_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22065,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1400_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1400_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1400_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1400_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1400_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1400_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1400_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1400_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1400_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=0,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1500_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1500_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1500_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1500_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1500_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1500_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1500_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1500_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1500_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=47000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-1500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-1500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-1500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=0,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=0,
-                NEVT_UL16postVFP=0,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1600_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1600_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1600_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1600_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1600_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1600_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1600_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1600_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1600_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-1600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-1600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-1600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22066,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26073,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1700_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1700_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1700_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1700_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1700_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1700_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1700_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1700_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1700_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22068,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-1700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-1700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-1700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22075,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1800_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1800_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1800_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1800_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1800_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1800_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1800_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1800_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1800_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22066,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-1800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-1800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-1800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-1800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-1800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-1900_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22067,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-1900_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-1900_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-1900_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-1900_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-1900_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-1900_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-1900_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-1900_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22066,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=0,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22068,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-1900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-1900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-1900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-1900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-1900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2000_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2000_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2000_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2000_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2000_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2000_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1100" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1100_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1100_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1100_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1100_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1200" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26064,
-                NEVT_UL16postVFP=22065,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1200_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1200_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1200_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1200_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1300" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1300_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1300_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1300_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1300_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22064,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=0.0,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-1900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-1900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-1900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-1900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-1900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-1900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-2000" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-2000_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-2000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-2000_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-2000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-2000_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-2000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-2000_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-2000_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-2100_MH-900" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26074,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-2100_MH-900_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-2100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-2100_MH-900_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-2100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-2100_MH-900_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-2100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-2100_MH-900_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-2100_MH-900_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-430_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-430_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-430_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-430_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-430_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-430_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-430_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-430_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-430_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-450_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-450_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-450_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-450_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-450_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-450_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-450_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-450_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-450_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-450_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-450_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-450_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-450_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-450_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-450_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-450_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-450_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-450_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-500_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-500_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-500_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-500_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-500_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-500_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-500_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-500_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-500_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-500_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-500_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-500_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-500_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-500_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-500_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-500_MH-370" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-500_MH-370_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-500_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-500_MH-370_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-500_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-500_MH-370_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-500_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-500_MH-370_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-500_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-500_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-500_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-500_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-500_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-500_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-500_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-550_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-550_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-550_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-550_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-550_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-550_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-550_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-550_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-550_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-550_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-550_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-550_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-550_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-550_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-550_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-550_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-550_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-550_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-550_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-550_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-550_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-550_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-550_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-550_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-550_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-550_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-550_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-550_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22068,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-550_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-550_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-550_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-550_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-550_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-550_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-550_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-550_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-600_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-600_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-600_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-600_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-600_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-600_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-600_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-600_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-600_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-600_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-600_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-600_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-600_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-600_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-600_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-600_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26075,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-600_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-600_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-600_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-600_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-600_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-600_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-600_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-600_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-600_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-600_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-600_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-600_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-600_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-600_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-600_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-600_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-600_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-600_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-600_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-600_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-650_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-650_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-650_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-650_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-650_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-650_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-650_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-650_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-650_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-650_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-650_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-650_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-650_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-650_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-650_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-650_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-650_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-650_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-650_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22067,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-650_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-650_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-650_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-650_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-650_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-650_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-650_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-650_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-650_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-650_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-650_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-650_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-650_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-650_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-650_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-650_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-650_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-650_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-650_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-650_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-650_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-650_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-650_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-650_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-650_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-650_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-650_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-650_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-650_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-650_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-650_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-650_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-650_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-650_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-650_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-370" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-370_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-370_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-370_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-370_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-700_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26074,
-                NEVT_UL16postVFP=0.0,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-700_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-700_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-700_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-700_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-700_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-750_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-750_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-750_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-750_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-750_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-750_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-750_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-750_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-750_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22071,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-800_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-800_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-800_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-800_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-800_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-800_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22072,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22068,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22070,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26073,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-850_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-850_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-850_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-850_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-850_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-850_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-850_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-850_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-850_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-370" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-370_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-370_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-370_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-370_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-370_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26999,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=0,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26074,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-900_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-900_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-900_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-900_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-900_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-900_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-330" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-330_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-330_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-330_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-330_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-330_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-350" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22062,
-                NEVT_UL17=50000,
-                NEVT_UL18=48000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-350_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-350_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-350_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-350_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-350_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-400" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=22063,
-                NEVT_UL17=48000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-400_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-400_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-400_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-400_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-400_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-450" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-450_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-450_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-450_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-450_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-450_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-500" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=49000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-500_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-500_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-500_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-500_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-500_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-550" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-550_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-550_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-550_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-550_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-550_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-600" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26075,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-600_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-600_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-600_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-600_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-600_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-650" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-650_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-650_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-650_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-650_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-650_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-700" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-700_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-700_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-700_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-700_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-700_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-750" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-750_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-750_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-750_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-750_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-750_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-800" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=26070,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=50000,
-                NEVT_UL18=50000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-800_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-800_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-800_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-800_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-800_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-
-        "AToZHToLLTTbar_MA-950_MH-850" : {
-            "CrossSection" : P.XSValues(
-                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
-            ),
-            "NEvents" : P.NEventsValues(
-                NEVT_UL16preVFP=27000,
-                NEVT_UL16postVFP=23000,
-                NEVT_UL17=48000,
-                NEVT_UL18=49000,
-            ),
-            "XMLname" : P.XMLValues(
-                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-950_MH-850_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-950_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
-                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-950_MH-850_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-950_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
-                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-950_MH-850_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-950_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
-                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-950_MH-850_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-950_MH-850_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
-            ),
-        },
-    }
+    signal_values_dict = SignalGrid(
+        name_template = "AToZHToLLTTbar_MA-{MA}_MH-{MH}",
+        parameters = ("MA", "MH"),
+        common = {
+            "CrossSection" : dict(
+                XSec_13TeV=1, XSecSource_13TeV="Fixed to 1 pb",
+            ),
+        },
+        templates = {
+            "XMLname" : dict(
+                Xml_UL16preVFP="RunII_106X_v2/BSM/UL16preVFP/AToZHToLLTTbar_MA-{MA}_MH-{MH}_CP5_amcatnlo-pythia8_Summer20UL16APV_v2.xml", XmlSource_UL16preVFP="/AToZHToLLTTbar_MA-{MA}_MH-{MH}_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODAPVv2-106X_mcRun2_asymptotic_preVFP_v11-v2/MINIAODSIM",
+                Xml_UL16postVFP="RunII_106X_v2/BSM/UL16postVFP/AToZHToLLTTbar_MA-{MA}_MH-{MH}_CP5_amcatnlo-pythia8_Summer20UL16_v2.xml", XmlSource_UL16postVFP="/AToZHToLLTTbar_MA-{MA}_MH-{MH}_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL16MiniAODv2-106X_mcRun2_asymptotic_v17-v2/MINIAODSIM",
+                Xml_UL17="RunII_106X_v2/BSM/UL17/AToZHToLLTTbar_MA-{MA}_MH-{MH}_CP5_amcatnlo-pythia8_Summer20UL17_v2.xml", XmlSource_UL17="/AToZHToLLTTbar_MA-{MA}_MH-{MH}_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL17MiniAODv2-106X_mc2017_realistic_v9-v2/MINIAODSIM",
+                Xml_UL18="RunII_106X_v2/BSM/UL18/AToZHToLLTTbar_MA-{MA}_MH-{MH}_CP5_amcatnlo-pythia8_Summer20UL18_v2.xml", XmlSource_UL18="/AToZHToLLTTbar_MA-{MA}_MH-{MH}_TuneCP5_13TeV-amcatnlo-pythia8/RunIISummer20UL18MiniAODv2-106X_upgrade2018_realistic_v16_L1v1-v2/MINIAODSIM",
+            ),
+        },
+        point_fields = {
+            "NEvents" : ["NEVT_UL16preVFP", "NEVT_UL16postVFP", "NEVT_UL17", "NEVT_UL18"],
+        },
+        points = {
+            # (  MA,   MH): (NEVT_UL16preVFP, NEVT_UL16postVFP, NEVT_UL17, NEVT_UL18)
+            (1000,  330): ( 27000,  23000,  50000,  49000),
+            (1000,  350): ( 27000,  23000,  50000,  49000),
+            (1000,  400): ( 27000,  23000,  50000,  48000),
+            (1000,  450): ( 27000,  23000,  50000,  50000),
+            (1000,  500): ( 27000,  23000,  50000,  50000),
+            (1000,  550): ( 27000,  23000,  49000,  50000),
+            (1000,  600): ( 27000,  23000,  50000,  50000),
+            (1000,  650): ( 27000,  23000,  50000,  50000),
+            (1000,  700): ( 27000,  23000,  50000,  50000),
+            (1000,  750): ( 27000,  23000,  50000,  50000),
+            (1000,  800): ( 27000,  23000,  49000,  50000),
+            (1000,  850): ( 27000,  23000,  50000,  50000),
+            (1000,  900): ( 27000,  23000,  50000,  50000),
+            (1050,  330): ( 27000,  23000,  50000,  50000),
+            (1050,  350): ( 27000,  23000,  50000,  49000),
+            (1050,  400): ( 27000,  23000,  50000,  50000),
+            (1050,  450): ( 27000,  23000,  50000,  50000),
+            (1050,  500): ( 27000,  23000,  50000,  50000),
+            (1050,  550): ( 26999,  23000,  50000,  50000),
+            (1050,  600): ( 27000,  23000,  50000,  50000),
+            (1050,  650): ( 27000,  23000,      0,  50000),
+            (1050,  700): ( 27000,  23000,  50000,  50000),
+            (1050,  750): ( 27000,  23000,  49000,  50000),
+            (1050,  800): ( 27000,  23000,  48000,  49000),
+            (1050,  850): ( 26072,  23000,  50000,  50000),
+            (1050,  900): ( 27000,  23000,  50000,  50000),
+            (1050,  950): ( 27000,  23000,  50000,  50000),
+            (1100, 1000): ( 27000,  23000,  50000,  48000),
+            (1100,  330): ( 27000,  23000,  50000,  50000),
+            (1100,  350): ( 27000,  23000,  50000,  50000),
+            (1100,  400): ( 27000,  23000,  50000,  50000),
+            (1100,  450): ( 27000,  23000,  50000,  48000),
+            (1100,  500): ( 26073,  23000,  50000,  50000),
+            (1100,  550): ( 27000,  23000,  49000,  50000),
+            (1100,  600): ( 27000,  23000,  50000,  49000),
+            (1100,  650): ( 27000,  23000,  50000,  50000),
+            (1100,  700): ( 27000,  23000,  50000,  50000),
+            (1100,  750): ( 27000,  23000,  50000,  50000),
+            (1100,  800): ( 27000,  22069,  50000,  50000),
+            (1100,  850): ( 27000,  23000,  50000,  50000),
+            (1100,  900): ( 27000,  23000,  48000,  50000),
+            (1100,  950): ( 27000,  23000,  50000,  50000),
+            (1150, 1050): ( 27000,  23000,  50000,  50000),
+            (1150,  330): ( 27000,  22070,  50000,  50000),
+            (1150,  350): ( 27000,  23000,  50000,  50000),
+            (1150,  450): ( 26999,  23000,  50000,  50000),
+            (1150,  550): ( 27000,  23000,  50000,  50000),
+            (1150,  650): ( 27000,  23000,  50000,  50000),
+            (1150,  750): ( 27000,  23000,  50000,  50000),
+            (1150,  850): ( 27000,  23000,  50000,  48000),
+            (1150,  950): ( 27000,  23000,  50000,  50000),
+            (1200, 1000): ( 27000,  22068,  50000,  50000),
+            (1200, 1100): ( 27000,  23000,  50000,  50000),
+            (1200,  330): ( 27000,  23000,  48000,  50000),
+            (1200,  350): ( 27000,  23000,  50000,  50000),
+            (1200,  400): ( 27000,  23000,  50000,  50000),
+            (1200,  500): ( 27000,  23000,  50000,  50000),
+            (1200,  600): ( 27000,  23000,  50000,  50000),
+            (1200,  700): ( 27000,  22063,  50000,  50000),
+            (1200,  800): ( 27000,  22068,  50000,  50000),
+            (1200,  850): ( 27000,  23000,  50000,  50000),
+            (1200,  900): ( 27000,  23000,  50000,  50000),
+            (1300, 1000): ( 27000,  23000,  50000,  50000),
+            (1300, 1100): ( 27000,  23000,  50000,  50000),
+            (1300, 1200): ( 27000,  22066,  50000,  50000),
+            (1300,  350): ( 27000,  23000,  50000,  48000),
+            (1300,  400): ( 26072,  23000,  50000,  50000),
+            (1300,  500): ( 27000,  23000,  50000,  50000),
+            (1300,  600): ( 27000,  23000,  50000,  50000),
+            (1300,  700): ( 27000,  23000,  50000,  50000),
+            (1300,  800): ( 27000,  23000,  50000,  50000),
+            (1300,  900): ( 26073,  23000,  50000,  49000),
+            (1400, 1000): ( 27000,  23000,  50000,  50000),
+            (1400, 1100): ( 27000,  23000,  50000,  48000),
+            (1400, 1200): ( 27000,  23000,  50000,  50000),
+            (1400, 1300): ( 27000,  23000,  50000,  48000),
+            (1400,  350): ( 27000,  23000,  50000,  50000),
+            (1400,  400): ( 27000,  23000,  50000,  50000),
+            (1400,  500): ( 27000,  23000,  50000,  50000),
+            (1400,  600): ( 27000,  23000,  50000,  50000),
+            (1400,  700): ( 27000,  22065,  50000,  49000),
+            (1400,  800): ( 27000,  23000,  50000,  50000),
+            (1400,  900): ( 27000,  23000,  50000,  50000),
+            (1500, 1000): ( 27000,  23000,  50000,  50000),
+            (1500, 1100): ( 27000,  23000,  50000,  50000),
+            (1500, 1200): ( 27000,  23000,  50000,  50000),
+            (1500, 1300): ( 27000,  23000,  50000,  48000),
+            (1500, 1400): ( 27000,  23000,  50000,  50000),
+            (1500,  350): ( 27000,  23000,  50000,  50000),
+            (1500,  400): ( 27000,  23000,  50000,  50000),
+            (1500,  500): ( 27000,  23000,  49000,  50000),
+            (1500,  600): ( 27000,  23000,  50000,  50000),
+            (1500,  700): ( 27000,  23000,  50000,  49000),
+            (1500,  800): ( 27000,  23000,      0,  50000),
+            (1500,  900): ( 27000,  23000,  50000,  50000),
+            (1600, 1000): ( 27000,  23000,  50000,  50000),
+            (1600, 1100): ( 27000,  23000,  50000,  50000),
+            (1600, 1200): ( 27000,  23000,  49000,  50000),
+            (1600, 1300): ( 27000,  23000,  50000,  50000),
+            (1600, 1400): ( 27000,  23000,  47000,  50000),
+            (1600, 1500): ( 27000,  23000,  49000,  50000),
+            (1600,  350): ( 27000,  23000,  50000,  50000),
+            (1600,  400): ( 27000,  23000,  50000,  50000),
+            (1600,  500): ( 27000,  23000,  50000,  50000),
+            (1600,  600): ( 27000,  23000,  50000,  50000),
+            (1600,  700): ( 27000,  23000,  50000,      0),
+            (1600,  800): (     0,      0,  50000,  50000),
+            (1600,  900): ( 27000,  23000,  50000,  50000),
+            (1700, 1000): ( 27000,  23000,  50000,  50000),
+            (1700, 1100): ( 27000,  23000,  50000,  50000),
+            (1700, 1200): ( 27000,  23000,  50000,  49000),
+            (1700, 1300): ( 27000,  23000,  50000,  49000),
+            (1700, 1400): ( 27000,  23000,  48000,  50000),
+            (1700, 1500): ( 27000,  23000,  50000,  48000),
+            (1700, 1600): ( 27000,  23000,  49000,  50000),
+            (1700,  350): ( 27000,  23000,  50000,  50000),
+            (1700,  400): ( 27000,  23000,  50000,  49000),
+            (1700,  500): ( 27000,  22066,  49000,  50000),
+            (1700,  600): ( 27000,  23000,  50000,  50000),
+            (1700,  700): ( 27000,  23000,  50000,  50000),
+            (1700,  800): ( 26073,  23000,  50000,  50000),
+            (1700,  900): ( 27000,  23000,  50000,  50000),
+            (1800, 1000): ( 27000,  22068,  50000,  49000),
+            (1800, 1100): ( 27000,  23000,  50000,  50000),
+            (1800, 1200): ( 27000,  23000,  50000,  50000),
+            (1800, 1300): ( 27000,  23000,  49000,  49000),
+            (1800, 1400): ( 27000,  23000,  50000,  50000),
+            (1800, 1500): ( 27000,  23000,  50000,  50000),
+            (1800, 1600): ( 27000,  23000,  50000,  50000),
+            (1800, 1700): ( 27000,  23000,  50000,  50000),
+            (1800,  350): ( 27000,  23000,  50000,  50000),
+            (1800,  400): ( 27000,  23000,  50000,  50000),
+            (1800,  500): ( 27000,  23000,  50000,  49000),
+            (1800,  600): ( 27000,  23000,  49000,  50000),
+            (1800,  700): ( 27000,  23000,  50000,  50000),
+            (1800,  800): ( 27000,  22075,  50000,  50000),
+            (1800,  900): ( 27000,  23000,  50000,  50000),
+            (1900, 1000): ( 27000,  23000,  50000,  50000),
+            (1900, 1100): ( 27000,  23000,  50000,  50000),
+            (1900, 1200): ( 27000,  23000,  50000,  48000),
+            (1900, 1300): ( 27000,  23000,  50000,  50000),
+            (1900, 1400): ( 27000,  22066,  50000,  49000),
+            (1900, 1500): ( 27000,  23000,  48000,  50000),
+            (1900, 1600): ( 27000,  23000,  50000,  50000),
+            (1900, 1700): ( 27000,  23000,  50000,  50000),
+            (1900, 1800): ( 27000,  23000,  50000,  50000),
+            (1900,  350): ( 27000,  23000,  50000,  50000),
+            (1900,  400): ( 27000,  23000,  50000,  50000),
+            (1900,  500): ( 27000,  23000,  50000,  50000),
+            (1900,  600): ( 27000,  23000,  50000,  49000),
+            (1900,  700): ( 27000,  23000,  50000,  50000),
+            (1900,  800): ( 27000,  23000,  50000,  49000),
+            (1900,  900): ( 27000,  22067,  50000,  50000),
+            (2000, 1000): ( 27000,  23000,  48000,  50000),
+            (2000, 1100): ( 27000,  22066,  50000,  50000),
+            (2000, 1200): ( 26999,  23000,  50000,  50000),
+            (2000, 1300): ( 27000,  23000,  50000,  50000),
+            (2000, 1400): ( 27000,  23000,  48000,  50000),
+            (2000, 1500): ( 27000,      0,  50000,  50000),
+            (2000, 1600): ( 27000,  23000,  50000,  50000),
+            (2000, 1700): ( 27000,  22068,  50000,  48000),
+            (2000, 1800): ( 27000,  23000,  49000,  49000),
+            (2000, 1900): ( 27000,  23000,  50000,  50000),
+            (2000,  350): ( 27000,  23000,  48000,  50000),
+            (2000,  400): ( 27000,  23000,  50000,  50000),
+            (2000,  500): ( 27000,  23000,  48000,  50000),
+            (2000,  600): ( 27000,  23000,  50000,  50000),
+            (2000,  700): ( 27000,  23000,  50000,  50000),
+            (2000,  800): ( 27000,  23000,  50000,  50000),
+            (2000,  900): ( 27000,  23000,  50000,  50000),
+            (2100, 1000): ( 27000,  23000,  50000,  50000),
+            (2100, 1100): ( 27000,  23000,  50000,  48000),
+            (2100, 1200): ( 26064,  22065,  50000,  49000),
+            (2100, 1300): ( 26999,  23000,  50000,  50000),
+            (2100, 1400): ( 27000,  22064,  50000,  50000),
+            (2100, 1500): ( 26999,  23000,  50000,  50000),
+            (2100, 1600): ( 27000,  23000,  49000,      0),
+            (2100, 1700): ( 26999,  23000,  50000,  50000),
+            (2100, 1800): ( 26999,  23000,  50000,  50000),
+            (2100, 1900): ( 27000,  23000,  50000,  50000),
+            (2100, 2000): ( 27000,  23000,  50000,  49000),
+            (2100,  350): ( 27000,  23000,  50000,  50000),
+            (2100,  400): ( 27000,  23000,  50000,  50000),
+            (2100,  500): ( 26999,  23000,  50000,  50000),
+            (2100,  600): ( 27000,  23000,  50000,  50000),
+            (2100,  700): ( 27000,  23000,  50000,  50000),
+            (2100,  800): ( 27000,  23000,  50000,  49000),
+            (2100,  900): ( 26074,  23000,  50000,  50000),
+            ( 430,  330): ( 27000,  23000,  50000,  50000),
+            ( 450,  330): ( 27000,  23000,  50000,  48000),
+            ( 450,  350): ( 27000,  23000,  49000,  49000),
+            ( 500,  330): ( 27000,  23000,  50000,  48000),
+            ( 500,  350): ( 27000,  23000,  50000,  49000),
+            ( 500,  370): ( 27000,  23000,  50000,  49000),
+            ( 500,  400): ( 27000,  23000,  50000,  50000),
+            ( 550,  330): ( 27000,  23000,  50000,  49000),
+            ( 550,  350): ( 27000,  23000,  50000,  50000),
+            ( 550,  400): ( 27000,  23000,  48000,  50000),
+            ( 550,  450): ( 27000,  22068,  50000,  50000),
+            ( 600,  330): ( 27000,  23000,  50000,  50000),
+            ( 600,  350): ( 27000,  23000,  50000,  50000),
+            ( 600,  400): ( 26075,  23000,  50000,  48000),
+            ( 600,  450): ( 27000,  23000,  50000,  50000),
+            ( 600,  500): ( 27000,  23000,  48000,  50000),
+            ( 650,  330): ( 27000,  23000,  50000,  50000),
+            ( 650,  350): ( 27000,  23000,  50000,  50000),
+            ( 650,  400): ( 27000,  22067,  50000,  50000),
+            ( 650,  450): ( 27000,  23000,  50000,  48000),
+            ( 650,  500): ( 27000,  23000,  50000,  49000),
+            ( 650,  550): ( 27000,  23000,  50000,  50000),
+            ( 700,  330): ( 27000,  23000,  49000,  50000),
+            ( 700,  350): ( 27000,  23000,  50000,  50000),
+            ( 700,  370): ( 27000,  23000,  50000,  50000),
+            ( 700,  400): ( 27000,  23000,  50000,  50000),
+            ( 700,  450): ( 27000,  23000,  50000,  50000),
+            ( 700,  500): ( 27000,  23000,  50000,  50000),
+            ( 700,  550): ( 27000,  23000,  50000,  49000),
+            ( 700,  600): ( 26074,      0,  50000,  49000),
+            ( 750,  330): ( 27000,  23000,  50000,  50000),
+            ( 750,  350): ( 27000,  23000,  50000,  50000),
+            ( 750,  400): ( 27000,  23000,  50000,  50000),
+            ( 750,  450): ( 27000,  23000,  50000,  49000),
+            ( 750,  500): ( 27000,  23000,  50000,  50000),
+            ( 750,  550): ( 27000,  23000,  50000,  49000),
+            ( 750,  600): ( 27000,  23000,  50000,  49000),
+            ( 750,  650): ( 27000,  23000,  50000,  49000),
+            ( 800,  330): ( 27000,  23000,  50000,  49000),
+            ( 800,  350): ( 27000,  23000,  50000,  50000),
+            ( 800,  400): ( 27000,  23000,  50000,  50000),
+            ( 800,  450): ( 27000,  23000,  50000,  48000),
+            ( 800,  500): ( 27000,  23000,  50000,  50000),
+            ( 800,  550): ( 27000,  22071,  50000,  50000),
+            ( 800,  600): ( 27000,  23000,  50000,  49000),
+            ( 800,  650): ( 27000,  23000,  50000,  50000),
+            ( 800,  700): ( 27000,  23000,  50000,  50000),
+            ( 850,  330): ( 27000,  22072,  50000,  50000),
+            ( 850,  350): ( 27000,  23000,  50000,  50000),
+            ( 850,  400): ( 27000,  22068,  49000,  50000),
+            ( 850,  450): ( 27000,  23000,  50000,  48000),
+            ( 850,  500): ( 27000,  22070,  49000,  50000),
+            ( 850,  550): ( 26073,  23000,  50000,  50000),
+            ( 850,  600): ( 27000,  23000,  48000,  50000),
+            ( 850,  650): ( 27000,  23000,  50000,  50000),
+            ( 850,  700): ( 27000,  23000,  50000,  50000),
+            ( 850,  750): ( 27000,  23000,  49000,  49000),
+            ( 900,  330): ( 27000,  23000,  48000,  49000),
+            ( 900,  350): ( 27000,  23000,  50000,  50000),
+            ( 900,  370): ( 27000,  23000,  50000,  50000),
+            ( 900,  400): ( 26999,  23000,  50000,  50000),
+            ( 900,  450): ( 27000,  23000,  49000,  48000),
+            ( 900,  500): ( 27000,  23000,      0,  50000),
+            ( 900,  550): ( 26074,  23000,  50000,  50000),
+            ( 900,  600): ( 27000,  23000,  50000,  49000),
+            ( 900,  650): ( 27000,  23000,  50000,  49000),
+            ( 900,  700): ( 27000,  23000,  50000,  50000),
+            ( 900,  750): ( 27000,  23000,  50000,  50000),
+            ( 900,  800): ( 27000,  23000,  50000,  50000),
+            ( 950,  330): ( 27000,  23000,  48000,  49000),
+            ( 950,  350): ( 27000,  22062,  50000,  48000),
+            ( 950,  400): ( 27000,  22063,  48000,  50000),
+            ( 950,  450): ( 27000,  23000,  50000,  50000),
+            ( 950,  500): ( 27000,  23000,  49000,  50000),
+            ( 950,  550): ( 27000,  23000,  50000,  50000),
+            ( 950,  600): ( 26075,  23000,  50000,  50000),
+            ( 950,  650): ( 27000,  23000,  50000,  50000),
+            ( 950,  700): ( 27000,  23000,  50000,  50000),
+            ( 950,  750): ( 27000,  23000,  50000,  50000),
+            ( 950,  800): ( 26070,  23000,  50000,  50000),
+            ( 950,  850): ( 27000,  23000,  48000,  49000),
+        },
+    )